@@ -0,0 +1,188 @@
+"""Benchmarks excel_to_rdf, phase by phase, rdf_to_excel and SHACL validation on synthetic vocabularies
+
+Run with pytest-benchmark:
+
+    pytest benchmarks/bench_conversion.py [--bench-sizes 1000,10000,100000] --benchmark-autosave
+
+1.0.0 workbooks are made by vocexcel.synthetic, with SIZE Concepts, each with FANOUT narrower Concepts, and a
+Collection. 0.8.5 and 0.7.0 workbooks are made from the test data workbooks of those versions, keeping their Concept
+Scheme and Prefixes sheets and replacing their Concepts with the same synthetic ones, and a Collection of every FANOUTth
+Concept. The load, extract, assemble, validate and serialize phases of excel_to_rdf are benchmarked separately, as
+well as the whole conversion, and are grouped by template version and size in the results. --benchmark-autosave stores
+the results in .benchmarks/, so later runs can be compared with them to show regressions in any phase:
+
+    pytest benchmarks/bench_conversion.py --benchmark-compare --benchmark-compare-fail=median:10%"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+sys.path.append(str(Path(__file__).parent.parent.absolute()))
+from vocexcel import convert, convert_070, convert_085, convert_100
+from vocexcel.synthetic import make_concepts, make_rdf, make_workbook
+from vocexcel.utils import VocpubValidator, add_top_concepts, load_workbook
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.parent / "tests" / "data"
+# the converter module of each template version benchmarked
+TEMPLATES = {
+    "1.0.0": convert_100,
+    "0.8.5": convert_085,
+    "0.7.0": convert_070,
+}
+# the test data workbook of each older template version, which give Concepts' narrower Concepts, not their broader one
+OLDER_WORKBOOKS = {
+    "0.8.5": "085.xlsx",
+    "0.7.0": "070_simple1.xlsx",
+}
+# vocexcel.synthetic's default number of narrower Concepts per Concept
+FANOUT = 10
+NAMESPACE = "http://example.com/synthetic"
+
+
+def rounds(size: int) -> int:
+    return 3 if size < 10_000 else 1
+
+
+def make_older_workbook(version: str, n: int, path: Path) -> Path:
+    wb = load_workbook(TESTS_DATA_DIR_PATH / OLDER_WORKBOOKS[version])
+    for sheet in ["Concepts", "Collections", "Additional Concept Properties"]:
+        wb[sheet].delete_rows(4, wb[sheet].max_row)
+
+    concepts = make_concepts(NAMESPACE, n, fanout=FANOUT)
+    narrower = defaultdict(list)
+    for c in concepts:
+        if c.broader is not None:
+            narrower[c.broader].append(c.iri)
+    for i, c in enumerate(concepts):
+        row = [
+            c.iri,
+            c.pref_label,
+            c.definition,
+            ",\n".join(c.alt_labels),
+            ",\n".join(narrower[c.iri]),
+        ]
+        for column, value in enumerate(row, start=1):
+            wb["Concepts"].cell(4 + i, column, value or None)
+
+    row = [
+        f"{NAMESPACE}/collection",
+        "Collection",
+        f"Every {FANOUT}th Concept",
+        ",\n".join(c.iri for c in concepts[::FANOUT]),
+    ]
+    for column, value in enumerate(row, start=1):
+        wb["Collections"].cell(4, column, value)
+
+    wb.save(path)
+    return path
+
+
+def extract(version: str, wb) -> Graph:
+    """Extracts the vocabulary from a workbook, as the template version's excel_to_rdf() does"""
+    module = TEMPLATES[version]
+    prefixes = module.extract_prefixes(wb["Prefixes"])
+    g = Graph(bind_namespaces="rdflib")
+    _, cs_iri = module.extract_concept_scheme(
+        wb["Concept Scheme"], prefixes, version, g=g
+    )
+    module.extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
+    module.extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
+    # only 1.0.0 Additional Concept Properties may be relative to the Concept Scheme
+    cs = (cs_iri,) if version == "1.0.0" else ()
+    module.extract_additions_concept_properties(
+        wb["Additional Concept Properties"], prefixes, *cs, g=g
+    )
+    g.bind("cs", cs_iri)
+    return g
+
+
+def copy_graph(g: Graph) -> Graph:
+    c = Graph(bind_namespaces="none")
+    for prefix, namespace in g.namespaces():
+        c.bind(prefix, namespace)
+    c += g
+    return c
+
+
+@pytest.fixture(scope="module", params=list(TEMPLATES))
+def version(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def workbook_file(version, size, synthetic_workbook, tmp_path_factory):
+    if version == "1.0.0":
+        return synthetic_workbook
+    path = tmp_path_factory.mktemp("workbooks") / f"{version}-{size}.xlsx"
+    return make_older_workbook(version, size, path)
+
+
+@pytest.fixture(scope="module")
+def extracted(version, workbook_file):
+    return extract(version, load_workbook(workbook_file))
+
+
+@pytest.fixture(scope="module")
+def assembled(extracted):
+    return add_top_concepts(copy_graph(extracted))
+
+
+def test_load(benchmark, version, size, workbook_file):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    benchmark.pedantic(load_workbook, args=(workbook_file,), rounds=rounds(size))
+
+
+def test_extract(benchmark, version, size, workbook_file):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    wb = load_workbook(workbook_file)
+    g = benchmark.pedantic(extract, args=(version, wb), rounds=rounds(size))
+    assert len(g) > size
+
+
+def test_assemble(benchmark, version, size, extracted):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    benchmark.pedantic(
+        add_top_concepts,
+        setup=lambda: ((copy_graph(extracted),), {}),
+        rounds=rounds(size),
+    )
+
+
+def test_validate(benchmark, version, size, assembled):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    valid, _, _ = benchmark.pedantic(
+        VocpubValidator().validate, args=(assembled,), rounds=rounds(size)
+    )
+    assert valid
+
+
+def test_serialize(benchmark, version, size, assembled):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    benchmark.pedantic(
+        assembled.serialize, kwargs={"format": "longturtle"}, rounds=rounds(size)
+    )
+
+
+def test_excel_to_rdf(benchmark, version, size, workbook_file):
+    benchmark.group = f"excel_to_rdf {version} {size}"
+    benchmark.pedantic(convert.excel_to_rdf, args=(workbook_file,), rounds=rounds(size))
+
+
+@pytest.mark.parametrize("write_only", [False, True], ids=["in-memory", "write-only"])
+def test_rdf_to_excel(benchmark, size, write_only, tmp_path_factory):
+    benchmark.group = f"rdf_to_excel {size}"
+    directory = tmp_path_factory.mktemp("rdf_to_excel")
+    # a GA vocabulary, as only keywords that are IRIs can be exported
+    rdf_file = make_rdf(
+        make_workbook(directory / "vocab.xlsx", concepts=size, ga=True),
+        directory / "vocab.ttl",
+    )
+    benchmark.pedantic(
+        convert.rdf_to_excel,
+        args=(rdf_file, directory / "out.xlsx"),
+        kwargs={"write_only": write_only},
+        rounds=rounds(size),
+    )
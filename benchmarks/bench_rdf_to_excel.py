@@ -0,0 +1,97 @@
+"""Times how convert_100.rdf_to_excel indexes a vocabulary and makes its Concepts rows, and the whole conversion, on
+deep hierarchies. Also times the hierarchy index convert_085.rdf_to_excel lists narrower Concepts from
+
+Run with:
+
+    python benchmarks/bench_rdf_to_excel.py [--sizes SIZE ...] [--end-to-end SIZE ...]
+
+The Concept Scheme metadata is taken from tests/data/100GA.ttl and SIZE Concepts are generated under it, each with
+a skos:broader link and its skos:narrower inverse. The time per Concept should stay roughly constant as the
+hierarchy grows. End-to-end times are dominated by SHACL validation, so are only run for smaller sizes by default."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from rdflib import Graph, Literal
+from rdflib.namespace import RDF, RDFS, SKOS
+
+sys.path.append(str(Path(__file__).parent.parent.absolute()))
+from bench_top_concepts import make_hierarchy
+
+from vocexcel.convert_100 import _concept_rows, rdf_to_excel
+from vocexcel.utils import SubjectIndex, add_top_concepts, hierarchy_index
+
+SIZES = [1_000, 10_000, 50_000]
+END_TO_END_SIZES = [1_000, 5_000]
+CS_SOURCE = Path(__file__).parent.parent / "tests" / "data" / "100GA.ttl"
+
+
+def make_vocab(n: int) -> Graph:
+    g = Graph().parse(CS_SOURCE)
+    cs = g.value(None, RDF.type, SKOS.ConceptScheme)
+    for c in list(g.subjects(RDF.type, SKOS.Concept)):
+        g.remove((c, None, None))
+        g.remove((None, None, c))
+
+    hierarchy = make_hierarchy(n)
+    old_cs = hierarchy.value(None, RDF.type, SKOS.ConceptScheme)
+    for c in hierarchy.subjects(RDF.type, SKOS.Concept):
+        name = str(c).split("/")[-1]
+        g.add((c, SKOS.inScheme, cs))
+        g.add((c, RDFS.isDefinedBy, cs))
+        g.add((c, SKOS.prefLabel, Literal(f"Concept {name}", lang="en")))
+        g.add((c, SKOS.definition, Literal(f"Definition of {name}", lang="en")))
+    for s, p, o in hierarchy:
+        if old_cs not in (s, o):
+            g.add((s, p, o))
+    return add_top_concepts(g)
+
+
+def make_concept_rows(g: Graph) -> int:
+    """Indexes g and makes its Concepts sheet rows, as convert_100.rdf_to_excel does, returning the number of rows"""
+    index = SubjectIndex(g)
+    concepts = sorted(g.subjects(RDF.type, SKOS.Concept))
+    cs_iri = g.value(None, RDF.type, SKOS.ConceptScheme)
+    return sum(1 for _ in _concept_rows(concepts, index, cs_iri, g.namespace_manager))
+
+
+def main(sizes: list[int], end_to_end_sizes: list[int]):
+    print("1.0.0 index and Concepts rows")
+    print(f"{'concepts':>10} {'seconds':>10} {'us/concept':>12}")
+    for n in sizes:
+        g = make_vocab(n)
+        start = time.perf_counter()
+        make_concept_rows(g)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} {elapsed:>10.3f} {elapsed / n * 1e6:>12.2f}")
+
+    print("0.8.5 hierarchy index")
+    print(f"{'concepts':>10} {'seconds':>10} {'us/concept':>12}")
+    for n in sizes:
+        g = make_hierarchy(n)
+        start = time.perf_counter()
+        hierarchy_index(g)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} {elapsed:>10.3f} {elapsed / n * 1e6:>12.2f}")
+
+    print("rdf_to_excel")
+    print(f"{'concepts':>10} {'seconds':>10} {'us/concept':>12}")
+    with TemporaryDirectory() as tmp:
+        for n in end_to_end_sizes:
+            rdf_file = Path(tmp) / f"vocab-{n}.ttl"
+            make_vocab(n).serialize(destination=rdf_file, format="turtle")
+            start = time.perf_counter()
+            rdf_to_excel(rdf_file, output_format="blob")
+            elapsed = time.perf_counter() - start
+            print(f"{n:>10} {elapsed:>10.3f} {elapsed / n * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES)
+    parser.add_argument("--end-to-end", type=int, nargs="*", default=END_TO_END_SIZES)
+    args = parser.parse_args()
+    main(args.sizes, args.end_to_end)
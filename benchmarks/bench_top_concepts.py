@@ -0,0 +1,51 @@
+"""Times utils.add_top_concepts on Concept hierarchies of increasing size
+
+Run with:
+
+    python benchmarks/bench_top_concepts.py [SIZE ...]
+
+The time per Concept should stay roughly constant as the hierarchy grows."""
+
+import sys
+import time
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDF, SKOS
+
+sys.path.append(str(Path(__file__).parent.parent.absolute()))
+from vocexcel.utils import add_top_concepts
+
+SIZES = [1_000, 10_000, 100_000]
+BRANCHING = 10
+
+
+def make_hierarchy(n: int) -> Graph:
+    """A ConceptScheme with n Concepts, each but the first BRANCHING narrower than an earlier one"""
+    g = Graph()
+    cs = URIRef("https://example.com/cs")
+    g.add((cs, RDF.type, SKOS.ConceptScheme))
+    concepts = [URIRef(f"https://example.com/cs/c{i}") for i in range(n)]
+    for i, c in enumerate(concepts):
+        g.add((c, RDF.type, SKOS.Concept))
+        g.add((c, SKOS.inScheme, cs))
+        if i >= BRANCHING:
+            parent = concepts[i // BRANCHING - 1]
+            g.add((parent, SKOS.narrower, c))
+            g.add((c, SKOS.broader, parent))
+    return g
+
+
+def main(sizes: list[int]):
+    print(f"{'concepts':>10} {'seconds':>10} {'us/concept':>12} {'top concepts':>14}")
+    for n in sizes:
+        g = make_hierarchy(n)
+        start = time.perf_counter()
+        add_top_concepts(g)
+        elapsed = time.perf_counter() - start
+        tops = len(set(g.objects(None, SKOS.hasTopConcept)))
+        print(f"{n:>10} {elapsed:>10.3f} {elapsed / n * 1e6:>12.2f} {tops:>14}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,31 @@
+import pytest
+
+from vocexcel.synthetic import make_workbook
+
+SIZES = "1000,10000"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes",
+        default=SIZES,
+        help=f"Comma-separated numbers of Concepts to benchmark conversions with, default {SIZES}",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [int(s) for s in metafunc.config.getoption("bench_sizes").split(",")]
+        metafunc.parametrize("size", sizes, scope="module")
+
+
+@pytest.fixture(scope="module")
+def synthetic_workbook(size, tmp_path_factory):
+    """A 1.0.0 workbook of size synthetic Concepts, each with 10 narrower Concepts, and a Collection of a tenth of them"""
+    path = tmp_path_factory.mktemp("synthetic") / f"{size}.xlsx"
+    return make_workbook(
+        path,
+        concepts=size,
+        collections=1,
+        collection_size=max(1, size // 10),
+    )
@@ -1,8 +1,10 @@
 from pathlib import Path
 
+import openpyxl
 import pytest
 
 from vocexcel import convert
+from vocexcel.utils import ConversionError, sniff_template_version
 
 TEMPLATES_DIR_PATH = Path(__file__).parent.parent.absolute() / "vocexcel/templates"
 TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
@@ -28,3 +30,45 @@ def test_user_specified_versions():
             "You have restricted the allowed template versions to unknown template versions."
             in str(e)
         )
+
+
+def test_template_converters():
+    assert set(convert.TEMPLATE_CONVERTERS) == set(convert.KNOWN_TEMPLATE_VERSIONS)
+
+
+def test_missing_sheet(tmp_path):
+    wb = openpyxl.load_workbook(TESTS_DATA_DIR_PATH / "085.xlsx")
+    del wb["Prefixes"]
+    wb.save(tmp_path / "085.xlsx")
+
+    with pytest.raises(ConversionError) as e:
+        convert.excel_to_rdf(tmp_path / "085.xlsx", output_format="graph")
+    assert "missing the sheet(s) Prefixes" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "file_name,version",
+    [
+        ("030_languages.xlsx", "0.3.0"),
+        ("040_simple.xlsx", "0.4.0"),
+        ("063_simple1.xlsx", "0.6.3"),
+        ("090GA.xlsx", "0.9.0.GA"),
+        ("100.xlsx", "1.0.0"),
+    ],
+)
+def test_sniff_template_version(file_name, version):
+    assert sniff_template_version(TESTS_DATA_DIR_PATH / file_name) == version
+
+    with open(TESTS_DATA_DIR_PATH / file_name, "rb") as f:
+        assert sniff_template_version(f) == version
+        assert f.tell() == 0
+
+
+def test_sniff_template_version_unsupported():
+    with pytest.raises(ConversionError) as e:
+        sniff_template_version(TESTS_DATA_DIR_PATH / "080.xlsx")
+    assert "0.8.0, is not supported" in str(e.value)
+
+    with pytest.raises(ConversionError) as e:
+        sniff_template_version(TESTS_DATA_DIR_PATH / "100GA.ttl")
+    assert "cannot be determined" in str(e.value)
@@ -0,0 +1,159 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from vocexcel import convert
+from vocexcel.cache import ResultCache, SqliteStore
+from vocexcel.profiling import Profile
+from vocexcel.utils import ConversionError, ShaclValidationError
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
+
+
+def test_cached_result(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache")
+    rdf = convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx", cache=cache)
+    assert rdf == convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx")
+    assert len(list(cache.directory.glob("*.json"))) == 1
+
+    # the second conversion doesn't convert anything
+    def fail(*args, **kwargs):
+        raise AssertionError("converted a cached file")
+
+    monkeypatch.setattr(convert, "_workbook_to_rdf", fail)
+    assert convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx", cache=cache) == rdf
+
+    g = convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "100.xlsx", output_format="graph", cache=cache
+    )
+    assert isomorphic(g, Graph().parse(data=rdf, format="turtle"))
+
+    convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "100.xlsx", output_file=tmp_path / "100.ttl", cache=cache
+    )
+    assert (tmp_path / "100.ttl").read_text() == rdf
+
+    # other options aren't cached yet
+    with pytest.raises(AssertionError):
+        convert.excel_to_rdf(
+            TESTS_DATA_DIR_PATH / "100.xlsx",
+            allowed_template_versions=["1.0.0"],
+            cache=cache,
+        )
+
+
+def test_cached_graph(tmp_path):
+    # a graph converted on a cache miss is serialized for the cache, but not parsed back
+    cache = ResultCache(tmp_path)
+    profile = Profile()
+    g = convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "100.xlsx",
+        output_format="graph",
+        cache=cache,
+        profile=profile,
+    )
+    assert [p.name for p in profile.phases][-2:] == ["serialize", "cache store"]
+    assert "parse" not in [p.name for p in profile.phases]
+
+    rdf = convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx", cache=cache)
+    assert rdf == convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx")
+    assert isomorphic(g, Graph().parse(data=rdf, format="turtle"))
+
+
+def test_cached_error(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    with pytest.raises(ConversionError) as e:
+        convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100GA-invalid.xlsx", cache=cache)
+
+    monkeypatch.setattr(convert, "_workbook_to_rdf", None)
+    with pytest.raises(ConversionError) as cached:
+        convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100GA-invalid.xlsx", cache=cache)
+    assert str(cached.value) == str(e.value)
+
+    assert json.loads(
+        convert.excel_to_rdf(
+            TESTS_DATA_DIR_PATH / "100GA-invalid.xlsx", error_format="json", cache=cache
+        )
+    ) == {"error": "ConversionError", "message": str(e.value)}
+
+    results = Graph().parse(data="<http://example.com/a> a <http://example.com/B> .")
+    cache.put("shacl", error=ShaclValidationError("Invalid vocabulary", results))
+    with pytest.raises(ShaclValidationError) as cached:
+        cache.get("shacl")
+    assert str(cached.value) == "Invalid vocabulary"
+    assert isomorphic(cached.value.graph, results)
+
+    # other subclasses can't be raised again as the same class, so aren't cached
+    class OtherError(ConversionError):
+        pass
+
+    cache.put("other", error=OtherError("Other error"))
+    assert cache.get("other") is None
+
+
+def test_cache_cli(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "default"))
+
+    # results are only cached if a cache directory is given
+    convert.main(
+        [str(TESTS_DATA_DIR_PATH / "100.xlsx"), "-o", str(tmp_path / "100.ttl")]
+    )
+    assert not (tmp_path / "default").exists()
+
+    convert.main(
+        [
+            str(TESTS_DATA_DIR_PATH / "100.xlsx"),
+            "-o",
+            str(tmp_path / "100.ttl"),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ]
+    )
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    # and never for RDF to Excel conversions
+    convert.main(
+        [
+            str(TESTS_DATA_DIR_PATH / "100GA.ttl"),
+            "-o",
+            str(tmp_path / "100GA.xlsx"),
+            "--cache-dir",
+            str(tmp_path / "rdf-cache"),
+        ]
+    )
+    assert not (tmp_path / "rdf-cache").exists()
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=120)
+    cache.put("a", "a" * 40)
+    cache.put("b", "b" * 40)
+    os.utime(tmp_path / "a.json", (1, 1))
+    os.utime(tmp_path / "b.json", (2, 2))
+    assert cache.get("a") == "a" * 40
+
+    # b is now the least recently used, so is evicted
+    cache.put("c", "c" * 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 40
+    assert cache.get("c") == "c" * 40
+
+
+def test_sqlite_store(tmp_path):
+    cache = ResultCache(store=SqliteStore(tmp_path / "cache.sqlite3", max_bytes=120))
+    cache.put("a", "a" * 40)
+    cache.put("b", "b" * 40)
+    assert cache.get("a") == "a" * 40
+
+    # b is now the least recently used, so is evicted
+    cache.put("c", "c" * 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 40
+    assert cache.get("c") == "c" * 40
+
+    cache.clear()
+    assert cache.get("a") is None
@@ -0,0 +1,65 @@
+import json
+import shutil
+from pathlib import Path
+
+from vocexcel.convert import convert_directory, main
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
+
+
+def make_directory(tmp_path: Path) -> Path:
+    d = tmp_path / "vocabs"
+    d.mkdir()
+    for f in ["100.xlsx", "100GA-invalid.xlsx", "100GA.ttl"]:
+        shutil.copy(TESTS_DATA_DIR_PATH / f, d)
+    (d / "notes.txt").write_text("not a vocabulary")
+    return d
+
+
+def test_convert_directory(tmp_path, capsys):
+    d = make_directory(tmp_path)
+    finished = []
+    report = convert_directory(d, jobs=2, progress=finished.append)
+
+    # progress is reported as files finish, and nothing is printed
+    assert sorted(finished, key=lambda r: r["input"]) == report
+    assert capsys.readouterr().out == ""
+
+    assert [Path(r["input"]).name for r in report] == [
+        "100.xlsx",
+        "100GA-invalid.xlsx",
+        "100GA.ttl",
+    ]
+    assert [r["status"] for r in report] == ["ok", "error", "ok"]
+    assert report[1]["error"] == "ConversionError"
+    assert report[1]["output"] is None
+    assert (d / "converted" / "100.ttl").is_file()
+    assert (d / "converted" / "100GA.xlsx").is_file()
+    assert not (d / "converted" / "100GA-invalid.ttl").exists()
+
+
+def test_convert_directory_cli(tmp_path, capsys):
+    d = make_directory(tmp_path)
+    out = tmp_path / "out"
+    report_file = tmp_path / "report.json"
+
+    assert (
+        main(
+            [
+                str(d),
+                "-j",
+                "1",
+                "-o",
+                str(out),
+                "--report",
+                str(report_file),
+            ]
+        )
+        == 1
+    )
+    out_text = capsys.readouterr().out
+    assert f"error: {d / '100GA-invalid.xlsx'}" in out_text
+    assert "Converted 2 of 3 files" in out_text
+    report = json.loads(report_file.read_text())
+    assert [r["status"] for r in report] == ["ok", "error", "ok"]
+    assert (out / "100.ttl").is_file()
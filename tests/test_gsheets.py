@@ -0,0 +1,247 @@
+import datetime
+import re
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string
+from openpyxl.utils.datetime import to_excel
+from rdflib import Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import SKOS
+
+from vocexcel import convert, convert_gsheets
+from vocexcel.cache import FileStore, SheetsCache, SqliteStore
+from vocexcel.convert_gsheets import (
+    excel_to_rdf_gsheets,
+    excel_to_rdf_gsheets_many,
+    get_revision_gsheets,
+)
+
+SPREADSHEET_043 = {
+    "Introduction": [[]] * 10 + [[""] * 9 + ["0.4.3"]],
+    "Concept Scheme*": [
+        ["Concept Scheme"],
+        ["Vocabulary IRI*", "http://example.com/vocab"],
+        ["Title*", "Example Vocabulary"],
+        ["Description*", "A vocabulary for testing"],
+        ["Created Date*", "2022-01-01"],
+        ["Modified Date*", "2022-06-01"],
+        ["Creator*", "CGI"],
+        ["Publisher*", "CGI"],
+        ["Version", "1.0"],
+        ["Provenance*", "Made for testing"],
+    ],
+    "Concepts*": [
+        ["Concepts"],
+        ["Concept IRI*", "Preferred Label*"],
+        ["ex:a", "A", "en", "Concept A", "en", "a1, a2", "ex:b"],
+        ["ex:b", "B", "en", "Concept B", "en", "", "", "this vocabulary"],
+    ],
+    "Additional Concept Features": [
+        ["Concept Extras"],
+        ["Concept IRI", "Related Match"],
+        ["ex:a", "http://example.org/other"],
+    ],
+    "Collections": [
+        ["Collections"],
+        ["Collection URI", "Preferred Label"],
+        ["ex:c", "C", "Collection C", "ex:a,\nex:b", "this vocabulary"],
+    ],
+    "Prefix Sheet": [["Prefix", "Namespace"], ["ex", "http://example.com/"]],
+}
+SPREADSHEET_085 = {"Introduction": [[]] * 3 + [[""] * 4 + ["0.8.5"]]}
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
+
+
+def spreadsheet(excel_file: Path) -> dict:
+    """The values of a workbook's sheets, as the Sheets API gives them unformatted"""
+
+    def unformatted(value):
+        if value is None:
+            return ""
+        if isinstance(value, datetime.datetime):
+            return to_excel(value)
+        return value
+
+    wb = load_workbook(excel_file, data_only=True)
+    return {
+        ws.title: [
+            [unformatted(v) for v in row] for row in ws.iter_rows(values_only=True)
+        ]
+        for ws in wb.worksheets
+    }
+
+
+def uri(spreadsheet_id: str) -> str:
+    return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
+
+
+def value_range(sheets: dict, a1: str) -> dict:
+    """The values of a range, e.g. Sheet!A:B or Sheet!B2:B12, leaving out empty trailing rows and cells"""
+    title, cells = a1.rsplit("!", 1)
+    if title not in sheets:
+        raise ValueError(f"Unable to parse range: {a1}")
+
+    def cell(ref, default_row):
+        column, row = re.fullmatch(r"([A-Z]+)(\d*)", ref).groups()
+        row = int(row) - 1 if row else default_row
+        return column_index_from_string(column) - 1, row
+
+    start, _, end = cells.partition(":")
+    (c1, r1), (c2, r2) = cell(start, 0), cell(end or start, None)
+    values = [
+        row[c1 : c2 + 1] for row in sheets[title][r1 : None if r2 is None else r2 + 1]
+    ]
+    values = [
+        row[: max([i + 1 for i, v in enumerate(row) if v] or [0])] for row in values
+    ]
+    while values and not values[-1]:
+        values.pop()
+    result = {"range": a1, "majorDimension": "ROWS"}
+    if values:
+        result["values"] = values
+    return result
+
+
+class FakeRequest:
+    def __init__(self, response: dict):
+        self.response = response
+
+    def execute(self) -> dict:
+        return self.response
+
+
+class FakeSheets:
+    """A fake of the Sheets API's spreadsheets() resource, answering requests from in-memory spreadsheets
+
+    Values are given as they are in the spreadsheets, whatever the requests' render options."""
+
+    def __init__(self, spreadsheets: dict):
+        self.spreadsheets = spreadsheets
+        self.requests = []
+
+    def values(self):
+        return self
+
+    def batchGet(self, spreadsheetId: str, ranges: list[str], **options) -> FakeRequest:
+        self.requests.append((spreadsheetId, ranges))
+        sheets = self.spreadsheets[spreadsheetId]
+        return FakeRequest(
+            {
+                "spreadsheetId": spreadsheetId,
+                "valueRanges": [value_range(sheets, r) for r in ranges],
+            }
+        )
+
+
+def test_excel_to_rdf_gsheets():
+    service = FakeSheets({"vocab": SPREADSHEET_043})
+    g = excel_to_rdf_gsheets(
+        uri("vocab"), "key", None, output_type="graph", service=service
+    )
+
+    # one request for the template version, then one for all the ranges
+    assert len(service.requests) == 2
+    a = URIRef("http://example.com/a")
+    assert (a, SKOS.prefLabel, Literal("A", lang="en")) in g
+    assert (a, SKOS.narrower, URIRef("http://example.com/b")) in g
+    assert (
+        URIRef("http://example.com/c"),
+        SKOS.member,
+        URIRef("http://example.com/b"),
+    ) in g
+
+
+@pytest.mark.parametrize("excel_file", ["100.xlsx", "100GA.xlsx"])
+def test_excel_to_rdf_gsheets_100(excel_file):
+    service = FakeSheets({"vocab": spreadsheet(TESTS_DATA_DIR_PATH / excel_file)})
+    g = excel_to_rdf_gsheets(
+        uri("vocab"), "key", None, output_type="graph", service=service
+    )
+
+    assert len(service.requests) == 2
+    assert isomorphic(
+        g,
+        convert.excel_to_rdf(TESTS_DATA_DIR_PATH / excel_file, output_format="graph"),
+    )
+
+
+def test_excel_to_rdf_gsheets_other_template():
+    service = FakeSheets({"vocab": SPREADSHEET_085})
+    with pytest.raises(ValueError, match="Unknown Template Version"):
+        excel_to_rdf_gsheets(
+            uri("vocab"), "key", None, output_type="graph", service=service
+        )
+
+
+def test_excel_to_rdf_gsheets_many():
+    spreadsheets = {f"vocab{i}": SPREADSHEET_043 for i in range(5)}
+    spreadsheets["other"] = SPREADSHEET_085
+    service = FakeSheets(spreadsheets)
+    uris = [uri(i) for i in spreadsheets]
+
+    results = excel_to_rdf_gsheets_many(
+        uris, "key", output_type="string", max_workers=3, make_service=lambda: service
+    )
+
+    assert list(results) == uris
+    assert isinstance(results[uri("other")], ValueError)
+    assert all("http://example.com/a" in results[uri(f"vocab{i}")] for i in range(5))
+
+
+class FakeFiles:
+    """A fake of the Drive API's files() resource"""
+
+    def get(self, fileId: str, fields: str) -> FakeRequest:
+        return FakeRequest({"version": "7"})
+
+
+@pytest.mark.parametrize("store", [FileStore, SqliteStore])
+def test_excel_to_rdf_gsheets_cache(tmp_path, monkeypatch, store):
+    cache = SheetsCache(store(tmp_path / "cache"))
+    service = FakeSheets({"vocab": SPREADSHEET_043})
+
+    def convert(revision=None, output_type="string"):
+        return excel_to_rdf_gsheets(
+            uri("vocab"),
+            "key",
+            None,
+            output_type=output_type,
+            service=service,
+            cache=cache,
+            revision=revision,
+        )
+
+    revision = get_revision_gsheets("vocab", service=FakeFiles())
+    rdf = convert(revision)
+    assert len(service.requests) == 2
+
+    def fail(*args, **kwargs):
+        raise AssertionError("converted a cached spreadsheet")
+
+    monkeypatch.setattr(convert_gsheets, "extract_concepts", fail)
+
+    # an unchanged revision isn't fetched again
+    assert convert(revision) == rdf
+    assert len(service.requests) == 2
+
+    # nor are unchanged values converted again
+    assert convert("8") == rdf
+    assert convert() == rdf
+    assert len(service.requests) == 6
+    g = convert(output_type="graph")
+    assert (
+        URIRef("http://example.com/a"),
+        SKOS.prefLabel,
+        Literal("A", lang="en"),
+    ) in g
+
+    # changed values are
+    monkeypatch.undo()
+    changed = dict(SPREADSHEET_043)
+    changed["Concept Scheme*"] = list(SPREADSHEET_043["Concept Scheme*"])
+    changed["Concept Scheme*"][2] = ["Title*", "Changed Vocabulary"]
+    service.spreadsheets["vocab"] = changed
+    assert "Changed Vocabulary" in convert("9")
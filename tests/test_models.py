@@ -146,3 +146,74 @@ def test_concept_iri():
                 "http://example.com/working-iri/c/2",
             ],
         )
+
+
+def test_fields_are_valid():
+    concept = ConceptFields(
+        3,
+        uri="https://example.com/thing/x",
+        pref_label="Thing X",
+        definition="Fake def for Thing X",
+        children=["https://example.com/thing/y"],
+    )
+    collection = CollectionFields(
+        10,
+        uri="https://example.com/things",
+        pref_label="Things",
+        definition="Fake def for Things",
+        members=["https://example.com/thing/x"],
+    )
+    assert fields_are_valid([concept], [collection])
+    assert fields_are_valid([], [])
+    assert not fields_are_valid([concept._replace(children=["broken iri"])], [])
+    assert not fields_are_valid([concept._replace(pref_label=None)], [])
+    assert not fields_are_valid([concept._replace(provenance=2020)], [])
+    assert not fields_are_valid([], [collection._replace(members=["ex:x"])])
+
+
+def test_vocabulary_to_graph():
+    cs = ConceptScheme(
+        uri="https://example.com/thing",
+        title="Things",
+        description="Fake def for Things",
+        created="2020-04-02",
+        modified="2020-04-02",
+        creator="GSQ",
+        publisher="GSQ",
+        provenance="Made for testing",
+    )
+    concepts = [
+        ConceptFields(
+            3,
+            uri="https://example.com/thing/x",
+            pref_label="Thing X",
+            definition="Fake def for Thing X",
+            pl_language_code=["en", "de"],
+            children=["https://example.com/thing/y"],
+            close_match=["https://example.com/thing/other"],
+        ),
+        ConceptFields(
+            4,
+            uri="https://example.com/thing/y",
+            pref_label="Thing Y",
+            definition="Fake def for Thing Y",
+            other_ids=["Y"],
+        ),
+    ]
+    collections = [
+        CollectionFields(
+            10,
+            uri="https://example.com/things",
+            pref_label="Things",
+            definition="Fake def for Things",
+            members=["https://example.com/thing/x", "https://example.com/thing/y"],
+        )
+    ]
+
+    # the fields give the same graph as the models made of them
+    expected = Vocabulary(
+        concept_scheme=cs,
+        concepts=[Concept(**c._asdict()) for c in concepts],
+        collections=[Collection(**c._asdict()) for c in collections],
+    ).to_graph()
+    assert vocabulary_to_graph(cs, concepts, collections).isomorphic(expected)
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from vocexcel import convert
+from vocexcel.profiling import Profile, phase
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
+
+
+def test_profile_excel_to_rdf():
+    events = []
+    profile = Profile(callback=lambda name, p: events.append((name, p is None)))
+    g = convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "100.xlsx", output_format="graph", profile=profile
+    )
+
+    phases = {p.name: p for p in profile.phases}
+    assert list(phases) == [
+        "load",
+        "extract Prefixes",
+        "extract Concept Scheme",
+        "extract Concepts",
+        "extract Collections",
+        "extract Additional Concept Properties",
+        "add_top_concepts",
+        "validate",
+    ]
+    assert phases["extract Concepts"].rows == 4
+    assert phases["validate"].triples == len(g)
+    assert all(p.seconds >= 0 for p in profile.phases)
+    assert profile.seconds == sum(p.seconds for p in profile.phases)
+    assert events[:2] == [("load", True), ("load", False)]
+    assert len(events) == 2 * len(profile.phases)
+
+    # phases outside the profile aren't recorded
+    with phase("other"):
+        pass
+    assert "other" not in [p.name for p in profile.phases]
+    assert Profile.from_dict(profile.to_dict()).phases == profile.phases
+
+
+def test_profile_rdf_to_excel(tmp_path):
+    profile = Profile()
+    convert.rdf_to_excel(
+        TESTS_DATA_DIR_PATH / "100GA.ttl",
+        tmp_path / "100GA.xlsx",
+        template_version="1.0.0.GA",
+        write_only=True,
+        profile=profile,
+    )
+
+    phases = {p.name: p for p in profile.phases}
+    assert list(phases) == ["parse", "validate", "index", "load template", "save"]
+    # write-only rows are written as the workbook is saved
+    assert phases["save"].rows > 0
+
+
+def test_profile_cli(tmp_path, capsys):
+    convert.main(
+        [
+            str(TESTS_DATA_DIR_PATH / "085.xlsx"),
+            "-o",
+            str(tmp_path / "085.ttl"),
+            "--profile",
+            "json",
+        ]
+    )
+
+    profile = json.loads(capsys.readouterr().err)
+    assert [p["name"] for p in profile["phases"]][-1] == "serialize"
+    assert profile["seconds"] > 0
@@ -2,11 +2,19 @@ import json
 from pathlib import Path
 
 import pytest
+from openpyxl.styles import PatternFill
 from openpyxl.workbook import Workbook
-from rdflib import SDO, SKOS, Literal, URIRef
+from rdflib import SDO, SKOS, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
 
 from vocexcel.convert import excel_to_rdf, rdf_to_excel
-from vocexcel.utils import STATUSES, ShaclValidationError, load_workbook
+from vocexcel.utils import (
+    STATUSES,
+    CellStyles,
+    ShaclValidationError,
+    load_workbook,
+    xl_hyperlink,
+)
 
 
 def test_basic_085():
@@ -69,6 +77,31 @@ def test_basic_085GA():
     XL_FILE.unlink(missing_ok=True)
 
 
+def test_broader_column_stated_only(tmp_path):
+    # a hierarchy given as skos:narrower, except for one Concept's skos:broader
+    g = Graph().parse(Path(__file__).parent / "data" / "085_rdf.ttl")
+    links = set(g.subject_objects(SKOS.broader))
+    links |= {(o, s) for s, o in g.subject_objects(SKOS.narrower)}
+    g.remove((None, SKOS.broader, None))
+    g.remove((None, SKOS.narrower, None))
+    for child, parent in links:
+        g.add((parent, SKOS.narrower, child))
+    # a Concept with two broaders, so the Additional Concept Properties sheet lists one
+    child = sorted(c for c, _ in links if len({p for s, p in links if s == c}) > 1)[0]
+    stated = {(child, parent) for c, parent in links if c == child}
+    for _, parent in stated:
+        g.add((child, SKOS.broader, parent))
+    RDF_FILE = tmp_path / "narrower.ttl"
+    g.serialize(destination=RDF_FILE, format="turtle")
+
+    rdf_to_excel(RDF_FILE, output_file=tmp_path / "narrower.xlsx")
+
+    wb = load_workbook(tmp_path / "narrower.xlsx")
+    assert len([c for c in wb["Concepts"]["E"][3:] if c.value]) == 1
+    g2 = excel_to_rdf(tmp_path / "narrower.xlsx", output_format="graph")
+    assert set(g2.subject_objects(SKOS.broader)) == stated
+
+
 def test_error_responses(capsys):
     RDF_FILE = Path(__file__).parent / "data" / "085_rdf_invalid.ttl"
     XL_FILE = RDF_FILE.with_suffix(".xlsx")
@@ -126,3 +159,70 @@ def test_return_formats():
     assert XL_FILE.exists()
 
     XL_FILE.unlink(missing_ok=True)
+
+
+def test_cell_styles():
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"].fill = PatternFill("solid", fgColor="FFFF00")
+    ws["A2"].fill = PatternFill("solid", fgColor="FFFF00")
+
+    styles = CellStyles()
+    styles.apply(ws["A1"], "wrapped text")
+    styles.apply(ws["A2"], "wrapped text")
+    styles.apply(ws["B1"], "text")
+    xl_hyperlink(ws["B2"], "https://example.com", styles)
+
+    for cell in ws["A1"], ws["A2"]:
+        assert cell.font.size == 14
+        assert cell.alignment.wrap_text
+        assert cell.fill.fgColor.rgb == "00FFFF00"
+    assert ws["A1"]._style == ws["A2"]._style
+    assert ws["B1"].font.size == 14
+    assert ws["B2"].style == "Hyperlink"
+
+
+@pytest.mark.parametrize("rdf_file", ["100GA.ttl", "085_rdf.ttl", "085GA_rdf.ttl"])
+def test_write_only(tmp_path, rdf_file):
+    RDF_FILE = Path(__file__).parent / "data" / rdf_file
+    XL_FILE = tmp_path / "in-memory.xlsx"
+    XL_FILE_WO = tmp_path / "write-only.xlsx"
+
+    with pytest.raises(ValueError):
+        rdf_to_excel(RDF_FILE, output_format="blob", write_only=True)
+
+    rdf_to_excel(RDF_FILE, output_file=XL_FILE)
+    rdf_to_excel(RDF_FILE, output_file=XL_FILE_WO, write_only=True)
+
+    wb = load_workbook(XL_FILE)
+    wb_wo = load_workbook(XL_FILE_WO)
+    assert wb.sheetnames == wb_wo.sheetnames
+    for ws in wb.worksheets:
+        ws_wo = wb_wo[ws.title]
+        assert ws.max_row == ws_wo.max_row
+        for row, row_wo in zip(ws.iter_rows(), ws_wo.iter_rows()):
+            for cell, cell_wo in zip(row, row_wo):
+                assert cell.value == cell_wo.value
+                assert cell.style == cell_wo.style
+                assert cell.font.size == cell_wo.font.size
+                assert cell.alignment.wrap_text == cell_wo.alignment.wrap_text
+                assert (cell.hyperlink is None) == (cell_wo.hyperlink is None)
+
+    assert wb_wo["Concepts"]["A4"].hyperlink is not None
+
+
+# 085 files have IRIs that need generated prefixes (ns1, ns2, ...), which
+# are only bound while the Concepts sheet rows are made
+@pytest.mark.parametrize("rdf_file", ["085_rdf.ttl", "085GA_rdf.ttl"])
+def test_write_only_round_trip(tmp_path, rdf_file):
+    RDF_FILE = Path(__file__).parent / "data" / rdf_file
+    XL_FILE = tmp_path / "in-memory.xlsx"
+    XL_FILE_WO = tmp_path / "write-only.xlsx"
+
+    rdf_to_excel(RDF_FILE, output_file=XL_FILE)
+    rdf_to_excel(RDF_FILE, output_file=XL_FILE_WO, write_only=True)
+
+    assert isomorphic(
+        excel_to_rdf(XL_FILE_WO, output_format="graph"),
+        excel_to_rdf(XL_FILE, output_format="graph"),
+    )
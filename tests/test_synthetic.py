@@ -0,0 +1,51 @@
+from rdflib import Graph
+from rdflib.namespace import RDF, SKOS
+
+from vocexcel.synthetic import make_rdf, make_workbook
+from vocexcel.utils import load_workbook
+
+
+def concept_rows(path):
+    return list(load_workbook(path)["Concepts"].iter_rows(min_row=4, values_only=True))
+
+
+def test_make_workbook(tmp_path):
+    make_workbook(
+        tmp_path / "vocab.xlsx",
+        concepts=200,
+        depth=3,
+        fanout=4,
+        alt_labels=1.5,
+        multilingual=0.5,
+        collections=2,
+        collection_size=5,
+    )
+    g = Graph().parse(make_rdf(tmp_path / "vocab.xlsx", tmp_path / "vocab.ttl"))
+
+    concepts = set(g.subjects(RDF.type, SKOS.Concept))
+    assert len(concepts) == 200
+    assert len(set(g.subjects(RDF.type, SKOS.Collection))) == 2
+    assert len(list(g.objects(None, SKOS.member))) == 10
+    assert {label.language for label in g.objects(None, SKOS.prefLabel)} > {"en"}
+    assert 250 < len(list(g.objects(None, SKOS.altLabel))) < 350
+
+    def depth(c):
+        broader = g.value(c, SKOS.broader)
+        return 1 if broader is None else 1 + depth(broader)
+
+    assert max(depth(c) for c in concepts) == 3
+    assert max(len(list(g.objects(c, SKOS.narrower))) for c in concepts) == 4
+
+
+def test_make_workbook_ga(tmp_path):
+    make_workbook(tmp_path / "vocab.xlsx", concepts=50, ga=True)
+    g = Graph().parse(make_rdf(tmp_path / "vocab.xlsx", tmp_path / "vocab.ttl"))
+    assert len(set(g.subjects(RDF.type, SKOS.Concept))) == 50
+
+
+def test_seed(tmp_path):
+    for name, seed in [("a", 1), ("b", 1), ("c", 2)]:
+        make_workbook(tmp_path / f"{name}.xlsx", concepts=50, seed=seed)
+
+    assert concept_rows(tmp_path / "a.xlsx") == concept_rows(tmp_path / "b.xlsx")
+    assert concept_rows(tmp_path / "a.xlsx") != concept_rows(tmp_path / "c.xlsx")
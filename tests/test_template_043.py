@@ -50,6 +50,12 @@ def test_exhaustive_template_is_isomorphic():
     assert compare.isomorphic(g1, g2), "Graphs are not Isomorphic"
 
 
+def test_invalid_row():
+    # a row that fails validation is the error, not a later row that can't be read
+    with pytest.raises(ConversionError, match="row 3"):
+        convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "043_prefix_test.xlsx")
+
+
 @pytest.mark.xfail(reason="Incompatible with VocPub 3.1. Failing since 0.6.2.")
 def test_rdf_to_excel():
     TESTS_DATA_DIR_PATH = Path(__file__).parent
@@ -7,11 +7,12 @@ from rdflib.namespace import RDF, SKOS
 
 sys.path.append(str(Path(__file__).parent.parent.absolute() / "vocexcel"))
 from vocexcel.convert_070 import (
+    ConceptRow,
     extract_concept_scheme,
     extract_concepts,
     extract_prefixes,
 )
-from vocexcel.utils import load_workbook
+from vocexcel.utils import load_workbook, read_rows
 
 TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
 
@@ -190,3 +191,17 @@ def test_extract_concepts(get_excel):
 #     """
 #     g2 = Graph().parse(data=expected)
 #     assert compare.isomorphic(g, g2)
+
+
+def test_read_rows(get_excel):
+    rows = list(read_rows(get_excel["Concepts"], ConceptRow))
+    assert len(rows) == 374
+    i, row = rows[0]
+    assert i == 4
+    assert row.iri is not None and row.pref_label is not None
+
+    ro = load_workbook(TESTS_DATA_DIR_PATH / "070_long.xlsx", read_only=True)
+    try:
+        assert list(read_rows(ro["Concepts"], ConceptRow)) == rows
+    finally:
+        ro.close()
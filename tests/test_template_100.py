@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 from rdflib import Literal, URIRef
+from rdflib.compare import isomorphic
 from rdflib.namespace import RDF, SDO, SKOS, XSD
 
 from vocexcel.utils import ConversionError
@@ -130,3 +131,25 @@ def test_100_GA_invalid():
         g = convert.excel_to_rdf(
             TESTS_DATA_DIR_PATH / "100GA-invalid.xlsx", output_format="graph"
         )
+
+
+def test_100_read_only():
+    g = convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100GA.xlsx", output_format="graph")
+    g2 = convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "100GA.xlsx", output_format="graph", read_only=True
+    )
+
+    assert isomorphic(g, g2)
+
+    # templates older than 0.8.5 fall back to loading the full workbook
+    g3 = convert.excel_to_rdf(
+        TESTS_DATA_DIR_PATH / "070_long.xlsx", output_format="graph", read_only=True
+    )
+
+    assert (
+        URIRef(
+            "https://pid.geoscience.gov.au/def/voc/ga/GeomorphologySettings/Mass_Movement_Process"
+        ),
+        RDF.type,
+        SKOS.Concept,
+    ) in g3
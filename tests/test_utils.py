@@ -0,0 +1,75 @@
+import pytest
+from rdflib import URIRef
+
+from vocexcel.utils import (
+    ConversionError,
+    Prefixes,
+    expand_namespaces,
+    make_iri,
+    split_and_tidy_to_strings,
+)
+
+
+@pytest.mark.parametrize(
+    "prefixes",
+    [
+        {
+            "ex:": "http://example.com/",
+            "exx:": "http://example.com/x/",
+            ":": "http://example.com/default/",
+        },
+        # prefixes not ending in their only colon are checked in turn
+        {"ex": "http://example.com/", "exx:": "http://example.com/x/"},
+    ],
+)
+def test_prefixes(prefixes):
+    indexed = Prefixes(prefixes)
+    for s in ["ex:a", "exx:b", ":c", "exx:ex:d", "https://example.com/e", "f", "ex"]:
+        assert expand_namespaces(s, indexed) == expand_namespaces(s, prefixes)
+        for namespace in [None, "http://example.com/cs/"]:
+            try:
+                expected = make_iri(s, prefixes, namespace)
+            except ConversionError:
+                with pytest.raises(ConversionError):
+                    make_iri(s, indexed, namespace)
+            else:
+                assert make_iri(s, indexed, namespace) == expected
+                assert make_iri(s, indexed, namespace) == expected
+
+
+def test_prefixes_changed():
+    prefixes = Prefixes({"ex:": "http://example.com/"})
+    assert make_iri("ex:a", prefixes) == URIRef("http://example.com/a")
+    with pytest.raises(ConversionError):
+        make_iri("other:a", prefixes)
+
+    prefixes["ex:"] = "http://example.com/new/"
+    prefixes["other:"] = "http://example.com/other/"
+    assert make_iri("ex:a", prefixes) == URIRef("http://example.com/new/a")
+    assert make_iri("other:a", prefixes) == URIRef("http://example.com/other/a")
+
+    # a prefix that isn't a CURIE prefix means prefixes are checked in turn
+    prefixes["o"] = "http://example.com/o/"
+    assert make_iri("other:a", prefixes) == URIRef("http://example.com/other/a")
+    assert make_iri("oa", prefixes) == URIRef("http://example.com/o/a")
+
+
+@pytest.mark.parametrize(
+    "s,values",
+    [
+        (None, []),
+        ("", []),
+        (42, ["42"]),
+        ("a", ["a"]),
+        ("a, b ,c", ["a", "b", "c"]),
+        ("a\nb\r\nc", ["a", "b", "c"]),
+        ("a,,b, ,", ["a", "b"]),
+        ('"Smith, J", Bloggs', ["Smith, J", "Bloggs"]),
+        ('"line 1\nline 2"\n"b"', ["line 1\nline 2", "b"]),
+        # quotes that don't enclose a whole value are kept
+        ('He said "hi", ok', ['He said "hi"', "ok"]),
+        ('"unclosed, x', ['"unclosed', "x"]),
+    ],
+)
+def test_split_and_tidy_to_strings(s, values):
+    assert split_and_tidy_to_strings(s) == values
@@ -1,11 +1,17 @@
 import os
+import subprocess
 import sys
 from pathlib import Path
 
 from pyshacl import validate
+from rdflib import Graph
+from rdflib.compare import isomorphic
 
 sys.path.append(str(Path(__file__).parent.parent.absolute() / "vocexcel"))
+import vocexcel
+from vocexcel import utils
 from vocexcel.convert import excel_to_rdf
+from vocexcel.utils import VocpubValidator, get_shapes_graph
 
 TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
 
@@ -40,3 +46,37 @@ def test_validate_071_vocpub_410():
     os.unlink(Path(output_file))
 
     assert c
+
+
+def test_shapes_graph_cached(monkeypatch):
+    sg = get_shapes_graph()
+    assert get_shapes_graph() is sg
+
+    # a cached entry from an older version of the shapes file is replaced
+    mtime, _ = utils._SHAPES_GRAPHS["vocpub-5.1"]
+    monkeypatch.setitem(utils._SHAPES_GRAPHS, "vocpub-5.1", (mtime - 1, sg))
+    assert get_shapes_graph() is not sg
+
+
+def test_vocpub_validator():
+    shapes_file = Path(vocexcel.__file__).parent / "vocpub-5.1.ttl"
+    validator = VocpubValidator()
+    for data_file in ["100GA.ttl", "085_rdf_invalid.ttl"]:
+        g = Graph().parse(TESTS_DATA_DIR_PATH / data_file)
+        expected = validate(g, shacl_graph=str(shapes_file), allow_warnings=True)
+        conforms, results_graph, results_text = validator.validate(g)
+
+        assert conforms == expected[0]
+        assert isomorphic(results_graph, expected[1])
+
+
+def test_lazy_imports():
+    # a fresh interpreter, as this one has already imported everything
+    code = (
+        "import sys; from vocexcel.convert import main; main(['-i']); "
+        "print(sorted(m for m in sys.modules if m.startswith(('pyshacl', 'pydantic', 'vocexcel.convert_'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.splitlines()[-1] == "[]"
@@ -0,0 +1,104 @@
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from vocexcel import convert
+from vocexcel.synthetic import make_workbook
+from vocexcel.web.app import create_app
+
+TESTS_DATA_DIR_PATH = Path(__file__).parent.absolute() / "data"
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(create_app(workers=1, timeout=60)) as client:
+        yield client
+
+
+def post(client, path, file_path, **data):
+    with open(file_path, "rb") as f:
+        return client.post(path, files={"file": (file_path.name, f)}, data=data)
+
+
+def test_excel_to_rdf(client):
+    r = post(client, "/api/v1/excel-to-rdf", TESTS_DATA_DIR_PATH / "100.xlsx")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/turtle")
+    assert isomorphic(
+        Graph().parse(data=r.text, format="turtle"),
+        convert.excel_to_rdf(TESTS_DATA_DIR_PATH / "100.xlsx", output_format="graph"),
+    )
+
+    r = post(client, "/api/v1/excel-to-rdf", TESTS_DATA_DIR_PATH / "100GA.ttl")
+    assert r.status_code == 400
+    assert set(r.json()) == {"error", "message"}
+
+
+def test_rdf_to_excel(client):
+    r = post(
+        client,
+        "/api/v1/rdf-to-excel",
+        TESTS_DATA_DIR_PATH / "100GA.ttl",
+        template_version="1.0.0.GA",
+    )
+    assert r.status_code == 200
+    wb = load_workbook(BytesIO(r.content))
+    assert wb["Concepts"]["A4"].value is not None
+
+    r = post(
+        client, "/api/v1/rdf-to-excel", TESTS_DATA_DIR_PATH / "085_rdf_invalid.ttl"
+    )
+    assert r.status_code == 422
+    assert r.json()["error"] == "RDF Validation Error"
+
+    r = post(client, "/api/v1/rdf-to-excel", TESTS_DATA_DIR_PATH / "100.xlsx")
+    assert r.status_code == 400
+
+
+def test_rdf_to_excel_round_trip(client, tmp_path):
+    # the service exports write-only; 085_rdf.ttl has IRIs that need generated prefixes (ns1, ns2, ...), which must
+    # still reach the Prefixes sheet
+    r = post(client, "/api/v1/rdf-to-excel", TESTS_DATA_DIR_PATH / "085_rdf.ttl")
+    assert r.status_code == 200
+    (tmp_path / "web.xlsx").write_bytes(r.content)
+
+    convert.rdf_to_excel(
+        TESTS_DATA_DIR_PATH / "085_rdf.ttl", output_file=tmp_path / "local.xlsx"
+    )
+    assert isomorphic(
+        convert.excel_to_rdf(tmp_path / "web.xlsx", output_format="graph"),
+        convert.excel_to_rdf(tmp_path / "local.xlsx", output_format="graph"),
+    )
+
+
+def test_limits(tmp_path):
+    # a conversion long enough to time out, and still running when the next request comes
+    excel_file = make_workbook(tmp_path / "large.xlsx", concepts=2000)
+    app = create_app(workers=1, max_pending=1, timeout=0.01, max_upload_bytes=10**6)
+    with TestClient(app) as client:
+        r = post(client, "/api/v1/excel-to-rdf", excel_file)
+        assert r.status_code == 504
+
+        # the timed out conversion keeps its worker busy until it finishes
+        r = post(client, "/api/v1/excel-to-rdf", excel_file)
+        assert r.status_code == 503
+        assert "Retry-After" in r.headers
+
+        for _ in range(600):
+            if client.get("/api/v1/health").json()["pending"] == 0:
+                break
+            time.sleep(0.1)
+        assert client.get("/api/v1/health").json()["pending"] == 0
+
+        large_file = tmp_path / "large.ttl"
+        large_file.write_bytes(b" " * (10**6 + 1))
+        r = post(client, "/api/v1/rdf-to-excel", large_file)
+        assert r.status_code == 413
@@ -0,0 +1,287 @@
+"""On-disk caches of Excel to RDF conversion results
+
+Users often convert the same workbook many times while editing other parts of it. Results are cached by the SHA-256
+of the workbook's bytes, the VocExcel version and the conversion options that change the result, so a repeat
+conversion returns the stored RDF, or raises the stored error, without parsing, validating or serialising anything.
+
+Google Sheets spreadsheets are cached in the same way, by the SHA-256 of their values, and their values are cached by
+their revision, so an unchanged spreadsheet isn't even fetched again.
+
+Caches keep their entries in a store: a directory of files, by default, or a SQLite database."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Iterator, Optional, Protocol
+
+from rdflib import Graph
+
+from vocexcel.settings import get_version
+from vocexcel.utils import ConversionError, ShaclValidationError
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "vocexcel"
+
+
+class Store(Protocol):
+    """Where a cache keeps its entries: strings, by keys that are safe to use as file names"""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def put(self, key: str, value: str): ...
+
+    def clear(self): ...
+
+
+class FileStore:
+    """A directory of entries, one JSON file per key, holding at most max_bytes of them
+
+    Reading an entry updates its modification time and, when the store grows past max_bytes, the least recently used
+    entries are removed. Entries are written to a temporary file and moved into place, so several processes can share
+    a directory."""
+
+    def __init__(
+        self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = (
+            Path(directory) if directory is not None else default_cache_dir()
+        )
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            value = path.read_text()
+            os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def put(self, key: str, value: str):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            f.write(value)
+        os.replace(f.name, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(e[1] for e in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def clear(self):
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class SqliteStore:
+    """A SQLite database of entries, holding at most max_bytes of them
+
+    As for FileStore, reading an entry marks it used and the least recently used entries are removed when the store
+    grows past max_bytes. Each call opens its own connection, so a store can be used from several threads, and SQLite's
+    locking lets several processes share a database."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = (
+            Path(path) if path is not None else default_cache_dir() / "cache.sqlite3"
+        )
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # a connection commits, or rolls back, as its with block ends, but isn't closed
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE entries SET used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key: str, value: str):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, value, len(value.encode()), time.time()),
+            )
+            size = db.execute("SELECT SUM(size) FROM entries").fetchone()[0]
+            for old_key, entry_size in db.execute(
+                "SELECT key, size FROM entries ORDER BY used"
+            ).fetchall():
+                if size <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                size -= entry_size
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM entries")
+
+
+class ResultCache:
+    """Conversion results, by default in a FileStore of the directory holding at most max_bytes of them
+
+    Results are the longturtle serialisation of the vocabulary, or the ConversionError its conversion raised, including
+    the SHACL validation results of a ShaclValidationError."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        store: Optional[Store] = None,
+    ):
+        self.store = store if store is not None else FileStore(directory, max_bytes)
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return getattr(self.store, "directory", None)
+
+    @staticmethod
+    def key(excel_file: Path | BinaryIO, **options) -> str:
+        """Returns the cache key for converting an Excel file with the given options
+
+        File objects are read from their current position and left there."""
+        h = hashlib.sha256()
+        if hasattr(excel_file, "read"):
+            position = excel_file.tell()
+            for chunk in iter(lambda: excel_file.read(1 << 20), b""):
+                h.update(chunk)
+            excel_file.seek(position)
+        else:
+            with open(excel_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        h.update(get_version().encode())
+        h.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the RDF cached for key, or None if there is none, or raises the ConversionError cached for it"""
+        try:
+            entry = json.loads(self.store.get(key) or "")
+        except ValueError:
+            return None
+
+        if "error" not in entry:
+            return entry["rdf"]
+        if entry["error"] == "ShaclValidationError":
+            raise ShaclValidationError(
+                entry["message"], Graph().parse(data=entry["results"], format="turtle")
+            )
+        raise ConversionError(entry["message"])
+
+    def put(
+        self,
+        key: str,
+        rdf: Optional[str] = None,
+        error: Optional[ConversionError] = None,
+    ):
+        """Caches either the RDF or the ConversionError converting the Excel file of key gave
+
+        Only ConversionErrors and ShaclValidationErrors are cached, as other subclasses of ConversionError can't be
+        rebuilt from their message, so couldn't be raised as the same class again."""
+        if error is None:
+            entry = {"rdf": rdf}
+        elif type(error) not in (ConversionError, ShaclValidationError):
+            return
+        else:
+            entry = {"error": type(error).__name__, "message": str(error)}
+            if isinstance(error, ShaclValidationError):
+                entry["results"] = error.graph.serialize(format="turtle")
+        self.store.put(key, json.dumps(entry))
+
+    def clear(self):
+        self.store.clear()
+
+
+class SheetsCache:
+    """Google Sheets spreadsheets' values, by spreadsheet ID and revision, and the results of converting them, by the
+    hash of the values, by default in a FileStore of the gsheets sub-directory of the cache directory
+
+    A revision is anything that changes whenever the spreadsheet does, e.g. its Drive file version. Results are the RDF
+    of the vocabulary, serialised as the conversion options asked for."""
+
+    def __init__(self, store: Optional[Store] = None):
+        self.store = (
+            store if store is not None else FileStore(default_cache_dir() / "gsheets")
+        )
+
+    @staticmethod
+    def _values_key(spreadsheet_id: str, revision: str) -> str:
+        # other versions of VocExcel may fetch other ranges
+        return (
+            "values-"
+            + hashlib.sha256(
+                f"{spreadsheet_id}\n{revision}\n{get_version()}".encode()
+            ).hexdigest()
+        )
+
+    def get_values(self, spreadsheet_id: str, revision: str) -> Optional[list[dict]]:
+        """Returns the value ranges cached for a revision of a spreadsheet, or None if there are none"""
+        values = self.store.get(self._values_key(spreadsheet_id, revision))
+        return json.loads(values) if values is not None else None
+
+    def put_values(self, spreadsheet_id: str, revision: str, value_ranges: list[dict]):
+        self.store.put(
+            self._values_key(spreadsheet_id, revision), json.dumps(value_ranges)
+        )
+
+    @staticmethod
+    def key(value_ranges: list[dict], **options) -> str:
+        """Returns the cache key for converting a spreadsheet with these values with the given options"""
+        h = hashlib.sha256()
+        # only the values, not the ranges they were asked for by, which the API may give differently
+        h.update(json.dumps([v.get("values") for v in value_ranges]).encode())
+        h.update(get_version().encode())
+        h.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the RDF cached for key, or None if there is none"""
+        return self.store.get(key)
+
+    def put(self, key: str, rdf: str):
+        self.store.put(key, rdf)
+
+    def clear(self):
+        self.store.clear()
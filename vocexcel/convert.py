@@ -1,60 +1,35 @@
 import argparse
+import json
+import os
 import sys
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import BinaryIO, Literal, Optional
+from typing import BinaryIO, Callable, Literal, NamedTuple, Optional, Tuple
 from typing import Literal as TypeLiteral
 
 from openpyxl.workbook import Workbook
-from pydantic import ValidationError
+from rdflib import Graph
 
 warnings.simplefilter(action="ignore", category=UserWarning)
 
 THIS_FILE_PATH = Path(__file__)
 sys.path.append(str(THIS_FILE_PATH.parent.parent))
 
-from vocexcel import models
-from vocexcel.convert_021 import (
-    extract_concepts_and_collections as extract_concepts_and_collections_021,
-)
-from vocexcel.convert_030 import (
-    extract_concept_scheme as extract_concept_scheme_030,
-)
-from vocexcel.convert_030 import (
-    extract_concepts_and_collections as extract_concepts_and_collections_030,
-)
-from vocexcel.convert_040 import (
-    extract_concept_scheme as extract_concept_scheme_040,
-)
-from vocexcel.convert_040 import (
-    extract_concepts_and_collections as extract_concepts_and_collections_040,
-)
-from vocexcel.convert_043 import (
-    create_prefix_dict,
-)
-from vocexcel.convert_043 import (
-    extract_concept_scheme as extract_concept_scheme_043,
-)
-from vocexcel.convert_043 import (
-    extract_concepts_and_collections as extract_concepts_and_collections_043,
-)
-from vocexcel.convert_060 import excel_to_rdf as excel_to_rdf_060
-from vocexcel.convert_063 import excel_to_rdf as excel_to_rdf_063
-from vocexcel.convert_070 import excel_to_rdf as excel_to_rdf_070
-from vocexcel.convert_0812 import excel_to_rdf as excel_to_rdf_0812
-from vocexcel.convert_085 import excel_to_rdf as excel_to_rdf_085
-from vocexcel.convert_085 import rdf_to_excel as rdf_to_excel_085
-from vocexcel.convert_100 import excel_to_rdf as excel_to_rdf_100
-from vocexcel.convert_100 import rdf_to_excel as rdf_to_excel_100
+from vocexcel.cache import ResultCache
+from vocexcel.profiling import Profile, phase
 from vocexcel.utils import (
     EXCEL_FILE_ENDINGS,
     KNOWN_FILE_ENDINGS,
     KNOWN_TEMPLATE_VERSIONS,
     RDF_FILE_ENDINGS,
     ConversionError,
+    get_shapes_graph,
     get_template_version,
     load_workbook,
     return_error,
+    sniff_template_version,
 )
 
 TEMPLATE_VERSION = None
@@ -66,6 +41,9 @@ def excel_to_rdf(
     allowed_template_versions=None,
     output_format: Literal["rdf", "graph"] = "rdf",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    read_only: bool = False,
+    cache: Optional[ResultCache] = None,
+    profile: Optional[Profile] = None,
 ):
     """Converts an Excel workbook file to RDF
 
@@ -75,82 +53,197 @@ def excel_to_rdf(
         allowed_template_versions: Optional. User-specified list of allowed template versions. If not given, all versions allowed
         output_format: Optional, default rdf. rdf: return serialized RDF in the turtle format, graph: return an RDFLib Graph object
         error_format: Optional, default python. the kind of errors to return: python is Python, cmd is command line-formatted string, json is stringified JSON
+        read_only: Optional, default False. If set, stream the workbook's sheets row-by-row rather than building them in memory. Only templates 0.8.5 and later are streamed, earlier ones are loaded in full
+        cache: Optional. If given, return the result of converting the same file with the same allowed_template_versions from this cache, if there is one, and cache the result otherwise
+        profile: Optional. If given, record the time, memory use and row and triple counts of each phase of the conversion in this Profile
 
     Returns:
         output_format or an error in one of the error_formats
     """
-    wb = load_workbook(excel_file, error_format)
-    if not isinstance(wb, Workbook):
-        return wb
-
-    actual_template_version = get_template_version(wb, error_format)
-
-    if allowed_template_versions is not None:
-        if not set(allowed_template_versions).issubset(KNOWN_TEMPLATE_VERSIONS):
-            error = ValueError(
-                f"You have restricted the allowed template versions to unknown template versions. Known template versions are {', '.join(KNOWN_TEMPLATE_VERSIONS)}"
-            )
-            return return_error(error, error_format)
-        elif actual_template_version not in allowed_template_versions:
-            error = ValueError(
-                f"You have restricted the allowed template versions to {', '.join(allowed_template_versions)} but supplied a template of version {actual_template_version}"
+    if profile is not None:
+        with profile:
+            return excel_to_rdf(
+                excel_file,
+                output_file,
+                allowed_template_versions,
+                output_format,
+                error_format,
+                read_only,
+                cache,
             )
-            return return_error(error, error_format)
-    elif actual_template_version not in KNOWN_TEMPLATE_VERSIONS:
-        error = ConversionError(
-            f"Unknown template version: {actual_template_version}. Must be one of {', '.join(KNOWN_TEMPLATE_VERSIONS)}"
-        )
-        return return_error(error, error_format)
 
-    if actual_template_version in ["1.0.0", "1.0.0.GA"]:
-        return excel_to_rdf_100(
-            wb, output_file, actual_template_version, output_format, error_format
+    if cache is not None and not isinstance(excel_file, Workbook):
+        return _cached_excel_to_rdf(
+            cache,
+            excel_file,
+            output_file,
+            allowed_template_versions,
+            output_format,
+            error_format,
+            read_only,
         )
 
-    elif actual_template_version in ["0.8.12", "0.9.0", "0.9.0.GA"]:
-        return excel_to_rdf_0812(
-            wb, output_file, actual_template_version, output_format, error_format
-        )
+    with phase("load"):
+        if read_only and not isinstance(excel_file, Workbook):
+            # templates that can't be streamed would be loaded twice, so check the version before loading
+            try:
+                converter = TEMPLATE_CONVERTERS.get(sniff_template_version(excel_file))
+            except ConversionError:
+                converter = None
+            if converter is not None and not converter.streaming:
+                read_only = False
 
-    elif actual_template_version in ["0.8.5", "0.8.5.GA"]:
-        return excel_to_rdf_085(
-            wb, output_file, actual_template_version, output_format, error_format
-        )
+        wb = load_workbook(excel_file, error_format, read_only=read_only)
+    if not isinstance(wb, Workbook):
+        return wb
 
-    elif actual_template_version in ["0.7.1"]:
-        return excel_to_rdf_070(
+    try:
+        return _workbook_to_rdf(
             wb,
+            excel_file,
             output_file,
+            allowed_template_versions,
             output_format,
-            template_version=actual_template_version,
+            error_format,
         )
+    finally:
+        # read-only workbooks hold their file open until closed
+        if wb.read_only and wb is not excel_file:
+            wb.close()
 
-    elif actual_template_version in ["0.7.0"]:
-        return excel_to_rdf_070(
-            wb,
-            output_file,
-            output_format,
-            template_version=actual_template_version,
-        )
 
-    # The way the voc is made - which Excel sheets to use - is dependent on the particular template version
-    elif actual_template_version in ["0.6.2", "0.6.3"]:
-        return excel_to_rdf_063(
-            wb,
-            output_file,
-            "longturtle" if output_format == "rdf" else "graph",
-            template_version=actual_template_version,
-        )
+def _cached_excel_to_rdf(
+    cache: ResultCache,
+    excel_file: Path | BinaryIO,
+    output_file: Optional[Path],
+    allowed_template_versions,
+    output_format: Literal["rdf", "graph"],
+    error_format: TypeLiteral["python", "cmd", "json"],
+    read_only: bool,
+):
+    # the converters return errors, rather than raising them, unless the error format is python
+    try:
+        if output_file is not None and Path(output_file).suffix not in RDF_FILE_ENDINGS:
+            raise ValueError(
+                f"If specifying output_file, it must have a file suffix in {', '.join(RDF_FILE_ENDINGS)}, not {output_file}."
+            )
 
-    elif actual_template_version in ["0.5.0", "0.6.0", "0.6.1"]:
-        return excel_to_rdf_060(
-            wb,
-            output_file,
-            "longturtle" if output_format == "rdf" else "graph",
-        )
+        # the RDF is cached as longturtle whatever the output_format, so that isn't part of the key
+        with phase("cache lookup"):
+            key = cache.key(
+                excel_file,
+                allowed_template_versions=sorted(allowed_template_versions)
+                if allowed_template_versions is not None
+                else None,
+            )
+            rdf = cache.get(key)
+        g = None
+        if rdf is None:
+            # when only the graph is wanted, it is serialized for the cache but not parsed back
+            wants_graph = output_file is None and output_format == "graph"
+            try:
+                result = excel_to_rdf(
+                    excel_file,
+                    allowed_template_versions=allowed_template_versions,
+                    output_format="graph" if wants_graph else "rdf",
+                    read_only=read_only,
+                )
+            except ConversionError as e:
+                with phase("cache store"):
+                    cache.put(key, error=e)
+                raise
+            if wants_graph:
+                g = result
+                with phase("serialize", g):
+                    rdf = g.serialize(format="longturtle")
+            else:
+                rdf = result
+            with phase("cache store"):
+                cache.put(key, rdf)
+    except (ConversionError, ValueError) as e:
+        return return_error(e, error_format)
 
-    elif actual_template_version in ["0.4.3", "0.4.4"]:
-        try:
+    if g is not None:
+        return g
+    elif output_file is not None:
+        Path(output_file).write_bytes(rdf.encode())
+    elif output_format == "graph":
+        g = Graph()
+        with phase("parse", g):
+            return g.parse(data=rdf, format="turtle")
+    else:
+        return rdf
+
+
+class TemplateConverter(NamedTuple):
+    """How workbooks of a template version are converted to RDF
+
+    convert is called as convert(wb, output_file, template_version, output_format, error_format) and imports the
+    version's converter module only when first called. sheets are the worksheets it reads. If streaming, it reads them
+    row-by-row so can be given a read-only workbook; if not, read-only workbooks are reloaded in full for it."""
+
+    convert: Callable
+    sheets: Tuple[str, ...]
+    streaming: bool = False
+
+
+def _excel_to_rdf_100(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_100 import excel_to_rdf
+
+    return excel_to_rdf(wb, output_file, template_version, output_format, error_format)
+
+
+def _excel_to_rdf_0812(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_0812 import excel_to_rdf
+
+    return excel_to_rdf(wb, output_file, template_version, output_format, error_format)
+
+
+def _excel_to_rdf_085(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_085 import excel_to_rdf
+
+    return excel_to_rdf(wb, output_file, template_version, output_format, error_format)
+
+
+def _excel_to_rdf_070(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_070 import excel_to_rdf
+
+    return excel_to_rdf(
+        wb, output_file, output_format, template_version=template_version
+    )
+
+
+def _excel_to_rdf_063(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_063 import excel_to_rdf
+
+    return excel_to_rdf(
+        wb,
+        output_file,
+        "longturtle" if output_format == "rdf" else "graph",
+        template_version=template_version,
+    )
+
+
+def _excel_to_rdf_060(wb, output_file, template_version, output_format, error_format):
+    from vocexcel.convert_060 import excel_to_rdf
+
+    return excel_to_rdf(
+        wb, output_file, "longturtle" if output_format == "rdf" else "graph"
+    )
+
+
+def _excel_to_rdf_043(wb, output_file, template_version, output_format, error_format):
+    from pydantic import ValidationError
+
+    from vocexcel.convert_043 import (
+        create_prefix_dict,
+        extract_concept_scheme,
+        make_concepts_and_collections,
+        read_concepts_and_collections,
+    )
+
+    try:
+        with phase("extract"):
             sheet = wb["Concept Scheme"]
             concept_sheet = wb["Concepts"]
             additional_concept_sheet = wb["Additional Concept Features"]
@@ -158,58 +251,213 @@ def excel_to_rdf(
             prefix_sheet = wb["Prefix Sheet"]
             prefix = create_prefix_dict(prefix_sheet)
 
-            concepts, collections = extract_concepts_and_collections_043(
-                concept_sheet, additional_concept_sheet, collection_sheet, prefix
+            concepts, collections = _read_concepts_and_collections(
+                read_concepts_and_collections(
+                    concept_sheet, additional_concept_sheet, collection_sheet, prefix
+                ),
+                lambda fields: make_concepts_and_collections(
+                    fields, concept_sheet, collection_sheet
+                ),
             )
-            cs = extract_concept_scheme_043(sheet, prefix)
-        except ValidationError as e:
-            raise ConversionError(f"ConceptScheme processing error: {e}")
+            cs = extract_concept_scheme(sheet, prefix)
+    except ValidationError as e:
+        raise ConversionError(f"ConceptScheme processing error: {e}")
 
-    elif actual_template_version == "0.3.0" or actual_template_version == "0.2.1":
-        sheet = wb["vocabulary"]
-        # read from the vocabulary sheet of the workbook unless given a specific sheet
+    return _vocabulary_to_rdf(cs, concepts, collections, output_file, output_format)
 
-        if actual_template_version == "0.2.1":
-            concepts, collections = extract_concepts_and_collections_021(sheet)
-        elif actual_template_version == "0.3.0":
-            concepts, collections = extract_concepts_and_collections_030(sheet)
 
-        try:
-            cs = extract_concept_scheme_030(sheet)
-        except ValidationError as e:
-            raise ConversionError(f"ConceptScheme processing error: {e}")
+def _excel_to_rdf_040(wb, output_file, template_version, output_format, error_format):
+    from pydantic import ValidationError
 
-    elif (
-        actual_template_version == "0.4.0"
-        or actual_template_version == "0.4.1"
-        or actual_template_version == "0.4.2"
-    ):
-        try:
+    from vocexcel.convert_040 import (
+        extract_concept_scheme,
+        make_concepts_and_collections,
+        read_concepts_and_collections,
+    )
+
+    try:
+        with phase("extract"):
             sheet = wb["Concept Scheme"]
             concept_sheet = wb["Concepts"]
             additional_concept_sheet = wb["Additional Concept Features"]
             collection_sheet = wb["Collections"]
 
-            concepts, collections = extract_concepts_and_collections_040(
-                concept_sheet, additional_concept_sheet, collection_sheet
+            concepts, collections = _read_concepts_and_collections(
+                read_concepts_and_collections(
+                    concept_sheet, additional_concept_sheet, collection_sheet
+                ),
+                lambda fields: make_concepts_and_collections(
+                    fields, concept_sheet, collection_sheet
+                ),
             )
-            cs = extract_concept_scheme_040(sheet)
+            cs = extract_concept_scheme(sheet)
+    except ValidationError as e:
+        error = ConversionError(f"ConceptScheme processing error: {e}")
+        return return_error(error, error_format)
+
+    return _vocabulary_to_rdf(cs, concepts, collections, output_file, output_format)
+
+
+def _excel_to_rdf_030(wb, output_file, template_version, output_format, error_format):
+    from pydantic import ValidationError
+
+    from vocexcel.convert_030 import extract_concept_scheme
+
+    if template_version == "0.2.1":
+        from vocexcel.convert_021 import (
+            make_concepts_and_collections,
+            read_concepts_and_collections,
+        )
+    else:
+        from vocexcel.convert_030 import (
+            make_concepts_and_collections,
+            read_concepts_and_collections,
+        )
+
+    # read from the vocabulary sheet of the workbook unless given a specific sheet
+    sheet = wb["vocabulary"]
+    with phase("extract"):
+        concepts, collections = _read_concepts_and_collections(
+            read_concepts_and_collections(sheet), make_concepts_and_collections
+        )
+
+        try:
+            cs = extract_concept_scheme(sheet)
         except ValidationError as e:
-            error = ConversionError(f"ConceptScheme processing error: {e}")
-            return return_error(error, error_format)
+            raise ConversionError(f"ConceptScheme processing error: {e}")
+
+    return _vocabulary_to_rdf(cs, concepts, collections, output_file, output_format)
 
-    # Build the total vocab
-    vocab_graph = models.Vocabulary(
-        concept_scheme=cs, concepts=concepts, collections=collections
-    ).to_graph()
+
+def _read_concepts_and_collections(fields, make):
+    """Returns the Concepts and Collections of templates 0.2.1 to 0.4.4 as the fields of their rows
+
+    Making a pydantic model of each row is most of the time taken to convert these templates, so the fields are only
+    made into models, by make, if they don't pass models.fields_are_valid(). Then the models raise the errors of
+    invalid rows as they always have, and before the error of any later row that can't be read."""
+    from vocexcel import models
+
+    read = []
+    try:
+        for f in fields:
+            read.append(f)
+    except Exception:
+        make(read)
+        raise
+
+    concepts = [f for f in read if isinstance(f, models.ConceptFields)]
+    collections = [f for f in read if isinstance(f, models.CollectionFields)]
+    if not models.fields_are_valid(concepts, collections):
+        return make(read)
+    return concepts, collections
+
+
+def _vocabulary_to_rdf(cs, concepts, collections, output_file, output_format):
+    from vocexcel import models
+
+    # Build the total vocab, adding the Concepts and Collections to the Concept Scheme's graph
+    with phase("assemble"):
+        vocab_graph = models.vocabulary_to_graph(cs, concepts, collections)
 
     if output_file is not None:
-        return vocab_graph.serialize(destination=str(output_file), format="longturtle")
+        with phase("serialize", vocab_graph):
+            return vocab_graph.serialize(
+                destination=str(output_file), format="longturtle"
+            )
     else:  # print to std out
         if output_format == "graph":
             return vocab_graph
         else:
-            return vocab_graph.serialize(format="longturtle")
+            with phase("serialize", vocab_graph):
+                return vocab_graph.serialize(format="longturtle")
+
+
+SHEETS_040 = (
+    "Concept Scheme",
+    "Concepts",
+    "Additional Concept Features",
+    "Collections",
+)
+SHEETS_043 = SHEETS_040 + ("Prefix Sheet",)
+SHEETS_060 = (
+    "Concept Scheme",
+    "Concepts",
+    "Additional Concept Properties",
+    "Collections",
+    "Prefixes",
+)
+SHEETS_100 = SHEETS_060 + ("Lookups",)
+
+# The way the voc is made - which Excel sheets to use - is dependent on the particular template version
+TEMPLATE_CONVERTERS = {
+    "0.2.1": TemplateConverter(_excel_to_rdf_030, ("vocabulary",)),
+    "0.3.0": TemplateConverter(_excel_to_rdf_030, ("vocabulary",)),
+    "0.4.0": TemplateConverter(_excel_to_rdf_040, SHEETS_040),
+    "0.4.1": TemplateConverter(_excel_to_rdf_040, SHEETS_040),
+    "0.4.2": TemplateConverter(_excel_to_rdf_040, SHEETS_040),
+    "0.4.3": TemplateConverter(_excel_to_rdf_043, SHEETS_043),
+    "0.4.4": TemplateConverter(_excel_to_rdf_043, SHEETS_043),
+    "0.5.0": TemplateConverter(_excel_to_rdf_060, SHEETS_060),
+    "0.6.0": TemplateConverter(_excel_to_rdf_060, SHEETS_060),
+    "0.6.2": TemplateConverter(_excel_to_rdf_063, SHEETS_060),
+    "0.6.3": TemplateConverter(_excel_to_rdf_063, SHEETS_060),
+    "0.7.0": TemplateConverter(_excel_to_rdf_070, SHEETS_060),
+    "0.7.1": TemplateConverter(_excel_to_rdf_070, SHEETS_060),
+    "0.8.5": TemplateConverter(_excel_to_rdf_085, SHEETS_060, streaming=True),
+    "0.8.5.GA": TemplateConverter(_excel_to_rdf_085, SHEETS_060, streaming=True),
+    "0.8.12": TemplateConverter(_excel_to_rdf_0812, SHEETS_060, streaming=True),
+    "0.9.0": TemplateConverter(_excel_to_rdf_0812, SHEETS_060, streaming=True),
+    "0.9.0.GA": TemplateConverter(_excel_to_rdf_0812, SHEETS_060, streaming=True),
+    "1.0.0": TemplateConverter(_excel_to_rdf_100, SHEETS_100, streaming=True),
+    "1.0.0.GA": TemplateConverter(_excel_to_rdf_100, SHEETS_100, streaming=True),
+}
+
+
+def _workbook_to_rdf(
+    wb: Workbook,
+    excel_file: Path | BinaryIO,
+    output_file: Optional[Path],
+    allowed_template_versions,
+    output_format: Literal["rdf", "graph"],
+    error_format: TypeLiteral["python", "cmd", "json"],
+):
+    actual_template_version = get_template_version(wb, error_format)
+
+    if allowed_template_versions is not None:
+        if not set(allowed_template_versions).issubset(KNOWN_TEMPLATE_VERSIONS):
+            error = ValueError(
+                f"You have restricted the allowed template versions to unknown template versions. Known template versions are {', '.join(KNOWN_TEMPLATE_VERSIONS)}"
+            )
+            return return_error(error, error_format)
+        elif actual_template_version not in allowed_template_versions:
+            error = ValueError(
+                f"You have restricted the allowed template versions to {', '.join(allowed_template_versions)} but supplied a template of version {actual_template_version}"
+            )
+            return return_error(error, error_format)
+    elif actual_template_version not in KNOWN_TEMPLATE_VERSIONS:
+        error = ConversionError(
+            f"Unknown template version: {actual_template_version}. Must be one of {', '.join(KNOWN_TEMPLATE_VERSIONS)}"
+        )
+        return return_error(error, error_format)
+
+    converter = TEMPLATE_CONVERTERS[actual_template_version]
+
+    missing_sheets = [s for s in converter.sheets if s not in wb.sheetnames]
+    if missing_sheets:
+        error = ConversionError(
+            f"Your template of version {actual_template_version} is missing the sheet(s) {', '.join(missing_sheets)}"
+        )
+        return return_error(error, error_format)
+
+    if wb.read_only and not converter.streaming:
+        if hasattr(excel_file, "seek"):
+            excel_file.seek(0)
+        with phase("load"):
+            wb = load_workbook(excel_file, error_format)
+
+    return converter.convert(
+        wb, output_file, actual_template_version, output_format, error_format
+    )
 
 
 def rdf_to_excel(
@@ -218,6 +466,8 @@ def rdf_to_excel(
     template_version="1.0.0",
     output_format: TypeLiteral["blob", "file"] = "file",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    write_only: bool = False,
+    profile: Optional[Profile] = None,
 ):
     """Converts RDF files to Excel workbooks.
 
@@ -227,19 +477,153 @@ def rdf_to_excel(
         template_version: Optional, default 1.0.0
         output_format: Optional, default file. Whether to return a binary blob (openpyxl Workbook instance) or write results to file.
         error_format: Optional, default python. the kind of errors to return: python is Python, cmd is command line-formatted string, json is stringified JSON
+        write_only: Optional, default False. If set, write the Concepts, Additional Concept Properties and Collections rows to the output file as they are generated, rather than building the whole workbook in memory first. Requires output_format file
+        profile: Optional. As for excel_to_rdf()
 
     Returns:
         output_format or an error in one of the error_formats
     """
+    if profile is not None:
+        with profile:
+            return rdf_to_excel(
+                rdf_file,
+                output_file,
+                template_version,
+                output_format,
+                error_format,
+                write_only,
+            )
+
+    # only the 1.0.0 converter exports to Excel, and it checks the template_version
+    from vocexcel.convert_100 import rdf_to_excel as rdf_to_excel_100
+
     return rdf_to_excel_100(
         rdf_file,
         output_file,
         template_version,
         output_format,
         error_format,
+        write_only,
     )
 
 
+def _warm_up_worker():
+    # parse and compile the SHACL shapes once per worker process rather than for its first file
+    get_shapes_graph()
+
+
+def _convert_file(
+    input_file: Path,
+    output_file: Path,
+    read_only: bool,
+    write_only: bool,
+    cache: Optional[ResultCache] = None,
+    profile: bool = False,
+) -> dict:
+    start = time.perf_counter()
+    result = {"input": str(input_file), "output": str(output_file)}
+    p = Profile() if profile else None
+    try:
+        if input_file.suffix.lower().endswith(tuple(EXCEL_FILE_ENDINGS)):
+            excel_to_rdf(
+                input_file,
+                output_file=output_file,
+                read_only=read_only,
+                cache=cache,
+                profile=p,
+            )
+        else:
+            rdf_to_excel(input_file, output_file, write_only=write_only, profile=p)
+        result["status"] = "ok"
+    except Exception as e:
+        result["status"] = "error"
+        result["output"] = None
+        result.update(json.loads(return_error(e, "json")))
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    if p is not None:
+        result["profile"] = p.to_dict()
+    return result
+
+
+def convert_directory(
+    directory: Path,
+    output_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    read_only: bool = False,
+    write_only: bool = False,
+    cache: Optional[ResultCache] = None,
+    profile: bool = False,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> list[dict]:
+    """Converts each Excel workbook and RDF file in a directory, in parallel
+
+    Excel workbooks are converted to RDF (turtle) files and RDF files to Excel workbooks. Each worker process compiles
+    the SHACL shapes once and then converts files in turn, so the cost of starting Python and importing VocExcel is paid
+    once per worker, not per file.
+
+    Parameters:
+        directory: Required. The directory of files to convert. Sub-directories are not searched
+        output_dir: Optional, default the directory's "converted" sub-directory. Where to write the converted files
+        jobs: Optional, default the number of CPUs. The number of worker processes to use. If 1, files are converted in this process
+        read_only: Optional, default False. As for excel_to_rdf()
+        write_only: Optional, default False. As for rdf_to_excel()
+        cache: Optional. As for excel_to_rdf()
+        profile: Optional, default False. If set, profile each file's conversion and add the Profile.to_dict() of it to
+            the file's report as its "profile"
+        progress: Optional. Called with each file's report as its conversion finishes, in the order they finish
+
+    Returns:
+        A report: a dict per file, in file name order, giving its input path, a status of "ok" or "error", its output
+        path or the error and message, and the conversion time in seconds
+    """
+    if output_dir is None:
+        output_dir = directory / "converted"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    for input_file in sorted(directory.iterdir()):
+        # skip Excel's lock files for open workbooks
+        if not input_file.is_file() or input_file.name.startswith("~$"):
+            continue
+        if input_file.suffix.lower().endswith(tuple(EXCEL_FILE_ENDINGS)):
+            output_file = output_dir / input_file.with_suffix(".ttl").name
+        elif input_file.suffix in RDF_FILE_ENDINGS:
+            output_file = output_dir / input_file.with_suffix(".xlsx").name
+        else:
+            continue
+        tasks.append((input_file, output_file, read_only, write_only, cache, profile))
+
+    if jobs == 1:
+        report = []
+        for task in tasks:
+            result = _convert_file(*task)
+            if progress is not None:
+                progress(result)
+            report.append(result)
+        return report
+
+    report = [None] * len(tasks)
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(), initializer=_warm_up_worker
+    ) as executor:
+        futures = {
+            executor.submit(_convert_file, *task): i for i, task in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            result = report[futures[future]] = future.result()
+            if progress is not None:
+                progress(result)
+    return report
+
+
+def _print_profile(profile: Profile, profile_format: str):
+    # standard out may be the converted RDF
+    if profile_format == "json":
+        print(profile.to_json(), file=sys.stderr)
+    else:
+        print(profile.report(), file=sys.stderr)
+
+
 def main(args=None):
     if args is None:  # vocexcel run via entrypoint
         args = sys.argv[1:]
@@ -264,13 +648,55 @@ def main(args=None):
         "input_file",
         nargs="?",  # allow 0 or 1 file name as argument
         type=Path,
-        help="The Excel file to convert to a SKOS vocabulary in RDF or an RDF file to convert to an Excel file.",
+        help="The Excel file to convert to a SKOS vocabulary in RDF or an RDF file to convert to an Excel file, or a directory of such files to convert.",
     )
 
     parser.add_argument(
         "-o",
         "--outputfile",
-        help="An optionally-provided output file path. If not provided, output from Excel-> RDF is to standard out and RDF->Excel is input file with .xlsx file ending.",
+        help="An optionally-provided output file path. If not provided, output from Excel-> RDF is to standard out and RDF->Excel is input file with .xlsx file ending. When input_file is a directory, the directory to write converted files to, by default its 'converted' sub-directory.",
+        required=False,
+    )
+
+    parser.add_argument(
+        "--read-only",
+        help="Stream the Excel file's sheets row-by-row rather than loading the whole workbook into memory. Reduces memory use for large workbooks of template 0.8.5 and later.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--write-only",
+        help="Write the Excel file's Concepts, Additional Concept Properties and Collections rows as they are generated rather than building the whole workbook in memory. Reduces memory use when converting large vocabularies to Excel.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="A directory to cache the results of Excel to RDF conversions in, so that converting an unchanged Excel file again returns the cached result. Results aren't cached unless this is given.",
+        type=Path,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--profile",
+        help="Print the time, peak memory use and row and triple counts of each phase of the conversion to standard error, as a table or, if json is given, as JSON. When input_file is a directory, each file's profile is also added to the report.",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="When input_file is a directory, the number of files to convert in parallel. Defaults to the number of CPUs.",
+        type=int,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--report",
+        help="When input_file is a directory, a file to write a JSON report of each file's conversion to.",
+        type=Path,
         required=False,
     )
 
@@ -290,6 +716,34 @@ def main(args=None):
         print(
             f"Known template versions: {', '.join(sorted(KNOWN_TEMPLATE_VERSIONS, reverse=True))}"
         )
+    elif args.input_file is not None and args.input_file.is_dir():
+        print(f"Processing directory {args.input_file}")
+        report = convert_directory(
+            args.input_file,
+            output_dir=Path(args.outputfile) if args.outputfile else None,
+            jobs=args.jobs,
+            read_only=args.read_only,
+            write_only=args.write_only,
+            cache=ResultCache(args.cache_dir) if args.cache_dir else None,
+            profile=args.profile is not None,
+            progress=lambda r: print(f"{r['status']}: {r['input']}"),
+        )
+        if args.profile == "json":
+            profiles = [{"input": r["input"], **r["profile"]} for r in report]
+            print(json.dumps(profiles, indent=2), file=sys.stderr)
+        elif args.profile == "table":
+            for r in report:
+                print(r["input"], file=sys.stderr)
+                _print_profile(Profile.from_dict(r["profile"]), args.profile)
+        failed = [r for r in report if r["status"] != "ok"]
+        for r in failed:
+            print(f"ERROR: {r['input']}: {r['error']}")
+            print(r["message"])
+        print(f"Converted {len(report) - len(failed)} of {len(report)} files")
+        if args.report is not None:
+            args.report.write_text(json.dumps(report, indent=2))
+        if failed:
+            return 1
     elif args.input_file:
         if not args.input_file.suffix.lower().endswith(tuple(KNOWN_FILE_ENDINGS)):
             error = ValueError(
@@ -300,21 +754,38 @@ def main(args=None):
             return return_error(error, "cmd")
 
         print(f"Processing file {args.input_file}")
+        profile = Profile() if args.profile is not None else None
 
         # input file looks like an Excel file, so convert Excel -> RDF
         if args.input_file.suffix.lower().endswith(tuple(EXCEL_FILE_ENDINGS)):
             try:
                 o = excel_to_rdf(
-                    args.input_file, output_file=args.outputfile, output_format="rdf"
+                    args.input_file,
+                    output_file=args.outputfile,
+                    output_format="rdf",
+                    read_only=args.read_only,
+                    cache=ResultCache(args.cache_dir) if args.cache_dir else None,
+                    profile=profile,
                 )
                 if args.outputfile is None:
                     print(o)
             except Exception as e:
                 return return_error(e, "cmd")
+            finally:
+                if profile is not None:
+                    _print_profile(profile, args.profile)
 
         # RDF file ending, so convert RDF -> Excel
         else:
-            rdf_to_excel(args.input_file, args.outputfile, error_format="cmd")
+            rdf_to_excel(
+                args.input_file,
+                args.outputfile,
+                error_format="cmd",
+                write_only=args.write_only,
+                profile=profile,
+            )
+            if profile is not None:
+                _print_profile(profile, args.profile)
 
             if args.outputfile is None:
                 print(f"Converted result at {args.input_file.with_suffix('.xlsx')}")
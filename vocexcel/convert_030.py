@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import ValidationError
@@ -7,72 +7,76 @@ from vocexcel import models
 from vocexcel.utils import ConversionError, split_and_tidy_to_strings
 
 
-def extract_concepts_and_collections(
+def read_concepts_and_collections(
     s: Worksheet,
-) -> Tuple[List[models.Concept], List[models.Collection]]:
-    concepts = []
-    collections = []
+) -> Iterator[models.ConceptFields | models.CollectionFields]:
     process_concept = False
     process_collection = False
-    for col in s.iter_cols(max_col=1):
-        for cell in col:
-            row = cell.row
-            if cell.value == "Concept URI":
-                process_concept = True
-            elif cell.value == "Collection URI":
-                process_concept = False
-                process_collection = True
-            elif process_concept:
-                if cell.value is None:
-                    pass
-                else:
-                    try:
-                        c = models.Concept(
-                            uri=s[f"A{row}"].value,
-                            pref_label=s[f"B{row}"].value,
-                            pl_language_code=split_and_tidy_to_strings(
-                                s[f"C{row}"].value
-                            ),  # new in 0.3.0
-                            alt_labels=split_and_tidy_to_strings(s[f"D{row}"].value),
-                            definition=s[f"E{row}"].value,
-                            def_language_code=split_and_tidy_to_strings(
-                                s[f"F{row}"].value
-                            ),  # new in 0.3.0
-                            children=split_and_tidy_to_strings(s[f"G{row}"].value),
-                            other_ids=split_and_tidy_to_strings(s[f"H{row}"].value),
-                            home_vocab_uri=s[f"I{row}"].value,
-                            provenance=s[f"J{row}"].value,
-                            template_version="0.3.0",
-                        )
+    for row, values in enumerate(s.iter_rows(max_col=10, values_only=True), start=1):
+        value = values[0]
+        if value == "Concept URI":
+            process_concept = True
+        elif value == "Collection URI":
+            process_concept = False
+            process_collection = True
+        elif process_concept:
+            if value is not None:
+                yield models.ConceptFields(
+                    row,
+                    uri=values[0],
+                    pref_label=values[1],
+                    # new in 0.3.0
+                    pl_language_code=split_and_tidy_to_strings(values[2]),
+                    alt_labels=split_and_tidy_to_strings(values[3]),
+                    definition=values[4],
+                    # new in 0.3.0
+                    def_language_code=split_and_tidy_to_strings(values[5]),
+                    children=split_and_tidy_to_strings(values[6]),
+                    other_ids=split_and_tidy_to_strings(values[7]),
+                    home_vocab_uri=values[8],
+                    provenance=values[9],
+                )
+        elif process_collection:
+            if value is not None:
+                yield models.CollectionFields(
+                    row,
+                    uri=values[0],
+                    pref_label=values[1],
+                    definition=values[2],
+                    members=split_and_tidy_to_strings(values[3]),
+                    provenance=values[4],
+                )
 
-                        concepts.append(c)
-                    except ValidationError as e:
-                        raise ConversionError(
-                            f"Concept processing error likely at row {row}, and has error: {e}"
-                        )
-            elif process_collection:
-                if cell.value is None:
-                    pass
-                else:
-                    try:
-                        c = models.Collection(
-                            uri=s[f"A{row}"].value,
-                            pref_label=s[f"B{row}"].value,
-                            definition=s[f"C{row}"].value,
-                            members=split_and_tidy_to_strings(s[f"D{row}"].value),
-                            provenance=s[f"E{row}"].value,
-                        )
-                        collections.append(c)
-                    except ValidationError as e:
-                        raise ConversionError(
-                            f"Collection processing error, likely at row {row}, error: {e}"
-                        )
-            elif cell.value is None:
-                pass
 
+def make_concepts_and_collections(
+    fields: Iterable[models.ConceptFields | models.CollectionFields],
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    concepts = []
+    collections = []
+    for f in fields:
+        if isinstance(f, models.ConceptFields):
+            try:
+                concepts.append(models.Concept(**f._asdict()))
+            except ValidationError as e:
+                raise ConversionError(
+                    f"Concept processing error likely at row {f.row}, and has error: {e}"
+                )
+        else:
+            try:
+                collections.append(models.Collection(**f._asdict()))
+            except ValidationError as e:
+                raise ConversionError(
+                    f"Collection processing error, likely at row {f.row}, error: {e}"
+                )
     return concepts, collections
 
 
+def extract_concepts_and_collections(
+    s: Worksheet,
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    return make_concepts_and_collections(read_concepts_and_collections(s))
+
+
 def extract_concept_scheme(sheet: Worksheet):
     cs = models.ConceptScheme(
         uri=sheet["B1"].value,
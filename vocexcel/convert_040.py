@@ -1,5 +1,5 @@
 import datetime
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import ValidationError
@@ -8,74 +8,89 @@ from vocexcel import models
 from vocexcel.utils import ConversionError, split_and_tidy_to_strings
 
 
-# this is a new function to iterate over the collection sheet in template version 0.4.0
-def extract_concepts_and_collections(
+def read_concepts_and_collections(
     q: Worksheet, r: Worksheet, s: Worksheet
-) -> Tuple[List[models.Concept], List[models.Collection]]:
-    concepts = []
-    collections = []
+) -> Iterator[models.ConceptFields | models.CollectionFields]:
+    # the additional concept features of each row of the concept page
+    features = list(r.iter_rows(min_col=2, max_col=6, values_only=True))
+    no_features = (None,) * 5
     # Iterating over the concept page and the additional concept page
-    for col in q.iter_cols(max_col=1):
-        for cell in col:
-            row = cell.row
-            if (
-                cell.value is None
-                or cell.value == "Concepts"
-                or cell.value == "Concept IRI*"
-            ):
-                pass
-            else:
-                try:
-                    c = models.Concept(
-                        uri=q[f"A{row}"].value,
-                        pref_label=q[f"B{row}"].value,
-                        pl_language_code=split_and_tidy_to_strings(q[f"C{row}"].value),
-                        definition=q[f"D{row}"].value,
-                        def_language_code=split_and_tidy_to_strings(q[f"E{row}"].value),
-                        alt_labels=split_and_tidy_to_strings(q[f"F{row}"].value),
-                        children=split_and_tidy_to_strings(q[f"G{row}"].value),
-                        provenance=q[f"H{row}"].value,
-                        home_vocab_uri=q[f"I{row}"].value,
-                        # additional concept features sheets
-                        related_match=split_and_tidy_to_strings(r[f"B{row}"].value),
-                        close_match=split_and_tidy_to_strings(r[f"C{row}"].value),
-                        exact_match=split_and_tidy_to_strings(r[f"D{row}"].value),
-                        narrow_match=split_and_tidy_to_strings(r[f"E{row}"].value),
-                        broad_match=split_and_tidy_to_strings(r[f"F{row}"].value),
-                    )
-                    concepts.append(c)
-                except ValidationError as e:
-                    raise ConversionError(
-                        f"Concept processing error, likely at sheet {q}, row {row}, and with error: {e}"
-                    )
+    for row, values in enumerate(q.iter_rows(max_col=9, values_only=True), start=1):
+        if values[0] is None or values[0] == "Concepts" or values[0] == "Concept IRI*":
+            pass
+        else:
+            extra = features[row - 1] if row <= len(features) else no_features
+            yield models.ConceptFields(
+                row,
+                uri=values[0],
+                pref_label=values[1],
+                pl_language_code=split_and_tidy_to_strings(values[2]),
+                definition=values[3],
+                def_language_code=split_and_tidy_to_strings(values[4]),
+                alt_labels=split_and_tidy_to_strings(values[5]),
+                children=split_and_tidy_to_strings(values[6]),
+                provenance=values[7],
+                home_vocab_uri=values[8],
+                # additional concept features sheets
+                related_match=split_and_tidy_to_strings(extra[0]),
+                close_match=split_and_tidy_to_strings(extra[1]),
+                exact_match=split_and_tidy_to_strings(extra[2]),
+                narrow_match=split_and_tidy_to_strings(extra[3]),
+                broad_match=split_and_tidy_to_strings(extra[4]),
+            )
 
     # iterating over the collections page
-    for col in s.iter_cols(max_col=1):
-        for cell in col:
-            row = cell.row
-            if (
-                cell.value is None
-                or cell.value == "Collections"
-                or cell.value == "Collection URI"
-            ):
-                pass
-            else:
-                try:
-                    c = models.Collection(
-                        uri=s[f"A{row}"].value,
-                        pref_label=s[f"B{row}"].value,
-                        definition=s[f"C{row}"].value,
-                        members=split_and_tidy_to_strings(s[f"D{row}"].value),
-                        provenance=s[f"E{row}"].value,
-                    )
-                    collections.append(c)
-                except ValidationError as e:
-                    raise ConversionError(
-                        f"Collection processing error, likely at sheet {s}, column {col}, row {row}, error: {e}"
-                    )
+    for row, values in enumerate(s.iter_rows(max_col=5, values_only=True), start=1):
+        if (
+            values[0] is None
+            or values[0] == "Collections"
+            or values[0] == "Collection URI"
+        ):
+            pass
+        else:
+            yield models.CollectionFields(
+                row,
+                uri=values[0],
+                pref_label=values[1],
+                definition=values[2],
+                members=split_and_tidy_to_strings(values[3]),
+                provenance=values[4],
+            )
+
+
+def make_concepts_and_collections(
+    fields: Iterable[models.ConceptFields | models.CollectionFields],
+    q: Worksheet,
+    s: Worksheet,
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    concepts = []
+    collections = []
+    for f in fields:
+        if isinstance(f, models.ConceptFields):
+            try:
+                concepts.append(models.Concept(**f._asdict()))
+            except ValidationError as e:
+                raise ConversionError(
+                    f"Concept processing error, likely at sheet {q}, row {f.row}, and with error: {e}"
+                )
+        else:
+            try:
+                collections.append(models.Collection(**f._asdict()))
+            except ValidationError as e:
+                col = next(s.iter_cols(max_col=1))
+                raise ConversionError(
+                    f"Collection processing error, likely at sheet {s}, column {col}, row {f.row}, error: {e}"
+                )
     return concepts, collections
 
 
+# this is a new function to iterate over the collection sheet in template version 0.4.0
+def extract_concepts_and_collections(
+    q: Worksheet, r: Worksheet, s: Worksheet
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    return make_concepts_and_collections(read_concepts_and_collections(q, r, s), q, s)
+
+
 def extract_concept_scheme(sheet: Worksheet):
     cs = models.ConceptScheme(
         uri=sheet["B2"].value,
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from dateutil import parser
 from openpyxl.worksheet.worksheet import Worksheet
@@ -133,114 +133,109 @@ def using_prefix_and_namespace(cell_value, prefix, s: Worksheet, row):
     return variables
 
 
-# template version 0.4.3 using prefixes
-def extract_concepts_and_collections(
+def read_concepts_and_collections(
     q: Worksheet, r: Worksheet, s: Worksheet, prefix
-) -> Tuple[List[models.Concept], List[models.Collection]]:
-    concepts = []
-    collections = []
+) -> Iterator[models.ConceptFields | models.CollectionFields]:
+    # the additional concept features of each row of the concept page
+    features = list(r.iter_rows(min_col=2, max_col=6, values_only=True))
+    no_features = (None,) * 5
     # Iterating over the concept page and the additional concept page
-    for col in q.iter_cols(max_col=1):
-        for cell in col:
-            row = cell.row
-            if (
-                cell.value is None
-                or cell.value == "Concepts"
-                or cell.value == "Concept IRI*"
-            ):
-                pass
-            else:
-                try:
-                    c = models.Concept(
-                        uri=using_prefix_and_namespace_non_list_output(
-                            q[f"A{row}"].value, prefix, q, row
-                        ),
-                        pref_label=q[f"B{row}"].value,
-                        pl_language_code=split_and_tidy_to_strings(q[f"C{row}"].value),
-                        definition=q[f"D{row}"].value,
-                        def_language_code=split_and_tidy_to_strings(q[f"E{row}"].value),
-                        alt_labels=split_and_tidy_to_strings(q[f"F{row}"].value),
-                        children=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(q[f"G{row}"].value),
-                            prefix,
-                            q,
-                            row,
-                        ),
-                        provenance=q[f"H{row}"].value,
-                        # Note in the new template, home_vocab_uri is synonymous with source vocab uri
-                        home_vocab_uri=using_prefix_and_namespace_non_list_output(
-                            q[f"I{row}"].value, prefix, q, row
-                        ),
-                        # additional concept features sheets
-                        related_match=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(r[f"B{row}"].value),
-                            prefix,
-                            r,
-                            row,
-                        ),
-                        close_match=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(r[f"C{row}"].value),
-                            prefix,
-                            r,
-                            row,
-                        ),
-                        exact_match=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(r[f"D{row}"].value),
-                            prefix,
-                            r,
-                            row,
-                        ),
-                        narrow_match=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(r[f"E{row}"].value),
-                            prefix,
-                            r,
-                            row,
-                        ),
-                        broad_match=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(r[f"F{row}"].value),
-                            prefix,
-                            r,
-                            row,
-                        ),
-                    )
-                    concepts.append(c)
-                except ValidationError as e:
-                    raise ConversionError(
-                        f"Concept processing error likely at sheet {q}, row {row}, and has error: {e}"
-                    )
+    for row, values in enumerate(q.iter_rows(max_col=9, values_only=True), start=1):
+        if values[0] is None or values[0] == "Concepts" or values[0] == "Concept IRI*":
+            pass
+        else:
+            extra = features[row - 1] if row <= len(features) else no_features
+            yield models.ConceptFields(
+                row,
+                uri=using_prefix_and_namespace_non_list_output(
+                    values[0], prefix, q, row
+                ),
+                pref_label=values[1],
+                pl_language_code=split_and_tidy_to_strings(values[2]),
+                definition=values[3],
+                def_language_code=split_and_tidy_to_strings(values[4]),
+                alt_labels=split_and_tidy_to_strings(values[5]),
+                children=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(values[6]), prefix, q, row
+                ),
+                provenance=values[7],
+                # Note in the new template, home_vocab_uri is synonymous with source vocab uri
+                home_vocab_uri=using_prefix_and_namespace_non_list_output(
+                    values[8], prefix, q, row
+                ),
+                # additional concept features sheets
+                related_match=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(extra[0]), prefix, r, row
+                ),
+                close_match=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(extra[1]), prefix, r, row
+                ),
+                exact_match=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(extra[2]), prefix, r, row
+                ),
+                narrow_match=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(extra[3]), prefix, r, row
+                ),
+                broad_match=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(extra[4]), prefix, r, row
+                ),
+            )
 
     # iterating over the collections page
-    for col in s.iter_cols(max_col=1):
-        for cell in col:
-            row = cell.row
-            if (
-                cell.value is None
-                or cell.value == "Collections"
-                or cell.value == "Collection URI"
-            ):
-                pass
-            else:
-                try:
-                    c = models.Collection(
-                        uri=using_prefix_and_namespace_cs(s[f"A{row}"].value, prefix),
-                        pref_label=s[f"B{row}"].value,
-                        definition=s[f"C{row}"].value,
-                        members=using_prefix_and_namespace(
-                            split_and_tidy_to_strings(s[f"D{row}"].value),
-                            prefix,
-                            s,
-                            row,
-                        ),
-                        provenance=s[f"E{row}"].value,
-                    )
-                    collections.append(c)
-                except ValidationError as e:
-                    raise ConversionError(
-                        f"Collection processing error, likely at sheet {s}, row {row}, and has error: {e}"
-                    )
+    for row, values in enumerate(s.iter_rows(max_col=5, values_only=True), start=1):
+        if (
+            values[0] is None
+            or values[0] == "Collections"
+            or values[0] == "Collection URI"
+        ):
+            pass
+        else:
+            yield models.CollectionFields(
+                row,
+                uri=using_prefix_and_namespace_cs(values[0], prefix),
+                pref_label=values[1],
+                definition=values[2],
+                members=using_prefix_and_namespace(
+                    split_and_tidy_to_strings(values[3]), prefix, s, row
+                ),
+                provenance=values[4],
+            )
+
+
+def make_concepts_and_collections(
+    fields: Iterable[models.ConceptFields | models.CollectionFields],
+    q: Worksheet,
+    s: Worksheet,
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    concepts = []
+    collections = []
+    for f in fields:
+        if isinstance(f, models.ConceptFields):
+            try:
+                concepts.append(models.Concept(**f._asdict()))
+            except ValidationError as e:
+                raise ConversionError(
+                    f"Concept processing error likely at sheet {q}, row {f.row}, and has error: {e}"
+                )
+        else:
+            try:
+                collections.append(models.Collection(**f._asdict()))
+            except ValidationError as e:
+                raise ConversionError(
+                    f"Collection processing error, likely at sheet {s}, row {f.row}, and has error: {e}"
+                )
     return concepts, collections
 
 
+# template version 0.4.3 using prefixes
+def extract_concepts_and_collections(
+    q: Worksheet, r: Worksheet, s: Worksheet, prefix
+) -> Tuple[List[models.Concept], List[models.Collection]]:
+    return make_concepts_and_collections(
+        read_concepts_and_collections(q, r, s, prefix), q, s
+    )
+
+
 def extract_concept_scheme(sheet: Worksheet, prefix):
     cs = models.ConceptScheme(
         uri=using_prefix_and_namespace_cs(sheet["B2"].value, prefix),
@@ -1,43 +1,77 @@
 from pathlib import Path
 from typing import Literal as TypeLiteral
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, SKOS, XSD
 
+from vocexcel.profiling import phase
 from vocexcel.utils import (
     ConversionError,
+    Prefixes,
     bind_namespaces,
     expand_namespaces,
     id_from_iri,
+    iter_split_and_tidy_to_iris,
+    iter_split_and_tidy_to_strings,
     make_agent,
     make_iri,
-    split_and_tidy_to_iris,
-    split_and_tidy_to_strings,
+    read_rows,
     string_is_http_iri,
     validate_with_profile,
 )
 
 
-def extract_prefixes(sheet: Worksheet) -> dict[str, Namespace]:
-    prefixes = {}
-    i = 3
-    while True:
-        pre = sheet[f"A{i}"].value
-        if pre is None:
-            break
-        else:
-            proper_pre = str(pre) if str(pre).endswith(":") else str(pre) + ":"
-            prefixes[proper_pre] = sheet[f"B{i}"].value
+class PrefixRow(NamedTuple):
+    prefix: str | None
+    namespace: str | None
+
+
+class ConceptRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    alt_labels: str | None
+    narrower: str | None
+    provenance: str | None
+    source: str | None
+    home: str | None
+
 
-        i += 1
+class CollectionRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    members: str | None
+    provenance: str | None
+
+
+class AdditionalConceptPropertiesRow(NamedTuple):
+    iri: str | None
+    related_match: str | None
+    close_match: str | None
+    exact_match: str | None
+    narrow_match: str | None
+    broad_match: str | None
+    notation: str | None
+    notation_type: str | None
+
+
+def extract_prefixes(sheet: Worksheet) -> dict[str, Namespace]:
+    prefixes = Prefixes()
+    for _, row in read_rows(sheet, PrefixRow, min_row=3):
+        pre = str(row.prefix)
+        proper_pre = pre if pre.endswith(":") else pre + ":"
+        prefixes[proper_pre] = row.namespace
 
     return prefixes
 
 
-def extract_concept_scheme(sheet: Worksheet, prefixes) -> Graph:
+def extract_concept_scheme(
+    sheet: Worksheet, prefixes, g: Optional[Graph] = None
+) -> Graph:
     iri_s = sheet["B3"].value
     title = sheet["B4"].value
     description = sheet["B5"].value
@@ -91,7 +125,8 @@ def extract_concept_scheme(sheet: Worksheet, prefixes) -> Graph:
             "Your vocabulary has no provenance statement. Please add it to the Concept Scheme sheet"
         )
 
-    g = Graph(bind_namespaces="rdflib")
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
     g.add((iri, RDF.type, SKOS.ConceptScheme))
     g.add((iri, SKOS.prefLabel, Literal(title, lang="en")))
     g.add((iri, SKOS.definition, Literal(description, lang="en")))
@@ -118,41 +153,31 @@ def extract_concept_scheme(sheet: Worksheet, prefixes) -> Graph:
     return g, iri
 
 
-def extract_concepts(sheet: Worksheet, prefixes, cs_iri) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        alt_labels = sheet[f"D{i}"].value
-        narrower = sheet[f"E{i}"].value
-        provenance = sheet[f"F{i}"].value
-        source = sheet[f"G{i}"].value
-        home = sheet[f"H{i}"].value
-
+def extract_concepts(
+    sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, ConceptRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = expand_namespaces(iri_s, prefixes)
+        iri = expand_namespaces(row.iri, prefixes)
         iri_conv = string_is_http_iri(str(iri))
         if not iri_conv[0]:
             raise ConversionError(iri_conv[1])
 
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Concept {iri_s}"
+                f"You must provide a Preferred Label for Concept {row.iri}"
             )
 
-        if definition is None:
-            raise ConversionError(f"You must provide a Definition for Concept {iri_s}")
-
-        i += 1
+        if row.definition is None:
+            raise ConversionError(
+                f"You must provide a Definition for Concept {row.iri}"
+            )
 
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/earth-science",
             "http://example.com/atmospheric-science",
             "http://example.com/geology",
@@ -162,141 +187,118 @@ def extract_concepts(sheet: Worksheet, prefixes, cs_iri) -> Graph:
         # create Graph
         g.add((iri, RDF.type, SKOS.Concept))
         g.add((iri, SKOS.inScheme, cs_iri))
-        g.add((iri, SKOS.prefLabel, Literal(pref_label.strip(), lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition.strip(), lang="en")))
+        g.add((iri, SKOS.prefLabel, Literal(row.pref_label.strip(), lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition.strip(), lang="en")))
 
-        if alt_labels is not None:
-            for al in split_and_tidy_to_strings(alt_labels):
+        if row.alt_labels is not None:
+            for al in iter_split_and_tidy_to_strings(row.alt_labels):
                 g.add((iri, SKOS.altLabel, Literal(al, lang="en")))
 
-        if narrower is not None:
-            for n in split_and_tidy_to_iris(narrower, prefixes):
+        if row.narrower is not None:
+            for n in iter_split_and_tidy_to_iris(row.narrower, prefixes):
                 g.add((iri, SKOS.narrower, n))
 
-        if provenance is not None:
-            g.add((iri, DCTERMS.provenance, Literal(provenance.strip())))
+        if row.provenance is not None:
+            g.add((iri, DCTERMS.provenance, Literal(row.provenance.strip())))
 
-        if source is not None:
-            g.add((iri, DCTERMS.source, Literal(source.strip(), datatype=XSD.anyURI)))
+        if row.source is not None:
+            g.add(
+                (iri, DCTERMS.source, Literal(row.source.strip(), datatype=XSD.anyURI))
+            )
 
-        if home is not None:
-            g.add((iri, RDFS.isDefinedBy, URIRef(home.strip())))
+        if row.home is not None:
+            g.add((iri, RDFS.isDefinedBy, URIRef(row.home.strip())))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
-def extract_collections(sheet: Worksheet, prefixes, cs_iri) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        members = sheet[f"D{i}"].value
-        provenance = sheet[f"E{i}"].value
-
+def extract_collections(
+    sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, CollectionRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = expand_namespaces(iri_s, prefixes)
+        iri = expand_namespaces(row.iri, prefixes)
         iri_conv = string_is_http_iri(str(iri))
         if not iri_conv[0]:
             raise ConversionError(iri_conv[1])
 
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Collection {iri_s}"
+                f"You must provide a Preferred Label for Collection {row.iri}"
             )
 
-        if definition is None:
+        if row.definition is None:
             raise ConversionError(
-                f"You must provide a Definition for Collection {iri_s}"
+                f"You must provide a Definition for Collection {row.iri}"
             )
 
         # create Graph
         g.add((iri, RDF.type, SKOS.Collection))
         g.add((iri, SKOS.inScheme, cs_iri))
-        g.add((iri, SKOS.prefLabel, Literal(pref_label, lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition, lang="en")))
+        g.add((iri, SKOS.prefLabel, Literal(row.pref_label, lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition, lang="en")))
 
-        if members is not None:
-            for n in split_and_tidy_to_iris(members, prefixes):
+        if row.members is not None:
+            for n in iter_split_and_tidy_to_iris(row.members, prefixes):
                 g.add((iri, SKOS.member, n))
 
-        if provenance is not None:
-            g.add((iri, DCTERMS.provenance, Literal(provenance.strip())))
-
-        i += 1
+        if row.provenance is not None:
+            g.add((iri, DCTERMS.provenance, Literal(row.provenance.strip())))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
-def extract_additions_concept_properties(sheet: Worksheet, prefixes) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        related_s = sheet[f"B{i}"].value
-        close_s = sheet[f"C{i}"].value
-        exact_s = sheet[f"D{i}"].value
-        narrow_s = sheet[f"E{i}"].value
-        broad_s = sheet[f"F{i}"].value
-        notation_s = sheet[f"G{i}"].value
-        notation_type_s = sheet[f"H{i}"].value
-
-        # check values
-        if iri_s is None:
-            break
-
-        i += 1
-
+def extract_additions_concept_properties(
+    sheet: Worksheet, prefixes, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, AdditionalConceptPropertiesRow):
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/geology",
         ]:
             continue
 
         # create Graph
-        iri = make_iri(iri_s, prefixes)
-        if related_s is not None:
-            related = make_iri(related_s, prefixes)
+        iri = make_iri(row.iri, prefixes)
+        if row.related_match is not None:
+            related = make_iri(row.related_match, prefixes)
             g.add((iri, SKOS.relatedMatch, related))
 
-        if close_s is not None:
-            close = make_iri(close_s, prefixes)
+        if row.close_match is not None:
+            close = make_iri(row.close_match, prefixes)
             g.add((iri, SKOS.closeMatch, close))
 
-        if exact_s is not None:
-            exact = make_iri(exact_s, prefixes)
+        if row.exact_match is not None:
+            exact = make_iri(row.exact_match, prefixes)
             g.add((iri, SKOS.exactMatch, exact))
 
-        if narrow_s is not None:
-            narrow = make_iri(narrow_s, prefixes)
+        if row.narrow_match is not None:
+            narrow = make_iri(row.narrow_match, prefixes)
             g.add((iri, SKOS.narrowMatch, narrow))
 
-        if broad_s is not None:
-            broad = make_iri(broad_s, prefixes)
+        if row.broad_match is not None:
+            broad = make_iri(row.broad_match, prefixes)
             g.add((iri, SKOS.broadMatch, broad))
 
-        if notation_s is not None:
-            if notation_type_s is not None:
-                notation_type = make_iri(notation_type_s, prefixes)
+        if row.notation is not None:
+            if row.notation_type is not None:
+                notation_type = make_iri(row.notation_type, prefixes)
             else:
                 notation_type = XSD.token
             g.add(
                 (
                     iri,
                     SKOS.notation,
-                    Literal(notation_s, datatype=notation_type),
+                    Literal(row.notation, datatype=notation_type),
                 )
             )
 
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -312,29 +314,36 @@ def excel_to_rdf(
     message_level=1,
     log_file: Optional[Path] = None,
 ):
-    prefixes = extract_prefixes(wb["Prefixes"])
-    cs, cs_iri = extract_concept_scheme(wb["Concept Scheme"], prefixes)
-    cons = extract_concepts(wb["Concepts"], prefixes, cs_iri)
-    cols = extract_collections(wb["Collections"], prefixes, cs_iri)
-    extra = extract_additions_concept_properties(
-        wb["Additional Concept Properties"], prefixes
-    )
-
-    g = cs + cons + cols + extra
+    with phase("extract Prefixes"):
+        prefixes = extract_prefixes(wb["Prefixes"])
+    g = Graph(bind_namespaces="rdflib")
+    with phase("extract Concept Scheme", g):
+        _, cs_iri = extract_concept_scheme(wb["Concept Scheme"], prefixes, g=g)
+    with phase("extract Concepts", g):
+        extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
+    with phase("extract Collections", g):
+        extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
+    with phase("extract Additional Concept Properties", g):
+        extract_additions_concept_properties(
+            wb["Additional Concept Properties"], prefixes, g=g
+        )
 
     if validate:
-        validate_with_profile(
-            g,
-            profile=profile,
-            error_level=error_level,
-            message_level=message_level,
-            log_file=log_file,
-        )
+        with phase("validate", g):
+            validate_with_profile(
+                g,
+                profile=profile,
+                error_level=error_level,
+                message_level=message_level,
+                log_file=log_file,
+            )
 
     if output_file_path is not None:
-        g.serialize(destination=str(output_file_path), format=output_format)
+        with phase("serialize", g):
+            g.serialize(destination=str(output_file_path), format=output_format)
     else:  # print to std out
         if output_format == "graph":
             return g
         else:
-            return g.serialize(format=output_format)
+            with phase("serialize", g):
+                return g.serialize(format=output_format)
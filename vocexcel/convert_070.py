@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import Literal as TypeLiteral
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -9,15 +9,20 @@ from rdflib.namespace import OWL, PROV, RDF, RDFS, SDO, SKOS, XSD
 
 REG = Namespace("http://purl.org/linked-data/registry#")
 
+from vocexcel.profiling import phase
 from vocexcel.utils import (
     STATUSES,
     VOCDERMODS,
     ConversionError,
+    Prefixes,
     add_top_concepts,
     bind_namespaces,
     expand_namespaces,
+    iter_split_and_tidy_to_iris,
+    iter_split_and_tidy_to_strings,
     make_agent,
     make_iri,
+    read_rows,
     split_and_tidy_to_iris,
     split_and_tidy_to_strings,
     string_is_http_iri,
@@ -25,25 +30,55 @@ from vocexcel.utils import (
 )
 
 
-def extract_prefixes(sheet: Worksheet) -> dict[str, Namespace]:
-    prefixes = {}
-    i = 3
-    while True:
-        ns = sheet[f"B{i}"].value
-        if ns is None:
-            break
-        else:
-            pre = sheet[f"A{i}"].value
-            proper_pre = str(pre).strip(":") + ":" if pre is not None else ":"
-            prefixes[proper_pre] = sheet[f"B{i}"].value
+class PrefixRow(NamedTuple):
+    prefix: str | None
+    namespace: str | None
+
+
+class ConceptRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    alt_labels: str | None
+    narrower: str | None
+    history_note: str | None
+    source: str | None
+    home: str | None
+
 
-        i += 1
+class CollectionRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    members: str | None
+    history_note: str | None
+
+
+class AdditionalConceptPropertiesRow(NamedTuple):
+    iri: str | None
+    related_match: str | None
+    close_match: str | None
+    exact_match: str | None
+    narrow_match: str | None
+    broad_match: str | None
+    notation: str | None
+    notation_type: str | None
+
+
+def extract_prefixes(sheet: Worksheet) -> dict[str, Namespace]:
+    prefixes = Prefixes()
+    for _, row in read_rows(sheet, PrefixRow, min_row=3, key="namespace"):
+        proper_pre = str(row.prefix).strip(":") + ":" if row.prefix is not None else ":"
+        prefixes[proper_pre] = row.namespace
 
     return prefixes
 
 
 def extract_concept_scheme(
-    sheet: Worksheet, prefixes, template_version="0.7.0"
+    sheet: Worksheet,
+    prefixes,
+    template_version="0.7.0",
+    g: Optional[Graph] = None,
 ) -> tuple[Graph, str]:
     iri_s = sheet["B3"].value
     title = sheet["B4"].value
@@ -132,7 +167,8 @@ def extract_concept_scheme(
 
         derived_from = make_iri(derived_from, prefixes)
 
-    g = Graph(bind_namespaces="rdflib")
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
     g.add((iri, RDF.type, SKOS.ConceptScheme))
     g.add((iri, SKOS.prefLabel, Literal(title, lang="en")))
     g.add((iri, SKOS.definition, Literal(description, lang="en")))
@@ -145,7 +181,7 @@ def extract_concept_scheme(
     g += make_agent(publisher, SDO.publisher, prefixes, iri)
 
     if custodian is not None:
-        for _custodian in split_and_tidy_to_strings(custodian):
+        for _custodian in iter_split_and_tidy_to_strings(custodian):
             ISOROLES = Namespace("https://linked.data.gov.au/def/data-roles/")
             g += make_agent(_custodian, ISOROLES.custodian, prefixes, iri)
             g.bind("isoroles", ISOROLES)
@@ -176,38 +212,28 @@ def extract_concept_scheme(
     return g, iri
 
 
-def extract_concepts(sheet: Worksheet, prefixes, cs_iri) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        alt_labels = sheet[f"D{i}"].value
-        narrower = sheet[f"E{i}"].value
-        history_note = sheet[f"F{i}"].value
-        source = sheet[f"G{i}"].value
-        home = sheet[f"H{i}"].value
-
+def extract_concepts(
+    sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, ConceptRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = make_iri(iri_s, prefixes)
+        iri = make_iri(row.iri, prefixes)
 
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Concept {iri_s}"
+                f"You must provide a Preferred Label for Concept {row.iri}"
             )
 
-        if definition is None:
-            raise ConversionError(f"You must provide a Definition for Concept {iri_s}")
-
-        i += 1
+        if row.definition is None:
+            raise ConversionError(
+                f"You must provide a Definition for Concept {row.iri}"
+            )
 
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/earth-science",
             "http://example.com/atmospheric-science",
             "http://example.com/geology",
@@ -219,66 +245,58 @@ def extract_concepts(sheet: Worksheet, prefixes, cs_iri) -> Graph:
         g.add((iri, SKOS.inScheme, cs_iri))
         if str(iri).startswith(str(cs_iri)):
             g.add((iri, RDFS.isDefinedBy, cs_iri))
-        if "@" in pref_label:
-            val, lang = pref_label.strip().split("@")
+        if "@" in row.pref_label:
+            val, lang = row.pref_label.strip().split("@")
             g.add((iri, SKOS.prefLabel, Literal(val, lang=lang)))
         else:
-            g.add((iri, SKOS.prefLabel, Literal(pref_label.strip(), lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition.strip(), lang="en")))
+            g.add((iri, SKOS.prefLabel, Literal(row.pref_label.strip(), lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition.strip(), lang="en")))
 
-        if alt_labels is not None:
-            for al in split_and_tidy_to_strings(alt_labels):
+        if row.alt_labels is not None:
+            for al in iter_split_and_tidy_to_strings(row.alt_labels):
                 g.add((iri, SKOS.altLabel, Literal(al, lang="en")))
 
-        if narrower is not None:
-            for n in split_and_tidy_to_iris(narrower, prefixes):
+        if row.narrower is not None:
+            for n in iter_split_and_tidy_to_iris(row.narrower, prefixes):
                 g.add((iri, SKOS.narrower, n))
                 g.add((n, SKOS.broader, iri))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-        if source is not None:
-            for _source in split_and_tidy_to_strings(source):
+        if row.source is not None:
+            for _source in iter_split_and_tidy_to_strings(row.source):
                 g.add(
                     (iri, SDO.citation, Literal(_source.strip(), datatype=XSD.anyURI))
                 )
 
-        if home is not None:
-            g.add((iri, RDFS.isDefinedBy, URIRef(home.strip())))
+        if row.home is not None:
+            g.add((iri, RDFS.isDefinedBy, URIRef(row.home.strip())))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
-def extract_collections(sheet: Worksheet, prefixes, cs_iri) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        members = sheet[f"D{i}"].value
-        history_note = sheet[f"E{i}"].value
-
+def extract_collections(
+    sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, CollectionRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = expand_namespaces(iri_s, prefixes)
+        iri = expand_namespaces(row.iri, prefixes)
         iri_conv = string_is_http_iri(str(iri))
         if not iri_conv[0]:
             raise ConversionError(iri_conv[1])
 
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Collection {iri_s}"
+                f"You must provide a Preferred Label for Collection {row.iri}"
             )
 
-        if definition is None:
+        if row.definition is None:
             raise ConversionError(
-                f"You must provide a Definition for Collection {iri_s}"
+                f"You must provide a Definition for Collection {row.iri}"
             )
 
         # create Graph
@@ -287,75 +305,59 @@ def extract_collections(sheet: Worksheet, prefixes, cs_iri) -> Graph:
         g.add((iri, RDFS.isDefinedBy, cs_iri))
         if str(iri).startswith(str(cs_iri)):
             g.add((iri, RDFS.isDefinedBy, cs_iri))
-        g.add((iri, SKOS.prefLabel, Literal(pref_label, lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition, lang="en")))
+        g.add((iri, SKOS.prefLabel, Literal(row.pref_label, lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition, lang="en")))
 
-        if members is not None:
-            for n in split_and_tidy_to_iris(members, prefixes):
+        if row.members is not None:
+            for n in iter_split_and_tidy_to_iris(row.members, prefixes):
                 g.add((iri, SKOS.member, n))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-        i += 1
-
-    bind_namespaces(g, prefixes)
     return g
 
 
-def extract_additions_concept_properties(sheet: Worksheet, prefixes) -> Graph:
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        related_s = sheet[f"B{i}"].value
-        close_s = sheet[f"C{i}"].value
-        exact_s = sheet[f"D{i}"].value
-        narrow_s = sheet[f"E{i}"].value
-        broad_s = sheet[f"F{i}"].value
-        notation_s = sheet[f"G{i}"].value
-        notation_type_s = sheet[f"H{i}"].value
-
-        # check values
-        if iri_s is None:
-            break
-
-        i += 1
-
+def extract_additions_concept_properties(
+    sheet: Worksheet, prefixes, g: Optional[Graph] = None
+) -> Graph:
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, AdditionalConceptPropertiesRow):
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/geology",
         ]:
             continue
 
         # create Graph
-        iri = make_iri(iri_s, prefixes)
+        iri = make_iri(row.iri, prefixes)
 
-        if related_s is not None:
-            related = make_iri(related_s, prefixes)
+        if row.related_match is not None:
+            related = make_iri(row.related_match, prefixes)
             g.add((iri, SKOS.relatedMatch, related))
 
-        if close_s is not None:
-            close = make_iri(close_s, prefixes)
+        if row.close_match is not None:
+            close = make_iri(row.close_match, prefixes)
             g.add((iri, SKOS.closeMatch, close))
 
-        if exact_s is not None:
-            exact = make_iri(exact_s, prefixes)
+        if row.exact_match is not None:
+            exact = make_iri(row.exact_match, prefixes)
             g.add((iri, SKOS.exactMatch, exact))
 
-        if narrow_s is not None:
-            narrow = make_iri(narrow_s, prefixes)
+        if row.narrow_match is not None:
+            narrow = make_iri(row.narrow_match, prefixes)
             g.add((iri, SKOS.narrowMatch, narrow))
 
-        if broad_s is not None:
-            broad = make_iri(broad_s, prefixes)
+        if row.broad_match is not None:
+            broad = make_iri(row.broad_match, prefixes)
             g.add((iri, SKOS.broadMatch, broad))
 
-        if notation_s is not None:
-            notations = split_and_tidy_to_strings(notation_s)
-            if notation_type_s is not None:
-                notation_types = split_and_tidy_to_iris(notation_type_s, prefixes)
+        if row.notation is not None:
+            notations = split_and_tidy_to_strings(row.notation)
+            if row.notation_type is not None:
+                notation_types = split_and_tidy_to_iris(row.notation_type, prefixes)
             else:
                 notation_types = [XSD.token for x in notations]
 
@@ -368,7 +370,6 @@ def extract_additions_concept_properties(sheet: Worksheet, prefixes) -> Graph:
                     )
                 )
 
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -383,34 +384,43 @@ def excel_to_rdf(
     log_file: Optional[Path] = None,
     template_version="0.6.3",
 ):
-    prefixes = extract_prefixes(wb["Prefixes"])
-    cs, cs_iri = extract_concept_scheme(
-        wb["Concept Scheme"], prefixes, template_version
-    )
-    cons = extract_concepts(wb["Concepts"], prefixes, cs_iri)
-    cols = extract_collections(wb["Collections"], prefixes, cs_iri)
-    extra = extract_additions_concept_properties(
-        wb["Additional Concept Properties"], prefixes
-    )
-
-    g = cs + cons + cols + extra
-    g = add_top_concepts(g)
+    with phase("extract Prefixes"):
+        prefixes = extract_prefixes(wb["Prefixes"])
+    g = Graph(bind_namespaces="rdflib")
+    with phase("extract Concept Scheme", g):
+        _, cs_iri = extract_concept_scheme(
+            wb["Concept Scheme"], prefixes, template_version, g=g
+        )
+    with phase("extract Concepts", g):
+        extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
+    with phase("extract Collections", g):
+        extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
+    with phase("extract Additional Concept Properties", g):
+        extract_additions_concept_properties(
+            wb["Additional Concept Properties"], prefixes, g=g
+        )
+
+    with phase("add_top_concepts", g):
+        g = add_top_concepts(g)
     g.bind("cs", cs_iri)
     g.bind("reg", REG)
 
     if validate:
-        validate_with_profile(
-            g,
-            profile=profile,
-            error_level=error_level,
-            message_level=message_level,
-            log_file=log_file,
-        )
+        with phase("validate", g):
+            validate_with_profile(
+                g,
+                profile=profile,
+                error_level=error_level,
+                message_level=message_level,
+                log_file=log_file,
+            )
 
     if output_file_path is not None:
-        g.serialize(destination=str(output_file_path), format="longturtle")
+        with phase("serialize", g):
+            g.serialize(destination=str(output_file_path), format="longturtle")
     else:  # print to std out
         if output_format == "graph":
             return g
         else:
-            return g.serialize(format="longturtle")
+            with phase("serialize", g):
+                return g.serialize(format="longturtle")
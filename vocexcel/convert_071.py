@@ -23,6 +23,7 @@ from vocexcel.utils import (
     VOCDERMODS,
     ConversionError,
     bind_namespaces,
+    iter_split_and_tidy_to_strings,
     make_agent,
     make_iri,
     split_and_tidy_to_strings,
@@ -34,7 +35,10 @@ def extract_prefixes(sheet: Worksheet):
 
 
 def extract_concept_scheme(
-    sheet: Worksheet, prefixes, template_version="0.7.1"
+    sheet: Worksheet,
+    prefixes,
+    template_version="0.7.1",
+    g: Optional[Graph] = None,
 ) -> tuple[Graph, str]:
     iri_s = sheet["B3"].value
     title = sheet["B4"].value
@@ -122,7 +126,8 @@ def extract_concept_scheme(
 
     # catalogue PID
 
-    g = Graph(bind_namespaces="rdflib")
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
     g.add((iri, RDF.type, SKOS.ConceptScheme))
     g.add((iri, SKOS.prefLabel, Literal(title, lang="en")))
     g.add((iri, SKOS.definition, Literal(description, lang="en")))
@@ -132,7 +137,7 @@ def extract_concept_scheme(
     g += make_agent(publisher, SDO.publisher, prefixes, iri)
 
     if custodian is not None:
-        for _custodian in split_and_tidy_to_strings(custodian):
+        for _custodian in iter_split_and_tidy_to_strings(custodian):
             DATAROLES = Namespace("https://linked.data.gov.au/def/data-roles/")
             g += make_agent(_custodian, DATAROLES.custodian, prefixes, iri)
             g.bind("DATAROLES", DATAROLES)
@@ -181,16 +186,18 @@ def extract_concept_scheme(
     return g, iri
 
 
-def extract_concepts(sheet: Worksheet, prefixes, cs_iri):
-    return extract_concepts_070(sheet, prefixes, cs_iri)
+def extract_concepts(sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None):
+    return extract_concepts_070(sheet, prefixes, cs_iri, g=g)
 
 
-def extract_collections(sheet: Worksheet, prefixes, cs_iri):
-    return extract_collections_070(sheet, prefixes, cs_iri)
+def extract_collections(sheet: Worksheet, prefixes, cs_iri, g: Optional[Graph] = None):
+    return extract_collections_070(sheet, prefixes, cs_iri, g=g)
 
 
-def extract_additions_concept_properties(sheet: Worksheet, prefixes):
-    return extract_additions_concept_properties_070(sheet, prefixes)
+def extract_additions_concept_properties(
+    sheet: Worksheet, prefixes, g: Optional[Graph] = None
+):
+    return extract_additions_concept_properties_070(sheet, prefixes, g=g)
 
 
 def excel_to_rdf(
@@ -4,10 +4,11 @@ from typing import Optional
 
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from pyshacl import validate as shacl_validate
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, SDO, SKOS, XSD
 
+from vocexcel.convert_070 import AdditionalConceptPropertiesRow, CollectionRow
+from vocexcel.convert_085 import ConceptRow
 from vocexcel.convert_085 import (
     extract_concept_scheme as extract_concept_scheme_085,
 )
@@ -17,14 +18,19 @@ from vocexcel.convert_085 import (
 from vocexcel.convert_085 import (
     rdf_to_excel as rdf_to_excel_085,
 )
+from vocexcel.profiling import phase
 from vocexcel.utils import (
     RDF_FILE_ENDINGS,
     STATUSES,
     ConversionError,
     ShaclValidationError,
+    VocpubValidator,
     add_top_concepts,
     bind_namespaces,
+    iter_split_and_tidy_to_iris,
+    iter_split_and_tidy_to_strings,
     make_iri,
+    read_rows,
     return_error,
     split_and_tidy_to_iris,
     split_and_tidy_to_strings,
@@ -45,8 +51,11 @@ def extract_concept_scheme(
     prefixes,
     template_version="0.8.5",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ) -> tuple[Graph, str]:
-    return extract_concept_scheme_085(sheet, prefixes, template_version, error_format)
+    return extract_concept_scheme_085(
+        sheet, prefixes, template_version, error_format, g=g
+    )
 
 
 def extract_concepts(
@@ -54,51 +63,36 @@ def extract_concepts(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        alt_labels = sheet[f"D{i}"].value
-        narrower = sheet[f"E{i}"].value
-        history_note = sheet[f"F{i}"].value
-        citation = sheet[f"G{i}"].value
-        is_defined_by = sheet[f"H{i}"].value
-        status = sheet[f"I{i}"].value
-        example = sheet[f"J{i}"].value
-        image_url = sheet[f"K{i}"].value
-        image_embedded = sheet[f"L{i}"].value
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for i, row in read_rows(sheet, ConceptRow):
         # check values
-        if iri_s is None:
-            break
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
-
-        if pref_label is None:
+        if row.pref_label is None:
             error = ConversionError(
-                f"You must provide a Preferred Label for Concept {iri_s}"
+                f"You must provide a Preferred Label for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if definition is None:
+        if row.definition is None:
             error = ConversionError(
-                f"You must provide a Definition for Concept {iri_s}"
+                f"You must provide a Definition for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if status is not None and status not in STATUSES:
+        if row.status is not None and row.status not in STATUSES:
             error = ConversionError(
-                f"You have supplied a status for your Concept of {status} but it is not recognised. "
+                f"You have supplied a status for your Concept of {row.status} but it is not recognised. "
                 f"If supplied, it must be one of {', '.join(STATUSES.keys())}"
             )
             return return_error(error, error_format)
 
-        if image_url is not None:
-            if not image_url.startswith("http"):
+        if row.image_url is not None:
+            if not row.image_url.startswith("http"):
                 error = ConversionError(
                     "If supplied, an Image URL must start with 'http'"
                 )
@@ -106,7 +100,7 @@ def extract_concepts(
 
         # TODO: test embedded mage is not too large
         # image_embedded
-        if image_embedded not in [None, "#VALUE!"]:
+        if row.image_embedded not in [None, "#VALUE!"]:
             error = ConversionError(
                 "The Image Embedded colum, you must only insert images or leave it blank. "
                 f"You have an unexpected value in Cell L{i}"
@@ -114,7 +108,7 @@ def extract_concepts(
             return return_error(error, error_format)
 
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/earth-science",
             "http://example.com/atmospheric-science",
             "http://example.com/geology",
@@ -125,53 +119,54 @@ def extract_concepts(
         g.add((iri, RDF.type, SKOS.Concept))
         g.add((iri, SKOS.inScheme, cs_iri))
 
-        if "@" in pref_label:
-            val, lang = pref_label.strip().split("@")
+        if "@" in row.pref_label:
+            val, lang = row.pref_label.strip().split("@")
             g.add((iri, SKOS.prefLabel, Literal(val, lang=lang)))
         else:
-            g.add((iri, SKOS.prefLabel, Literal(pref_label.strip(), lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition.strip(), lang="en")))
+            g.add((iri, SKOS.prefLabel, Literal(row.pref_label.strip(), lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition.strip(), lang="en")))
 
-        if alt_labels is not None:
-            for al in split_and_tidy_to_strings(alt_labels):
+        if row.alt_labels is not None:
+            for al in iter_split_and_tidy_to_strings(row.alt_labels):
                 g.add((iri, SKOS.altLabel, Literal(al, lang="en")))
 
-        if narrower is not None:
-            for n in split_and_tidy_to_iris(narrower, prefixes, cs_iri + "/"):
+        if row.narrower is not None:
+            for n in iter_split_and_tidy_to_iris(row.narrower, prefixes, cs_iri + "/"):
                 g.add((iri, SKOS.narrower, n))
                 g.add((n, SKOS.broader, iri))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-        if citation is not None:
-            for _citation in split_and_tidy_to_strings(citation):
+        if row.citation is not None:
+            for _citation in iter_split_and_tidy_to_strings(row.citation):
                 g.add(
                     (iri, SDO.citation, Literal(_citation.strip(), datatype=XSD.anyURI))
                 )
 
-        if is_defined_by is not None:
-            g.add((iri, RDFS.isDefinedBy, URIRef(is_defined_by.strip())))
+        if row.is_defined_by is not None:
+            g.add((iri, RDFS.isDefinedBy, URIRef(row.is_defined_by.strip())))
         else:
             g.add((iri, RDFS.isDefinedBy, cs_iri))
 
-        if status is not None:
-            g.add((iri, SDO.status, URIRef(STATUSES[status])))
+        if row.status is not None:
+            g.add((iri, SDO.status, URIRef(STATUSES[row.status])))
 
-        if example is not None:
-            g.add((iri, SKOS.example, Literal(str(example).strip())))
+        if row.example is not None:
+            g.add((iri, SKOS.example, Literal(str(row.example).strip())))
 
-        if image_url is not None:
+        if row.image_url is not None:
             g.add(
-                (iri, SDO.image, Literal(str(image_url).strip(), datatype=XSD.anyURI))
+                (
+                    iri,
+                    SDO.image,
+                    Literal(str(row.image_url).strip(), datatype=XSD.anyURI),
+                )
             )
 
-        if image_embedded == "#VALUE!":
+        if row.image_embedded == "#VALUE!":
             g.add((iri, SDO.image, Literal(f"Image at L{i}")))
 
-        i += 1
-
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -180,31 +175,23 @@ def extract_collections(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        members = sheet[f"D{i}"].value
-        history_note = sheet[f"E{i}"].value
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, CollectionRow):
         # check values
-        if iri_s is None:
-            break
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
-
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Collection {iri_s}"
+                f"You must provide a Preferred Label for Collection {row.iri}"
             )
 
-        if definition is None:
+        if row.definition is None:
             raise ConversionError(
-                f"You must provide a Definition for Collection {iri_s}"
+                f"You must provide a Definition for Collection {row.iri}"
             )
 
         # create Graph
@@ -213,19 +200,16 @@ def extract_collections(
         g.add((iri, RDFS.isDefinedBy, cs_iri))
         if str(iri).startswith(str(cs_iri)):
             g.add((iri, RDFS.isDefinedBy, cs_iri))
-        g.add((iri, SKOS.prefLabel, Literal(pref_label, lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition, lang="en")))
+        g.add((iri, SKOS.prefLabel, Literal(row.pref_label, lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition, lang="en")))
 
-        if members is not None:
-            for n in split_and_tidy_to_iris(members, prefixes, cs_iri + "/"):
+        if row.members is not None:
+            for n in iter_split_and_tidy_to_iris(row.members, prefixes, cs_iri + "/"):
                 g.add((iri, SKOS.member, n))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
-
-        i += 1
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -234,60 +218,46 @@ def extract_additions_concept_properties(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        related_s = sheet[f"B{i}"].value
-        close_s = sheet[f"C{i}"].value
-        exact_s = sheet[f"D{i}"].value
-        narrow_s = sheet[f"E{i}"].value
-        broad_s = sheet[f"F{i}"].value
-        notation_s = sheet[f"G{i}"].value
-        notation_type_s = sheet[f"H{i}"].value
-
-        # check values
-        if iri_s is None:
-            break
-
-        i += 1
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, AdditionalConceptPropertiesRow):
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/geology",
         ]:
             continue
 
         # create Graph
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        if related_s is not None:
-            related = make_iri(related_s, prefixes, namespace=cs_iri + "/")
+        if row.related_match is not None:
+            related = make_iri(row.related_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.relatedMatch, related))
 
-        if close_s is not None:
-            close = make_iri(close_s, prefixes, namespace=cs_iri + "/")
+        if row.close_match is not None:
+            close = make_iri(row.close_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.closeMatch, close))
 
-        if exact_s is not None:
-            exact = make_iri(exact_s, prefixes, namespace=cs_iri + "/")
+        if row.exact_match is not None:
+            exact = make_iri(row.exact_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.exactMatch, exact))
 
-        if narrow_s is not None:
-            narrow = make_iri(narrow_s, prefixes, namespace=cs_iri + "/")
+        if row.narrow_match is not None:
+            narrow = make_iri(row.narrow_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.narrowMatch, narrow))
 
-        if broad_s is not None:
-            broad = make_iri(broad_s, prefixes, namespace=cs_iri + "/")
+        if row.broad_match is not None:
+            broad = make_iri(row.broad_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.broadMatch, broad))
 
-        if notation_s is not None:
-            notations = split_and_tidy_to_strings(notation_s)
-            if notation_type_s is not None:
+        if row.notation is not None:
+            notations = split_and_tidy_to_strings(row.notation)
+            if row.notation_type is not None:
                 notation_types = split_and_tidy_to_iris(
-                    notation_type_s, prefixes, cs_iri
+                    row.notation_type, prefixes, cs_iri
                 )
             else:
                 notation_types = [XSD.token for x in notations]
@@ -301,7 +271,6 @@ def extract_additions_concept_properties(
                     )
                 )
 
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -362,49 +331,57 @@ def excel_to_rdf(
         )
         return return_error(error, error_format)
 
-    prefixes = extract_prefixes(wb["Prefixes"], error_format)
+    with phase("extract Prefixes"):
+        prefixes = extract_prefixes(wb["Prefixes"], error_format)
     if not isinstance(prefixes, dict):
         return prefixes
 
-    x = extract_concept_scheme(
-        wb["Concept Scheme"], prefixes, template_version, error_format
-    )
+    g = Graph(bind_namespaces="rdflib")
+    with phase("extract Concept Scheme", g):
+        x = extract_concept_scheme(
+            wb["Concept Scheme"], prefixes, template_version, error_format, g=g
+        )
     if isinstance(x, tuple):
-        cs, cs_iri = x
+        _, cs_iri = x
     else:
         return x
 
-    cons = extract_concepts(wb["Concepts"], prefixes, cs_iri)
+    with phase("extract Concepts", g):
+        cons = extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
     if not isinstance(cons, Graph):
         return cons
 
-    cols = extract_collections(wb["Collections"], prefixes, cs_iri)
+    with phase("extract Collections", g):
+        cols = extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
     if not isinstance(cols, Graph):
         return cols
 
-    extra = extract_additions_concept_properties(
-        wb["Additional Concept Properties"], prefixes, cs_iri
-    )
+    with phase("extract Additional Concept Properties", g):
+        extra = extract_additions_concept_properties(
+            wb["Additional Concept Properties"], prefixes, cs_iri, g=g
+        )
     if not isinstance(extra, Graph):
         return extra
 
-    g = cs + cons + cols + extra
-    g = add_top_concepts(g)
+    with phase("add_top_concepts", g):
+        g = add_top_concepts(g)
     g.bind("cs", cs_iri)
 
     # validate the RDF file
-    shacl_graph = Graph().parse(Path(__file__).parent / "vocpub-5.1.ttl")
-    v = shacl_validate(g, shacl_graph=shacl_graph, allow_warnings=True)
+    with phase("validate", g):
+        v = VocpubValidator().validate(g)
     if not v[0]:
         return return_error(ShaclValidationError(v[2], v[1]), error_format)
 
     if output_file is not None:
-        g.serialize(destination=str(output_file), format="longturtle")
+        with phase("serialize", g):
+            g.serialize(destination=str(output_file), format="longturtle")
     else:  # print to std out
         if output_format == "graph":
             return g
         else:
-            return g.serialize(format="longturtle")
+            with phase("serialize", g):
+                return g.serialize(format="longturtle")
 
 
 def rdf_to_excel(
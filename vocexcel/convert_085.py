@@ -1,33 +1,39 @@
 from pathlib import Path
 from typing import Literal as TypeLiteral
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from dateutil.parser import parse as date_parser
-from openpyxl.styles import Alignment, Font
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from pyshacl import validate as shacl_validate
 from rdflib import DCTERMS, BNode, Graph, Literal, Namespace, URIRef
 from rdflib.namespace import OWL, PROV, RDF, RDFS, SDO, SKOS, XSD
 
+from vocexcel.convert_070 import PrefixRow
 from vocexcel.convert_070 import (
     extract_additions_concept_properties as extract_additions_concept_properties_070,
 )
 from vocexcel.convert_070 import extract_collections as extract_collections_070
+from vocexcel.profiling import phase
 from vocexcel.utils import (
     RDF_FILE_ENDINGS,
     STATUSES,
     VOCDERMODS,
+    CellStyles,
     ConversionError,
+    Prefixes,
     ShaclValidationError,
+    VocpubValidator,
     add_top_concepts,
     bind_namespaces,
     fill_cell_with_list_of_curies,
+    hierarchy_index,
+    iter_split_and_tidy_to_iris,
+    iter_split_and_tidy_to_strings,
     load_workbook,
     make_agent,
     make_iri,
+    read_rows,
     return_error,
-    split_and_tidy_to_iris,
     split_and_tidy_to_strings,
     xl_hyperlink,
 )
@@ -35,28 +41,35 @@ from vocexcel.utils import (
 DATAROLES = Namespace("https://linked.data.gov.au/def/data-roles/")
 
 
+class ConceptRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    alt_labels: str | None
+    narrower: str | None
+    history_note: str | None
+    citation: str | None
+    is_defined_by: str | None
+    status: str | None
+    example: str | None
+    image_url: str | None
+    image_embedded: str | None
+
+
 def extract_prefixes(
     sheet: Worksheet,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
 ) -> dict[str, Namespace] | str | None:
-    prefixes = {}
-    i = 3
-    while True:
-        ns = sheet[f"B{i}"].value
-        if ns is None:
-            break
-        else:
-            if not ns.startswith("http"):
-                error = ConversionError(
-                    f"Your namespace value on sheet Prefixes, cell C{i} is invalid. It must start with 'http'"
-                )
-                return return_error(error, error_format)
-
-            pre = sheet[f"A{i}"].value
-            proper_pre = str(pre).strip(":") + ":" if pre is not None else ":"
-            prefixes[proper_pre] = ns
+    prefixes = Prefixes()
+    for i, row in read_rows(sheet, PrefixRow, min_row=3, key="namespace"):
+        if not row.namespace.startswith("http"):
+            error = ConversionError(
+                f"Your namespace value on sheet Prefixes, cell C{i} is invalid. It must start with 'http'"
+            )
+            return return_error(error, error_format)
 
-        i += 1
+        proper_pre = str(row.prefix).strip(":") + ":" if row.prefix is not None else ":"
+        prefixes[proper_pre] = row.namespace
 
     return prefixes
 
@@ -66,6 +79,7 @@ def extract_concept_scheme(
     prefixes,
     template_version="0.8.5",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ) -> tuple[Graph, str]:
     iri_s = sheet["B3"].value
     title = sheet["B4"].value
@@ -172,7 +186,8 @@ def extract_concept_scheme(
             )
             return return_error(error, error_format)
 
-    g = Graph(bind_namespaces="rdflib")
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
     g.add((iri, RDF.type, SKOS.ConceptScheme))
     g.add((iri, SKOS.prefLabel, Literal(title, lang="en")))
     g.add((iri, SKOS.definition, Literal(description, lang="en")))
@@ -182,7 +197,7 @@ def extract_concept_scheme(
     g += make_agent(publisher, SDO.publisher, prefixes, iri)
 
     if custodian is not None:
-        for _custodian in split_and_tidy_to_strings(custodian):
+        for _custodian in iter_split_and_tidy_to_strings(custodian):
             g += make_agent(_custodian, DATAROLES.custodian, prefixes, iri)
             g.bind("DATAROLES", DATAROLES)
 
@@ -230,51 +245,36 @@ def extract_concepts(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        alt_labels = sheet[f"D{i}"].value
-        narrower = sheet[f"E{i}"].value
-        history_note = sheet[f"F{i}"].value
-        citation = sheet[f"G{i}"].value
-        is_defined_by = sheet[f"H{i}"].value
-        status = sheet[f"I{i}"].value
-        example = sheet[f"J{i}"].value
-        image_url = sheet[f"K{i}"].value
-        image_embedded = sheet[f"L{i}"].value
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for i, row in read_rows(sheet, ConceptRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = make_iri(iri_s, prefixes)
+        iri = make_iri(row.iri, prefixes)
 
-        if pref_label is None:
+        if row.pref_label is None:
             error = ConversionError(
-                f"You must provide a Preferred Label for Concept {iri_s}"
+                f"You must provide a Preferred Label for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if definition is None:
+        if row.definition is None:
             error = ConversionError(
-                f"You must provide a Definition for Concept {iri_s}"
+                f"You must provide a Definition for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if status is not None and status not in STATUSES:
+        if row.status is not None and row.status not in STATUSES:
             error = ConversionError(
-                f"You have supplied a status for your Concept of {status} but it is not recognised. "
+                f"You have supplied a status for your Concept of {row.status} but it is not recognised. "
                 f"If supplied, it must be one of {', '.join(STATUSES.keys())}"
             )
             return return_error(error, error_format)
 
-        if image_url is not None:
-            if not image_url.startswith("http"):
+        if row.image_url is not None:
+            if not row.image_url.startswith("http"):
                 error = ConversionError(
                     "If supplied, an Image URL must start with 'http'"
                 )
@@ -282,7 +282,7 @@ def extract_concepts(
 
         # TODO: test embedded mage is not too large
         # image_embedded
-        if image_embedded not in [None, "#VALUE!"]:
+        if row.image_embedded not in [None, "#VALUE!"]:
             error = ConversionError(
                 "The Image Embedded colum, you must only insert images or leave it blank. "
                 f"You have an unexpected value in Cell L{i}"
@@ -290,7 +290,7 @@ def extract_concepts(
             return return_error(error, error_format)
 
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/earth-science",
             "http://example.com/atmospheric-science",
             "http://example.com/geology",
@@ -301,53 +301,54 @@ def extract_concepts(
         g.add((iri, RDF.type, SKOS.Concept))
         g.add((iri, SKOS.inScheme, cs_iri))
 
-        if "@" in pref_label:
-            val, lang = pref_label.strip().split("@")
+        if "@" in row.pref_label:
+            val, lang = row.pref_label.strip().split("@")
             g.add((iri, SKOS.prefLabel, Literal(val, lang=lang)))
         else:
-            g.add((iri, SKOS.prefLabel, Literal(pref_label.strip(), lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition.strip(), lang="en")))
+            g.add((iri, SKOS.prefLabel, Literal(row.pref_label.strip(), lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition.strip(), lang="en")))
 
-        if alt_labels is not None:
-            for al in split_and_tidy_to_strings(alt_labels):
+        if row.alt_labels is not None:
+            for al in iter_split_and_tidy_to_strings(row.alt_labels):
                 g.add((iri, SKOS.altLabel, Literal(al, lang="en")))
 
-        if narrower is not None:
-            for n in split_and_tidy_to_iris(narrower, prefixes):
+        if row.narrower is not None:
+            for n in iter_split_and_tidy_to_iris(row.narrower, prefixes):
                 g.add((iri, SKOS.narrower, n))
                 g.add((n, SKOS.broader, iri))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-        if citation is not None:
-            for _citation in split_and_tidy_to_strings(citation):
+        if row.citation is not None:
+            for _citation in iter_split_and_tidy_to_strings(row.citation):
                 g.add(
                     (iri, SDO.citation, Literal(_citation.strip(), datatype=XSD.anyURI))
                 )
 
-        if is_defined_by is not None:
-            g.add((iri, RDFS.isDefinedBy, URIRef(is_defined_by.strip())))
+        if row.is_defined_by is not None:
+            g.add((iri, RDFS.isDefinedBy, URIRef(row.is_defined_by.strip())))
         else:
             g.add((iri, RDFS.isDefinedBy, cs_iri))
 
-        if status is not None:
-            g.add((iri, SDO.status, URIRef(STATUSES[status])))
+        if row.status is not None:
+            g.add((iri, SDO.status, URIRef(STATUSES[row.status])))
 
-        if example is not None:
-            g.add((iri, SKOS.example, Literal(str(example).strip())))
+        if row.example is not None:
+            g.add((iri, SKOS.example, Literal(str(row.example).strip())))
 
-        if image_url is not None:
+        if row.image_url is not None:
             g.add(
-                (iri, SDO.image, Literal(str(image_url).strip(), datatype=XSD.anyURI))
+                (
+                    iri,
+                    SDO.image,
+                    Literal(str(row.image_url).strip(), datatype=XSD.anyURI),
+                )
             )
 
-        if image_embedded == "#VALUE!":
+        if row.image_embedded == "#VALUE!":
             g.add((iri, SDO.image, Literal(f"Image at L{i}")))
 
-        i += 1
-
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -356,16 +357,18 @@ def extract_collections(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    return extract_collections_070(sheet, prefixes, cs_iri)
+    return extract_collections_070(sheet, prefixes, cs_iri, g=g)
 
 
 def extract_additions_concept_properties(
     sheet: Worksheet,
     prefixes,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    return extract_additions_concept_properties_070(sheet, prefixes)
+    return extract_additions_concept_properties_070(sheet, prefixes, g=g)
 
 
 def excel_to_rdf(
@@ -425,49 +428,57 @@ def excel_to_rdf(
         )
         return return_error(error, error_format)
 
-    prefixes = extract_prefixes(wb["Prefixes"], error_format)
+    with phase("extract Prefixes"):
+        prefixes = extract_prefixes(wb["Prefixes"], error_format)
     if not isinstance(prefixes, dict):
         return prefixes
 
-    x = extract_concept_scheme(
-        wb["Concept Scheme"], prefixes, template_version, error_format
-    )
+    g = Graph(bind_namespaces="rdflib")
+    with phase("extract Concept Scheme", g):
+        x = extract_concept_scheme(
+            wb["Concept Scheme"], prefixes, template_version, error_format, g=g
+        )
     if isinstance(x, tuple):
-        cs, cs_iri = x
+        _, cs_iri = x
     else:
         return x
 
-    cons = extract_concepts(wb["Concepts"], prefixes, cs_iri)
+    with phase("extract Concepts", g):
+        cons = extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
     if not isinstance(cons, Graph):
         return cons
 
-    cols = extract_collections(wb["Collections"], prefixes, cs_iri)
+    with phase("extract Collections", g):
+        cols = extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
     if not isinstance(cols, Graph):
         return cols
 
-    extra = extract_additions_concept_properties(
-        wb["Additional Concept Properties"], prefixes
-    )
+    with phase("extract Additional Concept Properties", g):
+        extra = extract_additions_concept_properties(
+            wb["Additional Concept Properties"], prefixes, g=g
+        )
     if not isinstance(extra, Graph):
         return extra
 
-    g = cs + cons + cols + extra
-    g = add_top_concepts(g)
+    with phase("add_top_concepts", g):
+        g = add_top_concepts(g)
     g.bind("cs", cs_iri)
 
     # validate the RDF file
-    shacl_graph = Graph().parse(Path(__file__).parent / "vocpub-5.1.ttl")
-    v = shacl_validate(g, shacl_graph=shacl_graph, allow_warnings=True)
+    with phase("validate", g):
+        v = VocpubValidator().validate(g)
     if not v[0]:
         return return_error(ShaclValidationError(v[2], v[1]), error_format)
 
     if output_file is not None:
-        g.serialize(destination=str(output_file), format="longturtle")
+        with phase("serialize", g):
+            g.serialize(destination=str(output_file), format="longturtle")
     else:  # print to std out
         if output_format == "graph":
             return g
         else:
-            return g.serialize(format="longturtle")
+            with phase("serialize", g):
+                return g.serialize(format="longturtle")
 
 
 def rdf_to_excel(
@@ -534,8 +545,7 @@ def rdf_to_excel(
     ns = g.namespace_manager
 
     # validate the RDF file
-    shacl_graph = Graph().parse(Path(__file__).parent / "vocpub-5.1.ttl")
-    v = shacl_validate(g, shacl_graph=shacl_graph, allow_warnings=True)
+    v = VocpubValidator().validate(g)
     if not v[0]:
         return return_error(ShaclValidationError(v[2], v[1]), error_format)
 
@@ -546,6 +556,7 @@ def rdf_to_excel(
         else "VocExcel-template-085.xlsx"
     )
     wb = load_workbook(Path(__file__).parent / "templates" / fn)
+    styles = CellStyles()
 
     # Concept Scheme
     ws = wb["Concept Scheme"]
@@ -553,7 +564,7 @@ def rdf_to_excel(
     ws["B3"] = cs_iri
     ws["B4"] = g.value(subject=cs_iri, predicate=SKOS.prefLabel)
     ws["B5"] = g.value(subject=cs_iri, predicate=SKOS.definition)
-    ws["B5"].alignment = Alignment(wrap_text=True)
+    styles.apply(ws["B5"], "wrapped")
     ws["B6"] = date_parser(
         str(
             g.value(subject=cs_iri, predicate=SDO.dateCreated)
@@ -570,6 +581,7 @@ def rdf_to_excel(
         ws["B8"],
         g.value(subject=cs_iri, predicate=SDO.creator)
         or g.value(subject=cs_iri, predicate=DCTERMS.creator),
+        styles,
     )
     ws["B9"] = g.value(subject=cs_iri, predicate=SDO.publisher) or g.value(
         subject=cs_iri, predicate=DCTERMS.publisher
@@ -601,59 +613,55 @@ def rdf_to_excel(
 
     # Concepts
     ws = wb["Concepts"]
+    _, narrower_index = hierarchy_index(g)
     r = 4
     cs = sorted(list(g.subjects(predicate=RDF.type, object=SKOS.Concept)))
     for c in cs:
-        xl_hyperlink(ws[f"A{r}"], ns.curie(c))
+        xl_hyperlink(ws[f"A{r}"], ns.curie(c), styles)
         ws[f"B{r}"] = g.value(subject=c, predicate=SKOS.prefLabel)
-        ws[f"B{r}"].font = Font(size=14)
+        styles.apply(ws[f"B{r}"], "text")
         ws[f"C{r}"] = g.value(subject=c, predicate=SKOS.definition)
-        ws[f"C{r}"].alignment = Alignment(wrap_text=True)
-        ws[f"C{r}"].font = Font(size=14)
+        styles.apply(ws[f"C{r}"], "wrapped text")
 
         alt_labels = []
         for alt_label in g.objects(subject=c, predicate=SKOS.altLabel):
             alt_labels.append(alt_label)
         ws[f"D{r}"] = ",\n".join(alt_labels)
-        ws[f"D{r}"].font = Font(size=14)
+        styles.apply(ws[f"D{r}"], "text")
 
-        for s, o in g.subject_objects(SKOS.broader):
-            g.add((o, SKOS.narrower, s))
-        narrowers = []
-        for narrower in g.objects(subject=c, predicate=SKOS.narrower):
-            narrowers.append(narrower)
+        narrowers = narrower_index.get(c, [])
         ws[f"E{r}"] = ",\n".join([ns.curie(x) for x in narrowers])
-        ws[f"E{r}"].font = Font(size=14)
+        styles.apply(ws[f"E{r}"], "text")
 
         hn = g.value(subject=c, predicate=SKOS.historyNote)
         if hn is not None:
             ws[f"F{r}"] = hn
-            ws[f"F{r}"].font = Font(size=14)
+            styles.apply(ws[f"F{r}"], "text")
 
         cit = g.value(subject=c, predicate=SDO.citation)
         if cit is not None:
             ws[f"G{r}"] = hn
-            ws[f"G{r}"].font = Font(size=14)
+            styles.apply(ws[f"G{r}"], "text")
 
         is_defined_by = g.value(subject=c, predicate=RDFS.isDefinedBy)
         if is_defined_by != "" and is_defined_by != cs_iri:
-            xl_hyperlink(ws[f"H{r}"], is_defined_by)
+            xl_hyperlink(ws[f"H{r}"], is_defined_by, styles)
 
         status = g.value(subject=c, predicate=SDO.status)
         if status is not None:
             for k, v in STATUSES.items():
                 if v == str(status):
                     ws[f"I{r}"] = k
-                    ws[f"I{r}"].font = Font(size=14)
+                    styles.apply(ws[f"I{r}"], "text")
 
         eg = g.value(subject=c, predicate=SKOS.example)
         if eg is not None:
             ws[f"J{r}"] = eg
-            ws[f"J{r}"].font = Font(size=14)
+            styles.apply(ws[f"J{r}"], "text")
 
         img = g.value(subject=c, predicate=SDO.image)
         if img is not None:
-            xl_hyperlink(ws[f"K{r}"], img)
+            xl_hyperlink(ws[f"K{r}"], img, styles)
 
         r += 1
 
@@ -672,13 +680,23 @@ def rdf_to_excel(
             None,
         ) in g:
             ws = wb["Additional Concept Properties"]
-            xl_hyperlink(ws[f"A{r}"], ns.curie(c))
+            xl_hyperlink(ws[f"A{r}"], ns.curie(c), styles)
 
-            fill_cell_with_list_of_curies(f"B{r}", ws, g, c, SKOS.relatedMatch)
-            fill_cell_with_list_of_curies(f"C{r}", ws, g, c, SKOS.closeMatch)
-            fill_cell_with_list_of_curies(f"D{r}", ws, g, c, SKOS.exactMatch)
-            fill_cell_with_list_of_curies(f"E{r}", ws, g, c, SKOS.narrowMatch)
-            fill_cell_with_list_of_curies(f"F{r}", ws, g, c, SKOS.broadMatch)
+            fill_cell_with_list_of_curies(
+                f"B{r}", ws, g, c, SKOS.relatedMatch, styles=styles
+            )
+            fill_cell_with_list_of_curies(
+                f"C{r}", ws, g, c, SKOS.closeMatch, styles=styles
+            )
+            fill_cell_with_list_of_curies(
+                f"D{r}", ws, g, c, SKOS.exactMatch, styles=styles
+            )
+            fill_cell_with_list_of_curies(
+                f"E{r}", ws, g, c, SKOS.narrowMatch, styles=styles
+            )
+            fill_cell_with_list_of_curies(
+                f"F{r}", ws, g, c, SKOS.broadMatch, styles=styles
+            )
 
             notations = []
             datatypes = []
@@ -686,9 +704,9 @@ def rdf_to_excel(
                 notations.append(str(i))
                 datatypes.append(i.datatype)
             ws[f"G{r}"] = ",\n".join(notations)
-            ws[f"G{r}"].font = Font(size=14)
+            styles.apply(ws[f"G{r}"], "text")
             ws[f"H{r}"] = ",\n".join(datatypes)
-            ws[f"H{r}"].font = Font(size=14)
+            styles.apply(ws[f"H{r}"], "text")
 
             r += 1
 
@@ -697,17 +715,17 @@ def rdf_to_excel(
     r = 4
     cols = sorted(list(g.subjects(predicate=RDF.type, object=SKOS.Collection)))
     for col in cols:
-        xl_hyperlink(ws[f"A{r}"], ns.curie(col))
+        xl_hyperlink(ws[f"A{r}"], ns.curie(col), styles)
         ws[f"B{r}"] = g.value(subject=col, predicate=SKOS.prefLabel)
-        ws[f"B{r}"].font = Font(size=14)
+        styles.apply(ws[f"B{r}"], "text")
         ws[f"C{r}"] = g.value(subject=col, predicate=SKOS.definition)
 
-        fill_cell_with_list_of_curies(f"D{r}", ws, g, col, SKOS.member)
+        fill_cell_with_list_of_curies(f"D{r}", ws, g, col, SKOS.member, styles=styles)
 
         hn = g.value(subject=col, predicate=SKOS.historyNote)
         if hn is not None:
             ws[f"F{r}"] = hn
-            ws[f"F{r}"].font = Font(size=14)
+            styles.apply(ws[f"F{r}"], "text")
 
         r += 1
 
@@ -749,8 +767,8 @@ def rdf_to_excel(
     for pre, ns in g.namespaces():
         if pre not in common_prefixes:
             ws[f"A{r}"] = pre
-            ws[f"A{r}"].font = Font(size=14)
-            xl_hyperlink(ws[f"B{r}"], ns)
+            styles.apply(ws[f"A{r}"], "text")
+            xl_hyperlink(ws[f"B{r}"], ns, styles)
             r += 1
 
     if output_format == "blob":
@@ -1,59 +1,111 @@
 from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional
 from typing import Literal as TypeLiteral
-from typing import Optional
 
 from dateutil.parser import parse as date_parser
-from openpyxl.styles import Alignment, Font
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from pyshacl import validate as shacl_validate
 from rdflib import BNode, Graph, Literal, Namespace, URIRef
-from rdflib.namespace import DCTERMS, OWL, PROV, RDF, RDFS, SDO, SKOS, XSD
+from rdflib.namespace import (
+    DCTERMS,
+    OWL,
+    PROV,
+    RDF,
+    RDFS,
+    SDO,
+    SKOS,
+    XSD,
+    NamespaceManager,
+)
 
+from vocexcel.profiling import phase
 from vocexcel.utils import (
     RDF_FILE_ENDINGS,
     STATUSES,
     VOCDERMODS,
+    CellStyles,
     ConversionError,
+    Prefixes,
     ShaclValidationError,
+    SubjectIndex,
+    ValuesWorkbook,
+    VocpubValidator,
+    XlCell,
     add_top_concepts,
     bind_namespaces,
-    fill_cell_with_list_of_curies,
     get_lookup,
+    iter_split_and_tidy_to_iris,
+    iter_split_and_tidy_to_strings,
     load_workbook,
     make_agent,
     make_iri,
+    read_rows,
     return_error,
+    save_with_streamed_rows,
     split_and_tidy_to_iris,
     split_and_tidy_to_strings,
+    write_xl_rows,
     xl_hyperlink,
+    xl_hyperlink_cell,
 )
 
 DATAROLES = Namespace("https://linked.data.gov.au/def/data-roles/")
 
 
+class PrefixRow(NamedTuple):
+    prefix: str | None
+    namespace: str | None
+
+
+class ConceptRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    alt_labels: str | None
+    broader: str | None
+    history_note: str | None
+    citation: str | None
+    is_defined_by: str | None
+    status: str | None
+    example: str | None
+    image_url: str | None
+    image_embedded: str | None
+
+
+class CollectionRow(NamedTuple):
+    iri: str | None
+    pref_label: str | None
+    definition: str | None
+    members: str | None
+    history_note: str | None
+
+
+class AdditionalConceptPropertiesRow(NamedTuple):
+    iri: str | None
+    related_match: str | None
+    close_match: str | None
+    exact_match: str | None
+    narrow_match: str | None
+    broad_match: str | None
+    notation: str | None
+    notation_type: str | None
+    broader: str | None
+
+
 def extract_prefixes(
     sheet: Worksheet,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
 ) -> dict[str, Namespace] | str | None:
-    prefixes = {}
-    i = 3
-    while True:
-        ns = sheet[f"B{i}"].value
-        if ns is None:
-            break
-        else:
-            if not ns.startswith("http"):
-                error = ConversionError(
-                    f"Your namespace value on sheet Prefixes, cell C{i} is invalid. It must start with 'http'"
-                )
-                return return_error(error, error_format)
-
-            pre = sheet[f"A{i}"].value
-            proper_pre = str(pre).strip(":") + ":" if pre is not None else ":"
-            prefixes[proper_pre] = ns
+    prefixes = Prefixes()
+    for i, row in read_rows(sheet, PrefixRow, min_row=3, key="namespace"):
+        if not row.namespace.startswith("http"):
+            error = ConversionError(
+                f"Your namespace value on sheet Prefixes, cell C{i} is invalid. It must start with 'http'"
+            )
+            return return_error(error, error_format)
 
-        i += 1
+        proper_pre = str(row.prefix).strip(":") + ":" if row.prefix is not None else ":"
+        prefixes[proper_pre] = row.namespace
 
     return prefixes
 
@@ -64,6 +116,7 @@ def extract_concept_scheme(
     template_version="1.0.0",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
     themes_list: [] = None,
+    g: Optional[Graph] = None,
 ) -> tuple[Graph, str]:
     iri_s = sheet["B3"].value
     title = sheet["B4"].value
@@ -177,7 +230,8 @@ def extract_concept_scheme(
             )
             return return_error(error, error_format)
 
-    g = Graph(bind_namespaces="rdflib")
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
     g.add((iri, RDF.type, SKOS.ConceptScheme))
     g.add((iri, SKOS.prefLabel, Literal(title, lang="en")))
     g.add((iri, SKOS.definition, Literal(description, lang="en")))
@@ -187,7 +241,7 @@ def extract_concept_scheme(
     g += make_agent(publisher, SDO.publisher, prefixes, iri)
 
     if custodian is not None:
-        for _custodian in split_and_tidy_to_strings(custodian):
+        for _custodian in iter_split_and_tidy_to_strings(custodian):
             g += make_agent(_custodian, DATAROLES.custodian, prefixes, iri)
             g.bind("DATAROLES", DATAROLES)
 
@@ -252,51 +306,36 @@ def extract_concepts(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        alt_labels = sheet[f"D{i}"].value
-        broader = sheet[f"E{i}"].value
-        history_note = sheet[f"F{i}"].value
-        citation = sheet[f"G{i}"].value
-        is_defined_by = sheet[f"H{i}"].value
-        status = sheet[f"I{i}"].value
-        example = sheet[f"J{i}"].value
-        image_url = sheet[f"K{i}"].value
-        image_embedded = sheet[f"L{i}"].value
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for i, row in read_rows(sheet, ConceptRow):
         # check values
-        if iri_s is None:
-            break
-
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        if pref_label is None:
+        if row.pref_label is None:
             error = ConversionError(
-                f"You must provide a Preferred Label for Concept {iri_s}"
+                f"You must provide a Preferred Label for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if definition is None:
+        if row.definition is None:
             error = ConversionError(
-                f"You must provide a Definition for Concept {iri_s}"
+                f"You must provide a Definition for Concept {row.iri}"
             )
             return return_error(error, error_format)
 
-        if status is not None and status not in STATUSES:
+        if row.status is not None and row.status not in STATUSES:
             error = ConversionError(
-                f"You have supplied a status for your Concept of {status} but it is not recognised. "
+                f"You have supplied a status for your Concept of {row.status} but it is not recognised. "
                 f"If supplied, it must be one of {', '.join(STATUSES.keys())}"
             )
             return return_error(error, error_format)
 
-        if image_url is not None:
-            if not image_url.startswith("http"):
+        if row.image_url is not None:
+            if not row.image_url.startswith("http"):
                 error = ConversionError(
                     "If supplied, an Image URL must start with 'http'"
                 )
@@ -304,7 +343,7 @@ def extract_concepts(
 
         # TODO: test embedded mage is not too large
         # image_embedded
-        if image_embedded not in [None, "#VALUE!"]:
+        if row.image_embedded not in [None, "#VALUE!"]:
             error = ConversionError(
                 "The Image Embedded colum, you must only insert images or leave it blank. "
                 f"You have an unexpected value in Cell L{i}"
@@ -312,7 +351,7 @@ def extract_concepts(
             return return_error(error, error_format)
 
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/earth-science",
             "http://example.com/atmospheric-science",
             "http://example.com/geology",
@@ -323,53 +362,54 @@ def extract_concepts(
         g.add((iri, RDF.type, SKOS.Concept))
         g.add((iri, SKOS.inScheme, cs_iri))
 
-        if "@" in pref_label:
-            val, lang = pref_label.strip().split("@")
+        if "@" in row.pref_label:
+            val, lang = row.pref_label.strip().split("@")
             g.add((iri, SKOS.prefLabel, Literal(val, lang=lang)))
         else:
-            g.add((iri, SKOS.prefLabel, Literal(pref_label.strip(), lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition.strip(), lang="en")))
+            g.add((iri, SKOS.prefLabel, Literal(row.pref_label.strip(), lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition.strip(), lang="en")))
 
-        if alt_labels is not None:
-            for al in split_and_tidy_to_strings(alt_labels):
+        if row.alt_labels is not None:
+            for al in iter_split_and_tidy_to_strings(row.alt_labels):
                 g.add((iri, SKOS.altLabel, Literal(al, lang="en")))
 
-        if broader is not None:
-            for n in split_and_tidy_to_iris(broader, prefixes, cs_iri + "/"):
+        if row.broader is not None:
+            for n in iter_split_and_tidy_to_iris(row.broader, prefixes, cs_iri + "/"):
                 g.add((iri, SKOS.broader, n))
                 g.add((n, SKOS.narrower, iri))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-        if citation is not None:
-            for _citation in split_and_tidy_to_strings(citation):
+        if row.citation is not None:
+            for _citation in iter_split_and_tidy_to_strings(row.citation):
                 g.add(
                     (iri, SDO.citation, Literal(_citation.strip(), datatype=XSD.anyURI))
                 )
 
-        if is_defined_by is not None:
-            g.add((iri, RDFS.isDefinedBy, URIRef(is_defined_by.strip())))
+        if row.is_defined_by is not None:
+            g.add((iri, RDFS.isDefinedBy, URIRef(row.is_defined_by.strip())))
         else:
             g.add((iri, RDFS.isDefinedBy, cs_iri))
 
-        if status is not None:
-            g.add((iri, SDO.status, URIRef(STATUSES[status])))
+        if row.status is not None:
+            g.add((iri, SDO.status, URIRef(STATUSES[row.status])))
 
-        if example is not None:
-            g.add((iri, SKOS.example, Literal(str(example).strip())))
+        if row.example is not None:
+            g.add((iri, SKOS.example, Literal(str(row.example).strip())))
 
-        if image_url is not None:
+        if row.image_url is not None:
             g.add(
-                (iri, SDO.image, Literal(str(image_url).strip(), datatype=XSD.anyURI))
+                (
+                    iri,
+                    SDO.image,
+                    Literal(str(row.image_url).strip(), datatype=XSD.anyURI),
+                )
             )
 
-        if image_embedded == "#VALUE!":
+        if row.image_embedded == "#VALUE!":
             g.add((iri, SDO.image, Literal(f"Image at L{i}")))
 
-        i += 1
-
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -378,31 +418,23 @@ def extract_collections(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        pref_label = sheet[f"B{i}"].value
-        definition = sheet[f"C{i}"].value
-        members = sheet[f"D{i}"].value
-        history_note = sheet[f"E{i}"].value
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, CollectionRow):
         # check values
-        if iri_s is None:
-            break
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
-
-        if pref_label is None:
+        if row.pref_label is None:
             raise ConversionError(
-                f"You must provide a Preferred Label for Collection {iri_s}"
+                f"You must provide a Preferred Label for Collection {row.iri}"
             )
 
-        if definition is None:
+        if row.definition is None:
             raise ConversionError(
-                f"You must provide a Definition for Collection {iri_s}"
+                f"You must provide a Definition for Collection {row.iri}"
             )
 
         # create Graph
@@ -411,19 +443,16 @@ def extract_collections(
         g.add((iri, RDFS.isDefinedBy, cs_iri))
         if str(iri).startswith(str(cs_iri)):
             g.add((iri, RDFS.isDefinedBy, cs_iri))
-        g.add((iri, SKOS.prefLabel, Literal(pref_label, lang="en")))
-        g.add((iri, SKOS.definition, Literal(definition, lang="en")))
+        g.add((iri, SKOS.prefLabel, Literal(row.pref_label, lang="en")))
+        g.add((iri, SKOS.definition, Literal(row.definition, lang="en")))
 
-        if members is not None:
-            for n in split_and_tidy_to_iris(members, prefixes, cs_iri + "/"):
+        if row.members is not None:
+            for n in iter_split_and_tidy_to_iris(row.members, prefixes, cs_iri + "/"):
                 g.add((iri, SKOS.member, n))
 
-        if history_note is not None:
-            g.add((iri, SKOS.historyNote, Literal(history_note.strip())))
-
-        i += 1
+        if row.history_note is not None:
+            g.add((iri, SKOS.historyNote, Literal(row.history_note.strip())))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
@@ -432,61 +461,46 @@ def extract_additions_concept_properties(
     prefixes,
     cs_iri,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    g: Optional[Graph] = None,
 ):
-    g = Graph(bind_namespaces="rdflib")
-    i = 4
-    while True:
-        # get values
-        iri_s = sheet[f"A{i}"].value
-        related_s = sheet[f"B{i}"].value
-        close_s = sheet[f"C{i}"].value
-        exact_s = sheet[f"D{i}"].value
-        narrow_s = sheet[f"E{i}"].value
-        broad_s = sheet[f"F{i}"].value
-        notation_s = sheet[f"G{i}"].value
-        notation_type_s = sheet[f"H{i}"].value
-        broader = sheet[f"I{i}"].value
-
-        # check values
-        if iri_s is None:
-            break
-
-        i += 1
-
+    if g is None:
+        g = Graph(bind_namespaces="rdflib")
+        bind_namespaces(g, prefixes)
+    for _, row in read_rows(sheet, AdditionalConceptPropertiesRow):
         # ignore example Concepts
-        if iri_s in [
+        if row.iri in [
             "http://example.com/geology",
         ]:
             continue
 
         # create Graph
-        iri = make_iri(iri_s, prefixes, namespace=cs_iri + "/")
+        iri = make_iri(row.iri, prefixes, namespace=cs_iri + "/")
 
-        if related_s is not None:
-            related = make_iri(related_s, prefixes, namespace=cs_iri + "/")
+        if row.related_match is not None:
+            related = make_iri(row.related_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.relatedMatch, related))
 
-        if close_s is not None:
-            close = make_iri(close_s, prefixes, namespace=cs_iri + "/")
+        if row.close_match is not None:
+            close = make_iri(row.close_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.closeMatch, close))
 
-        if exact_s is not None:
-            exact = make_iri(exact_s, prefixes, namespace=cs_iri + "/")
+        if row.exact_match is not None:
+            exact = make_iri(row.exact_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.exactMatch, exact))
 
-        if narrow_s is not None:
-            narrow = make_iri(narrow_s, prefixes, namespace=cs_iri + "/")
+        if row.narrow_match is not None:
+            narrow = make_iri(row.narrow_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.narrowMatch, narrow))
 
-        if broad_s is not None:
-            broad = make_iri(broad_s, prefixes, namespace=cs_iri + "/")
+        if row.broad_match is not None:
+            broad = make_iri(row.broad_match, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.broadMatch, broad))
 
-        if notation_s is not None:
-            notations = split_and_tidy_to_strings(notation_s)
-            if notation_type_s is not None:
+        if row.notation is not None:
+            notations = split_and_tidy_to_strings(row.notation)
+            if row.notation_type is not None:
                 notation_types = split_and_tidy_to_iris(
-                    notation_type_s, prefixes, cs_iri
+                    row.notation_type, prefixes, cs_iri
                 )
             else:
                 notation_types = [XSD.token for x in notations]
@@ -500,17 +514,16 @@ def extract_additions_concept_properties(
                     )
                 )
 
-        if broader is not None:
-            b = make_iri(broader, prefixes, namespace=cs_iri + "/")
+        if row.broader is not None:
+            b = make_iri(row.broader, prefixes, namespace=cs_iri + "/")
             g.add((iri, SKOS.broader, b))
             g.add((b, SKOS.narrower, iri))
 
-    bind_namespaces(g, prefixes)
     return g
 
 
 def excel_to_rdf(
-    wb: Workbook,
+    wb: Workbook | ValuesWorkbook,
     output_file: Optional[Path] = None,
     template_version: str = "1.0.0",
     output_format: TypeLiteral[
@@ -523,7 +536,7 @@ def excel_to_rdf(
     """Converts an Excel workbook file to RDF
 
     Parameters:
-        excel_file: The Excel workbook file to convert
+        wb: The Excel workbook to convert, or a ValuesWorkbook of the values of one, e.g. from Google Sheets
         output_file: Optional. If set, the RDF output will be written to this file in the turtle format.
         output_format: Optional, default rdf. rdf: return serialized RDF in the turtle format, graph: return an RDFLib Graph object
         error_format: Optional, default python. the kind of errors to return: python is Python, cmd is command line-formatted string, json is stringified JSON
@@ -532,7 +545,7 @@ def excel_to_rdf(
         output_format or an error in one of the error_formats
     """
 
-    if not isinstance(wb, Workbook):
+    if not isinstance(wb, (Workbook, ValuesWorkbook)):
         error = ValueError(
             "Files for conversion to Excel must end with one of the RDF file formats: '{}'".format(
                 "', '".join(RDF_FILE_ENDINGS.keys())
@@ -567,52 +580,220 @@ def excel_to_rdf(
         )
         return return_error(error, error_format)
 
-    prefixes = extract_prefixes(wb["Prefixes"], error_format)
+    with phase("extract Prefixes"):
+        prefixes = extract_prefixes(wb["Prefixes"], error_format)
     if not isinstance(prefixes, dict):
         return prefixes
 
     if template_version in ["1.0.0.GA"]:
         themes_list = get_lookup(wb["Lookups"], "C", 2)
 
-    x = extract_concept_scheme(
-        wb["Concept Scheme"], prefixes, template_version, error_format, themes_list
-    )
+    g = Graph(bind_namespaces="rdflib")
+    with phase("extract Concept Scheme", g):
+        x = extract_concept_scheme(
+            wb["Concept Scheme"],
+            prefixes,
+            template_version,
+            error_format,
+            themes_list,
+            g=g,
+        )
     if isinstance(x, tuple):
-        cs, cs_iri = x
+        _, cs_iri = x
     else:
         return x
 
-    cons = extract_concepts(wb["Concepts"], prefixes, cs_iri)
+    with phase("extract Concepts", g):
+        cons = extract_concepts(wb["Concepts"], prefixes, cs_iri, g=g)
     if not isinstance(cons, Graph):
         return cons
 
-    cols = extract_collections(wb["Collections"], prefixes, cs_iri)
+    with phase("extract Collections", g):
+        cols = extract_collections(wb["Collections"], prefixes, cs_iri, g=g)
     if not isinstance(cols, Graph):
         return cols
 
-    extra = extract_additions_concept_properties(
-        wb["Additional Concept Properties"], prefixes, cs_iri
-    )
+    with phase("extract Additional Concept Properties", g):
+        extra = extract_additions_concept_properties(
+            wb["Additional Concept Properties"], prefixes, cs_iri, g=g
+        )
     if not isinstance(extra, Graph):
         return extra
 
-    g = cs + cons + cols + extra
-    g = add_top_concepts(g)
+    with phase("add_top_concepts", g):
+        g = add_top_concepts(g)
     g.bind("cs", cs_iri)
 
     # validate the RDF file
-    shacl_graph = Graph().parse(Path(__file__).parent / "vocpub-5.1.ttl")
-    v = shacl_validate(g, shacl_graph=shacl_graph, allow_warnings=True)
+    with phase("validate", g):
+        v = VocpubValidator().validate(g)
     if not v[0]:
         return return_error(ShaclValidationError(v[2], v[1]), error_format)
 
     if output_file is not None:
-        g.serialize(destination=str(output_file), format="longturtle")
+        with phase("serialize", g):
+            g.serialize(destination=str(output_file), format="longturtle")
     else:  # print to std out
         if output_format == "graph":
             return g
         else:
-            return g.serialize(format="longturtle")
+            with phase("serialize", g):
+                return g.serialize(format="longturtle")
+
+
+def _concept_rows(
+    concepts: list[URIRef],
+    index: SubjectIndex,
+    cs_iri: URIRef,
+    ns: NamespaceManager,
+) -> Iterator[Dict[str, XlCell]]:
+    for c in concepts:
+        row = {
+            "A": xl_hyperlink_cell(ns.curie(c)),
+            "B": XlCell(index.value(c, SKOS.prefLabel), "text"),
+            "C": XlCell(index.value(c, SKOS.definition), "wrapped text"),
+            "D": XlCell(",\n".join(index.objects(c, SKOS.altLabel)), "text"),
+        }
+
+        # only stated broaders, not those given by the broader Concept's skos:narrower
+        broaders = index.objects(c, SKOS.broader)
+        if len(broaders) > 0:
+            row["E"] = xl_hyperlink_cell(ns.curie(broaders[0]), "hyperlink text")
+
+        hn = index.value(c, SKOS.historyNote)
+        if hn is not None:
+            row["F"] = XlCell(hn, "text")
+
+        cit = index.value(c, SDO.citation)
+        if cit is not None:
+            row["G"] = XlCell(hn, "text")
+
+        is_defined_by = index.value(c, RDFS.isDefinedBy)
+        if is_defined_by != "" and is_defined_by != cs_iri:
+            row["H"] = xl_hyperlink_cell(is_defined_by)
+
+        status = index.value(c, SDO.status)
+        if status is not None:
+            for k, v in STATUSES.items():
+                if v == str(status):
+                    row["I"] = XlCell(k, "text")
+
+        eg = index.value(c, SKOS.example)
+        if eg is not None:
+            row["J"] = XlCell(eg, "text")
+
+        img = index.value(c, SDO.image)
+        if img is not None:
+            row["K"] = xl_hyperlink_cell(img)
+
+        yield row
+
+
+def _additional_concept_properties_rows(
+    concepts: list[URIRef],
+    index: SubjectIndex,
+    ns: NamespaceManager,
+) -> Iterator[Dict[str, XlCell]]:
+    def curies(c, p):
+        return XlCell(",\n".join([ns.curie(x) for x in index.objects(c, p)]), "text")
+
+    for c in concepts:
+        if any(
+            index.objects(c, p)
+            for p in [
+                SKOS.relatedMatch,
+                SKOS.closeMatch,
+                SKOS.exactMatch,
+                SKOS.narrowMatch,
+                SKOS.broadMatch,
+                SKOS.notation,
+            ]
+        ):
+            notations = []
+            datatypes = []
+            for i in index.objects(c, SKOS.notation):
+                notations.append(str(i))
+                datatypes.append(i.datatype)
+            yield {
+                "A": xl_hyperlink_cell(ns.curie(c)),
+                "B": curies(c, SKOS.relatedMatch),
+                "C": curies(c, SKOS.closeMatch),
+                "D": curies(c, SKOS.exactMatch),
+                "E": curies(c, SKOS.narrowMatch),
+                "F": curies(c, SKOS.broadMatch),
+                "G": XlCell(",\n".join(notations), "text"),
+                "H": XlCell(",\n".join(datatypes), "text"),
+            }
+
+    # remaining Concepts with 2+ broaders
+    for c in concepts:
+        for b in index.objects(c, SKOS.broader)[1:]:
+            yield {
+                "A": xl_hyperlink_cell(ns.curie(c)),
+                "I": xl_hyperlink_cell(ns.curie(b)),
+            }
+
+
+def _collection_rows(
+    g: Graph, index: SubjectIndex, ns: NamespaceManager
+) -> Iterator[Dict[str, XlCell]]:
+    for col in sorted(g.subjects(predicate=RDF.type, object=SKOS.Collection)):
+        row = {
+            "A": xl_hyperlink_cell(ns.curie(col)),
+            "B": XlCell(index.value(col, SKOS.prefLabel), "text"),
+            "C": XlCell(index.value(col, SKOS.definition)),
+            "D": XlCell(
+                ",\n".join([ns.curie(x) for x in index.objects(col, SKOS.member)]),
+                "text",
+            ),
+        }
+
+        hn = index.value(col, SKOS.historyNote)
+        if hn is not None:
+            row["F"] = XlCell(hn, "text")
+
+        yield row
+
+
+def _prefix_rows(g: Graph) -> Iterator[Dict[str, XlCell]]:
+    common_prefixes = [
+        "ex",
+        "brick",
+        "csvw",
+        "dc",
+        "dcat",
+        "dcmitype",
+        "dcterms",
+        "dcam",
+        "doap",
+        "foaf",
+        "geo",
+        "odrl",
+        "org",
+        "prof",
+        "prov",
+        "qb",
+        "schema",
+        "sh",
+        "skos",
+        "sosa",
+        "ssn",
+        "time",
+        "vann",
+        "void",
+        "wgs",
+        "owl",
+        "rdf",
+        "rdfs",
+        "xsd",
+        "xml",
+    ]
+    for pre, ns in g.namespaces():
+        if pre not in common_prefixes:
+            yield {
+                "A": XlCell(pre, "text"),
+                "B": xl_hyperlink_cell(ns),
+            }
 
 
 def rdf_to_excel(
@@ -621,6 +802,7 @@ def rdf_to_excel(
     template_version="1.0.0",
     output_format: TypeLiteral["blob", "file"] = "file",
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    write_only: bool = False,
 ):
     """Converts RDF files to Excel workbooks.
 
@@ -630,6 +812,7 @@ def rdf_to_excel(
         template_version: Optional, default 0.8.5. Currently only 0.8.5 and 0.8.5.GA are supported
         output_format: Optional, default file. Whether to return a binary blob (openpyxl Workbook instance) or write results to file.
         error_format: Optional, default python. the kind of errors to return: python is Python, cmd is command line-formatted string, json is stringified JSON
+        write_only: Optional, default False. If set, write the Concepts, Additional Concept Properties and Collections rows to the output file as they are generated, rather than building them all in memory first. Requires output_format file
 
     Returns:
         output_format or an error in one of the error_formats
@@ -662,6 +845,10 @@ def rdf_to_excel(
         )
         return return_error(error, error_format)
 
+    if write_only and output_format != "file":
+        error = ValueError("write_only can only be used with output_format file")
+        return return_error(error, error_format)
+
     allowed_error_formats = ["python", "cmd", "json"]
     if error_format not in allowed_error_formats:
         error = ValueError(
@@ -670,8 +857,10 @@ def rdf_to_excel(
         return return_error(error, error_format)
 
     # load the RDF file
+    g = Graph()
     try:
-        g = Graph().parse(str(rdf_file), format=RDF_FILE_ENDINGS[rdf_file.suffix])
+        with phase("parse", g):
+            g.parse(str(rdf_file), format=RDF_FILE_ENDINGS[rdf_file.suffix])
     except Exception as e:
         return return_error(e, error_format)
 
@@ -680,245 +869,100 @@ def rdf_to_excel(
     ns = g.namespace_manager
 
     # validate the RDF file
-    shacl_graph = Graph().parse(Path(__file__).parent / "vocpub-5.1.ttl")
-    v = shacl_validate(g, shacl_graph=shacl_graph, allow_warnings=True)
+    with phase("validate", g):
+        v = VocpubValidator().validate(g)
     if not v[0]:
         return return_error(ShaclValidationError(v[2], v[1]), error_format)
 
+    with phase("index", g):
+        index = SubjectIndex(g)
+        concepts = sorted(g.subjects(predicate=RDF.type, object=SKOS.Concept))
+
     # load the template
     fn = (
         "VocExcel-template-100-GA.xlsx"
         if template_version == "1.0.0.GA"
         else "VocExcel-template-100.xlsx"
     )
-    wb = load_workbook(Path(__file__).parent / "templates" / fn)
+    with phase("load template"):
+        wb = load_workbook(Path(__file__).parent / "templates" / fn)
+    styles = CellStyles()
 
     # Concept Scheme
     ws = wb["Concept Scheme"]
     cs_iri = g.value(predicate=RDF.type, object=SKOS.ConceptScheme)
     ws["B3"] = cs_iri
-    ws["B4"] = g.value(subject=cs_iri, predicate=SKOS.prefLabel)
-    ws["B5"] = g.value(subject=cs_iri, predicate=SKOS.definition)
-    ws["B5"].alignment = Alignment(wrap_text=True)
+    ws["B4"] = index.value(cs_iri, SKOS.prefLabel)
+    ws["B5"] = index.value(cs_iri, SKOS.definition)
+    styles.apply(ws["B5"], "wrapped")
     ws["B6"] = date_parser(
         str(
-            g.value(subject=cs_iri, predicate=SDO.dateCreated)
-            or g.value(subject=cs_iri, predicate=DCTERMS.created)
+            index.value(cs_iri, SDO.dateCreated) or index.value(cs_iri, DCTERMS.created)
         )
     )
     ws["B7"] = date_parser(
         str(
-            g.value(subject=cs_iri, predicate=SDO.dateModified)
-            or g.value(subject=cs_iri, predicate=DCTERMS.modified)
+            index.value(cs_iri, SDO.dateModified)
+            or index.value(cs_iri, DCTERMS.modified)
         )
     )
     xl_hyperlink(
         ws["B8"],
-        g.value(subject=cs_iri, predicate=SDO.creator)
-        or g.value(subject=cs_iri, predicate=DCTERMS.creator),
+        index.value(cs_iri, SDO.creator) or index.value(cs_iri, DCTERMS.creator),
+        styles,
     )
-    ws["B9"] = g.value(subject=cs_iri, predicate=SDO.publisher) or g.value(
-        subject=cs_iri, predicate=DCTERMS.publisher
+    ws["B9"] = index.value(cs_iri, SDO.publisher) or index.value(
+        cs_iri, DCTERMS.publisher
     )
     # custodian
-    for o in g.objects(subject=cs_iri, predicate=PROV.qualifiedAttribution):
-        for p, o2 in g.predicate_objects(subject=o):
+    for o in index.objects(cs_iri, PROV.qualifiedAttribution):
+        for p, o2 in index.predicate_objects(o):
             if p == DATAROLES.custodian:
                 ws["B10"] = str(o2)
-    ws["B11"] = g.value(subject=cs_iri, predicate=SDO.version) or g.value(
-        subject=cs_iri, predicate=OWL.versionInfo
-    )
-    ws["B12"] = g.value(subject=cs_iri, predicate=SKOS.historyNote)
-    ws["B13"] = g.value(subject=cs_iri, predicate=SDO.citation)
-    for o in g.objects(subject=cs_iri, predicate=PROV.qualifiedDerivation):
-        for p, o2 in g.predicate_objects(subject=o):
+    ws["B11"] = index.value(cs_iri, SDO.version) or index.value(cs_iri, OWL.versionInfo)
+    ws["B12"] = index.value(cs_iri, SKOS.historyNote)
+    ws["B13"] = index.value(cs_iri, SDO.citation)
+    for o in index.objects(cs_iri, PROV.qualifiedDerivation):
+        for p, o2 in index.predicate_objects(o):
             if p == PROV.entity:
                 ws["B14"] = str(o2)
             if p == PROV.hadRole:
                 for k, v in VOCDERMODS.items():
                     if v == str(o2):
                         ws["B15"] = k
-    ws["B16"] = ", ".join(
-        [ns.curie(x) for x in g.objects(subject=cs_iri, predicate=SDO.keywords)]
-    )
-    ws[f"B16"].font = Font(size=14)
-    ws["B17"] = str(g.value(subject=cs_iri, predicate=SDO.status)).split("/")[-1]
+    ws["B16"] = ", ".join([ns.curie(x) for x in index.objects(cs_iri, SDO.keywords)])
+    styles.apply(ws[f"B16"], "text")
+    ws["B17"] = str(index.value(cs_iri, SDO.status)).split("/")[-1]
     if template_version == "1.0.0.GA":
-        ws["B18"] = str(g.value(subject=cs_iri, predicate=SDO.identifier))
-
-    # Concepts
-    ws = wb["Concepts"]
-    extra_broaders = {}
-    r = 4
-    cs = sorted(list(g.subjects(predicate=RDF.type, object=SKOS.Concept)))
-    for c in cs:
-        xl_hyperlink(ws[f"A{r}"], ns.curie(c))
-        ws[f"B{r}"] = g.value(subject=c, predicate=SKOS.prefLabel)
-        ws[f"B{r}"].font = Font(size=14)
-        ws[f"C{r}"] = g.value(subject=c, predicate=SKOS.definition)
-        ws[f"C{r}"].alignment = Alignment(wrap_text=True)
-        ws[f"C{r}"].font = Font(size=14)
-
-        alt_labels = []
-        for alt_label in g.objects(subject=c, predicate=SKOS.altLabel):
-            alt_labels.append(alt_label)
-        ws[f"D{r}"] = ",\n".join(alt_labels)
-        ws[f"D{r}"].font = Font(size=14)
-
-        for s, o in g.subject_objects(SKOS.broader):
-            g.add((o, SKOS.narrower, s))
-        broaders = []
-        for broader in g.objects(subject=c, predicate=SKOS.broader):
-            broaders.append(broader)
-        if len(broaders) > 0:
-            xl_hyperlink(ws[f"E{r}"], ns.curie(broaders[0]))
-            ws[f"E{r}"].font = Font(size=14)
-            if len(broaders) > 1:
-                extra_broaders[c] = broaders[1:]
-
-        hn = g.value(subject=c, predicate=SKOS.historyNote)
-        if hn is not None:
-            ws[f"F{r}"] = hn
-            ws[f"F{r}"].font = Font(size=14)
-
-        cit = g.value(subject=c, predicate=SDO.citation)
-        if cit is not None:
-            ws[f"G{r}"] = hn
-            ws[f"G{r}"].font = Font(size=14)
-
-        is_defined_by = g.value(subject=c, predicate=RDFS.isDefinedBy)
-        if is_defined_by != "" and is_defined_by != cs_iri:
-            xl_hyperlink(ws[f"H{r}"], is_defined_by)
-
-        status = g.value(subject=c, predicate=SDO.status)
-        if status is not None:
-            for k, v in STATUSES.items():
-                if v == str(status):
-                    ws[f"I{r}"] = k
-                    ws[f"I{r}"].font = Font(size=14)
-
-        eg = g.value(subject=c, predicate=SKOS.example)
-        if eg is not None:
-            ws[f"J{r}"] = eg
-            ws[f"J{r}"].font = Font(size=14)
-
-        img = g.value(subject=c, predicate=SDO.image)
-        if img is not None:
-            xl_hyperlink(ws[f"K{r}"], img)
-
-        r += 1
-
-    r = 4
-    cs = sorted(list(g.subjects(predicate=RDF.type, object=SKOS.Concept)))
-    for c in cs:
-        # Concepts - Additional Properties
-        if (
-            c,
-            SKOS.relatedMatch
-            | SKOS.closeMatch
-            | SKOS.exactMatch
-            | SKOS.narrowMatch
-            | SKOS.broadMatch
-            | SKOS.notation,
-            None,
-        ) in g:
-            ws = wb["Additional Concept Properties"]
-            xl_hyperlink(ws[f"A{r}"], ns.curie(c))
-
-            fill_cell_with_list_of_curies(f"B{r}", ws, g, c, SKOS.relatedMatch)
-            fill_cell_with_list_of_curies(f"C{r}", ws, g, c, SKOS.closeMatch)
-            fill_cell_with_list_of_curies(f"D{r}", ws, g, c, SKOS.exactMatch)
-            fill_cell_with_list_of_curies(f"E{r}", ws, g, c, SKOS.narrowMatch)
-            fill_cell_with_list_of_curies(f"F{r}", ws, g, c, SKOS.broadMatch)
-
-            notations = []
-            datatypes = []
-            for i in g.objects(subject=c, predicate=SKOS.notation):
-                notations.append(str(i))
-                datatypes.append(i.datatype)
-            ws[f"G{r}"] = ",\n".join(notations)
-            ws[f"G{r}"].font = Font(size=14)
-            ws[f"H{r}"] = ",\n".join(datatypes)
-            ws[f"H{r}"].font = Font(size=14)
-
-            r += 1
-
-    # remaining Concepts with 2+ broaders
-    ws = wb["Additional Concept Properties"]
-    for c, bs in extra_broaders.items():
-        for b in bs:
-            xl_hyperlink(ws[f"A{r}"], ns.curie(c))
-            xl_hyperlink(ws[f"I{r}"], ns.curie(b))
-
-            r += 1
-
-    # Collections
-    ws = wb["Collections"]
-    r = 4
-    cols = sorted(list(g.subjects(predicate=RDF.type, object=SKOS.Collection)))
-    for col in cols:
-        xl_hyperlink(ws[f"A{r}"], ns.curie(col))
-        ws[f"B{r}"] = g.value(subject=col, predicate=SKOS.prefLabel)
-        ws[f"B{r}"].font = Font(size=14)
-        ws[f"C{r}"] = g.value(subject=col, predicate=SKOS.definition)
-
-        fill_cell_with_list_of_curies(f"D{r}", ws, g, col, SKOS.member)
-
-        hn = g.value(subject=col, predicate=SKOS.historyNote)
-        if hn is not None:
-            ws[f"F{r}"] = hn
-            ws[f"F{r}"].font = Font(size=14)
-
-        r += 1
-
-    # Namespaces
-    ws = wb["Prefixes"]
-    common_prefixes = [
-        "ex",
-        "brick",
-        "csvw",
-        "dc",
-        "dcat",
-        "dcmitype",
-        "dcterms",
-        "dcam",
-        "doap",
-        "foaf",
-        "geo",
-        "odrl",
-        "org",
-        "prof",
-        "prov",
-        "qb",
-        "schema",
-        "sh",
-        "skos",
-        "sosa",
-        "ssn",
-        "time",
-        "vann",
-        "void",
-        "wgs",
-        "owl",
-        "rdf",
-        "rdfs",
-        "xsd",
-        "xml",
-    ]
-    r = 4
-    for pre, ns in g.namespaces():
-        if pre not in common_prefixes:
-            ws[f"A{r}"] = pre
-            ws[f"A{r}"].font = Font(size=14)
-            xl_hyperlink(ws[f"B{r}"], ns)
-            r += 1
+        ws["B18"] = str(index.value(cs_iri, SDO.identifier))
+
+    # Concepts, Concepts - Additional Properties and Collections
+    rows = {
+        "Concepts": _concept_rows(concepts, index, cs_iri, ns),
+        "Additional Concept Properties": _additional_concept_properties_rows(
+            concepts, index, ns
+        ),
+        "Collections": _collection_rows(g, index, ns),
+        # last: making the other sheets' CURIEs may bind new prefixes, and the
+        # Prefixes sheet is saved after them
+        "Prefixes": _prefix_rows(g),
+    }
+    if not write_only:
+        with phase("write rows"):
+            for sheet_name, sheet_rows in rows.items():
+                write_xl_rows(wb[sheet_name], sheet_rows, styles)
 
     if output_format == "blob":
         return wb
     else:
         # save the output
         if output_file is None:
-            wb.save(str(rdf_file.with_suffix(".xlsx")))
+            output_file = rdf_file.with_suffix(".xlsx")
         else:
             print("Saving to given file")
-            wb.save(str(output_file))
+        # write-only rows are generated as they are saved
+        with phase("save"):
+            if write_only:
+                save_with_streamed_rows(wb, str(output_file), rows, styles)
+            else:
+                wb.save(str(output_file))
@@ -1,32 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
 
-from googleapiclient.discovery import build
+from dateutil.parser import parse as date_parser
+from openpyxl.utils.datetime import from_excel
 from pydantic import ValidationError
-
-try:
-    import models
-    import profiles
-    from utils import ConversionError, split_and_tidy_to_strings
-except:
-    import sys
-
-    sys.path.append("..")
-    from vocexcel import models, profiles
-    from vocexcel.convert import log_msg, validate_with_profile
-    from vocexcel.utils import (
-        ConversionError,
-        log_msg,
-        split_and_tidy_to_strings,
-        validate_with_profile,
-    )
-
-ACCEPTED_TEMPLATE_VERSIONS = ["0.4.3"]
-SPREADSHEET_ID = None
-RANGE = None
-KEY = None
-client = None
-sheet = None
+from rdflib import Graph
+
+from vocexcel import convert_100, models
+from vocexcel.cache import SheetsCache
+from vocexcel.utils import (
+    ConversionError,
+    ValuesWorkbook,
+    ValuesWorksheet,
+    split_and_tidy_to_strings,
+    validate_with_profile,
+)
+
+ACCEPTED_TEMPLATE_VERSIONS = ["0.4.3", "1.0.0", "1.0.0.GA"]
+# the cells that may hold the template version, in the order workbooks' are checked: E4 from 0.5.0 on, J11 before
+TEMPLATE_VERSION_RANGES = ["Introduction!E4", "Introduction!J11"]
+# the Concept Scheme, Concepts, Additional Concept Features, Collections and Prefix Sheet ranges of template 0.4.3
+RANGES_043 = [
+    "Concept Scheme*!B2:B12",
+    "Concepts*!A:I",
+    "Additional Concept Features!B:F",
+    "Collections!A:E",
+    "Prefix Sheet!A:B",
+]
+# the sheets of template 1.0.0 that convert_100 reads, from cell A1 to the last column it reads, so that their values
+# can be read as worksheets
+RANGES_100 = [
+    "Concept Scheme!A1:B18",
+    "Concepts!A1:L",
+    "Collections!A1:E",
+    "Additional Concept Properties!A1:I",
+    "Prefixes!A1:B",
+]
+TEMPLATE_RANGES = {
+    "0.4.3": RANGES_043,
+    "1.0.0": RANGES_100,
+    "1.0.0.GA": RANGES_100 + ["Lookups!A1:C"],
+}
+# template 1.0.0's sheets are read as workbooks' are, with numbers as numbers and dates as serial numbers rather than
+# as they are shown
+UNFORMATTED_VALUES = {
+    "valueRenderOption": "UNFORMATTED_VALUE",
+    "dateTimeRenderOption": "SERIAL_NUMBER",
+}
+
+
+class SheetsClient:
+    """Reads the values of a spreadsheet's ranges with the Google Sheets API
+
+    Each conversion makes its own client, so conversions can run in parallel threads, as the API's HTTP connections
+    can't be shared between threads. service is the Sheets API's spreadsheets() resource, or anything that works like
+    it, e.g. a fake of it in tests. If not given, it is built for the API key."""
+
+    def __init__(self, spreadsheet_id: str, key: Optional[str] = None, service=None):
+        if service is None:
+            # only needed to fetch from Google, so not a dependency of VocExcel
+            from googleapiclient.discovery import build
+
+            service = build("sheets", "v4", developerKey=key).spreadsheets()
+        self.spreadsheet_id = spreadsheet_id
+        self.service = service
+
+    def get(self, *ranges: str, **options) -> list[dict]:
+        """Returns the value range of each of the ranges, fetched in a single batchGet request with any other options,
+        e.g. valueRenderOption"""
+        response = (
+            self.service.values()
+            .batchGet(spreadsheetId=self.spreadsheet_id, ranges=list(ranges), **options)
+            .execute()
+        )
+        return response.get("valueRanges", [])
 
 
 def get_spreadsheetid_from_URI(uri: str) -> str:
@@ -106,25 +154,39 @@ def using_prefix_non_list_output(cell_value, prefix: dict):
     return c
 
 
-def get_template_version_gsheets(spreadsheet_id: str):
-    # Load workbook
+def read_template_version(version_ranges: list[dict]) -> Optional[str]:
+    """Returns the template version in the value ranges of TEMPLATE_VERSION_RANGES, or None if there is none"""
+    for version_range in version_ranges:
+        template_version = read_cell(version_range, 0)
+        if template_version:
+            return template_version
+    return None
+
+
+def get_template_version_gsheets(client: SheetsClient):
     try:
-        intro_sheet = (
-            sheet.values()
-            .get(spreadsheetId=spreadsheet_id, range="Introduction!J11")
-            .execute()
-        )
-        template_value = intro_sheet.get("values")[0][0]
-        return template_value
+        template_value = read_template_version(client.get(*TEMPLATE_VERSION_RANGES))
     except Exception:
+        template_value = None
+    if template_value is None:
         raise Exception(
             "The version of the Google Template you are using is not accepted/can't be determined"
         )
+    return template_value
+
+
+def check_template_version_gsheets(template_version: str):
+    if template_version not in ACCEPTED_TEMPLATE_VERSIONS:
+        raise ValueError(
+            f"Unknown Template Version. Known Template Versions for Google Sheets are "
+            f"{', '.join(ACCEPTED_TEMPLATE_VERSIONS)}, however you supplied {template_version}"
+        )
 
 
 def read_cell(sheet_dict: dict, n: int, i: Optional[int] = 0):
+    # the API leaves out empty trailing rows and cells, and the values of empty ranges
     try:
-        if sheet_dict.get("values")[n]:
+        if sheet_dict.get("values", [])[n]:
             return sheet_dict.get("values")[n][i]
         else:
             return None
@@ -133,7 +195,7 @@ def read_cell(sheet_dict: dict, n: int, i: Optional[int] = 0):
 
 
 def rows_filled_out(c_sheet: dict):
-    variable = len(c_sheet.get("values"))
+    variable = len(c_sheet.get("values", []))
     return variable
 
 
@@ -259,6 +321,75 @@ def extract_collections(collection_sheet: dict, prefix: dict):
     return collections
 
 
+def get_revision_gsheets(spreadsheet_id: str, key: Optional[str] = None, service=None):
+    """Returns the Drive file version of a spreadsheet, which increases whenever it changes
+
+    service is the Drive API's files() resource, or anything that works like it. If not given, it is built for the API
+    key."""
+    if service is None:
+        from googleapiclient.discovery import build
+
+        service = build("drive", "v3", developerKey=key).files()
+    return service.get(fileId=spreadsheet_id, fields="version").execute()["version"]
+
+
+def fetch_values_gsheets(client: SheetsClient) -> list[dict]:
+    """Returns the value ranges of TEMPLATE_VERSION_RANGES followed by those of the template's TEMPLATE_RANGES
+
+    The template version is fetched first, as the ranges differ between templates, then the ranges in one request."""
+    template_version = get_template_version_gsheets(client)
+    check_template_version_gsheets(template_version)
+    options = UNFORMATTED_VALUES if template_version != "0.4.3" else {}
+    return client.get(
+        *TEMPLATE_VERSION_RANGES, *TEMPLATE_RANGES[template_version], **options
+    )
+
+
+def values_workbook(ranges: list[str], value_ranges: list[dict]) -> ValuesWorkbook:
+    """Returns the value ranges of whole sheets, from cell A1, as a workbook of the sheets they were fetched from"""
+    return ValuesWorkbook(
+        ValuesWorksheet(r.rsplit("!", 1)[0], value_range.get("values", []))
+        for r, value_range in zip(ranges, value_ranges)
+    )
+
+
+def vocab_graph_043(value_ranges: list[dict]) -> Graph:
+    """Returns the vocabulary in the value ranges of template 0.4.3's RANGES_043"""
+    (
+        concept_scheme_sheet,
+        concept_sheet,
+        additional_concept_sheet,
+        collection_sheet,
+        prefix_sheet,
+    ) = value_ranges
+    prefix = create_prefix_dict(prefix_sheet)
+    concept_scheme = extract_concept_scheme(concept_scheme_sheet, prefix)
+    concept = extract_concepts(concept_sheet, additional_concept_sheet, prefix)
+    collections = extract_collections(collection_sheet, prefix)
+
+    # Build the total vocab
+    return models.Vocabulary(
+        concept_scheme=concept_scheme, concepts=concept, collections=collections
+    ).to_graph()
+
+
+def vocab_graph_100(value_ranges: list[dict], template_version: str) -> Graph:
+    """Returns the vocabulary in the value ranges of template 1.0.0's TEMPLATE_RANGES, extracted and validated by
+    convert_100 as workbooks are"""
+    wb = values_workbook(TEMPLATE_RANGES[template_version], value_ranges)
+    # the API gives dates as serial numbers, or as text if entered as text, where workbooks give datetimes
+    concept_scheme_sheet = wb["Concept Scheme"]
+    for cell in ["B6", "B7"]:
+        value = concept_scheme_sheet[cell].value
+        if isinstance(value, (int, float)):
+            concept_scheme_sheet[cell] = from_excel(value)
+        elif isinstance(value, str):
+            concept_scheme_sheet[cell] = date_parser(value)
+    return convert_100.excel_to_rdf(
+        wb, template_version=template_version, output_format="graph"
+    )
+
+
 def excel_to_rdf_gsheets(
     uri: str,
     key: str,
@@ -271,87 +402,67 @@ def excel_to_rdf_gsheets(
     message_level=1,
     log_file=None,
     validate=False,
+    service=None,
+    cache: Optional[SheetsCache] = None,
+    revision: Optional[str] = None,
 ):
-    # get spreadsheet id from uri
-    global SPREADSHEET_ID
-    SPREADSHEET_ID = get_spreadsheetid_from_URI(uri)
-
-    global KEY
-    KEY = key
-
-    global client
-    client = build("sheets", "v4", developerKey=KEY)
-
-    global sheet
-    sheet = client.spreadsheets()
-
-    # Template Version Validation
-    template_version = get_template_version_gsheets(SPREADSHEET_ID)
-    if template_version not in ACCEPTED_TEMPLATE_VERSIONS:
-        raise ValueError(
-            f"Unknown Template Version. Known Template Versions for Google Sheets are "
-            f"{', '.join(ACCEPTED_TEMPLATE_VERSIONS)}, however you supplied {template_version}"
-        )
-
-    # Template Version 0.4.3
-    if template_version == "0.4.3":
-        try:
-            concept_scheme_sheet = (
-                sheet.values()
-                .get(spreadsheetId=SPREADSHEET_ID, range="Concept Scheme*!B2:B12")
-                .execute()
-            )
-            concept_sheet = (
-                sheet.values()
-                .get(spreadsheetId=SPREADSHEET_ID, range="Concepts*!A:I")
-                .execute()
-            )
-            additional_concept_sheet = (
-                sheet.values()
-                .get(
-                    spreadsheetId=SPREADSHEET_ID,
-                    range="Additional Concept Features!B:F",
-                )
-                .execute()
-            )
-            collection_sheet = (
-                sheet.values()
-                .get(spreadsheetId=SPREADSHEET_ID, range="Collections!A:E")
-                .execute()
-            )
-            prefix_sheet = (
-                sheet.values()
-                .get(spreadsheetId=SPREADSHEET_ID, range="Prefix Sheet!A:B")
-                .execute()
-            )
-
-            prefix = create_prefix_dict(prefix_sheet)
-            concept_scheme = extract_concept_scheme(concept_scheme_sheet, prefix)
-            concept = extract_concepts(concept_sheet, additional_concept_sheet, prefix)
-            collections = extract_collections(collection_sheet, prefix)
-        except Exception as e:
-            print(e)
-
-    # Build the total vocab
-    vocab_graph = models.Vocabulary(
-        concept_scheme=concept_scheme, concepts=concept, collections=collections
-    ).to_graph()
-
-    # validate with vocpub
-    if validate:
-        validate_with_profile(
-            vocab_graph,
+    client = SheetsClient(get_spreadsheetid_from_URI(uri), key, service)
+
+    # with a revision, e.g. from get_revision_gsheets(), an unchanged spreadsheet isn't fetched again
+    value_ranges = None
+    if cache is not None and revision is not None:
+        value_ranges = cache.get_values(client.spreadsheet_id, revision)
+    if value_ranges is None:
+        value_ranges = fetch_values_gsheets(client)
+        if cache is not None and revision is not None:
+            cache.put_values(client.spreadsheet_id, revision, value_ranges)
+
+    # unchanged values, whatever their revision, give the cached result, without extracting, validating or serialising
+    rdf = None
+    if cache is not None:
+        cache_key = cache.key(
+            value_ranges,
+            output_format=output_format,
+            validate=validate,
             profile=profile,
             error_level=error_level,
-            message_level=message_level,
-            log_file=log_file,
         )
+        rdf = cache.get(cache_key)
+
+    if rdf is not None:
+        vocab_graph = None
+    else:
+        # Template Version Validation
+        n = len(TEMPLATE_VERSION_RANGES)
+        template_version = read_template_version(value_ranges[:n])
+        check_template_version_gsheets(template_version)
+
+        if template_version == "0.4.3":
+            vocab_graph = vocab_graph_043(value_ranges[n:])
+        else:
+            vocab_graph = vocab_graph_100(value_ranges[n:], template_version)
+
+        # validate with vocpub
+        if validate:
+            validate_with_profile(
+                vocab_graph,
+                profile=profile,
+                error_level=error_level,
+                message_level=message_level,
+                log_file=log_file,
+            )
+
+        if cache is not None:
+            rdf = vocab_graph.serialize(format=output_format)
+            cache.put(cache_key, rdf)
 
     # Write out the file
     if output_type == "graph":
+        if vocab_graph is None:
+            vocab_graph = Graph().parse(data=rdf, format=output_format)
         return vocab_graph
     elif output_type == "string":
-        return vocab_graph.serialize(format=output_format)
+        return rdf if rdf is not None else vocab_graph.serialize(format=output_format)
     else:  # output_format == "file":
         if output_file_path is not None:
             dest = output_file_path
@@ -363,9 +474,53 @@ def excel_to_rdf_gsheets(
             else:
                 suffix = ".ttl"
             dest = file_to_convert_path.with_suffix(suffix)
-        vocab_graph.serialize(destination=str(dest), format=output_format)
+        if rdf is not None:
+            Path(dest).write_bytes(rdf.encode())
+        else:
+            vocab_graph.serialize(destination=str(dest), format=output_format)
         return dest
 
 
+def excel_to_rdf_gsheets_many(
+    uris: list[str],
+    key: str,
+    output_type: Literal["string", "graph"] = "graph",
+    max_workers: int = 8,
+    make_service: Optional[Callable] = None,
+    **kwargs,
+) -> dict[str, Graph | str | Exception]:
+    """Converts many Google Sheets spreadsheets at once, each in its own thread with its own client
+
+    Fetching the spreadsheets' values is most of the time taken, so threads convert them in parallel.
+
+    Parameters:
+        uris: Required. The URIs of the spreadsheets
+        key: Required. The Google API key
+        output_type: Optional, default graph. As for excel_to_rdf_gsheets()
+        max_workers: Optional, default 8. The most spreadsheets converted at once
+        make_service: Optional. Called in each thread for the Sheets API resource to use, rather than building one
+        kwargs: Any other excel_to_rdf_gsheets() arguments
+
+    Returns:
+        A dict of each URI to its result, or the exception its conversion raised
+    """
+
+    def convert(uri: str):
+        service = make_service() if make_service is not None else None
+        return excel_to_rdf_gsheets(
+            uri, key, None, output_type=output_type, service=service, **kwargs
+        )
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {uri: executor.submit(convert, uri) for uri in uris}
+        for uri, future in futures.items():
+            try:
+                results[uri] = future.result()
+            except Exception as e:
+                results[uri] = e
+    return results
+
+
 if __name__ == "__main__":
     pass
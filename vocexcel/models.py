@@ -1,6 +1,6 @@
 import datetime
 from itertools import chain
-from typing import List, Union
+from typing import Iterable, List, NamedTuple, Union
 
 from openpyxl import Workbook
 from pydantic import BaseModel, field_validator
@@ -182,55 +182,7 @@ class Concept(BaseModel):
 
     def to_graph(self):
         g = Graph()
-        c = URIRef(self.uri)
-
-        g.add((c, RDF.type, SKOS.Concept))
-        # For dcterms:identifier
-        if "#" in c:
-            identifier = c.split("#")[-1]
-        else:
-            identifier = c.split("/")[-1]
-        g.add((c, DCTERMS.identifier, Literal(identifier, datatype=XSD.token)))
-
-        if not self.pl_language_code:
-            g.add((c, SKOS.prefLabel, Literal(self.pref_label, lang="en")))
-        else:
-            for lang_code in self.pl_language_code:
-                g.add((c, SKOS.prefLabel, Literal(self.pref_label, lang=lang_code)))
-        if self.alt_labels is not None:
-            for alt_label in self.alt_labels:
-                g.add((c, SKOS.altLabel, Literal(alt_label, lang="en")))
-        if not self.def_language_code:
-            g.add((c, SKOS.definition, Literal(self.definition, lang="en")))
-        else:
-            for lang_code in self.def_language_code:
-                g.add((c, SKOS.definition, Literal(self.definition, lang=lang_code)))
-        for child in self.children:
-            g.add((c, SKOS.narrower, URIRef(child)))
-            g.add((URIRef(child), SKOS.broader, c))
-        if self.other_ids is not None:
-            for other_id in self.other_ids:
-                g.add((c, SKOS.notation, Literal(other_id)))
-        if self.home_vocab_uri is not None:
-            g.add((c, RDFS.isDefinedBy, URIRef(self.home_vocab_uri)))
-        if self.provenance is not None:
-            g.add((c, DCTERMS.provenance, Literal(self.provenance, lang="en")))
-        if self.related_match is not None:
-            for related_match in self.related_match:
-                g.add((c, SKOS.relatedMatch, URIRef(related_match)))
-        if self.close_match:
-            for close_match in self.close_match:
-                g.add((c, SKOS.closeMatch, URIRef(close_match)))
-        if self.exact_match is not None:
-            for exact_match in self.exact_match:
-                g.add((c, SKOS.exactMatch, URIRef(exact_match)))
-        if self.narrow_match is not None:
-            for narrow_match in self.narrow_match:
-                g.add((c, SKOS.narrowMatch, URIRef(narrow_match)))
-        if self.broad_match is not None:
-            for broad_match in self.broad_match:
-                g.add((c, SKOS.broadMatch, URIRef(broad_match)))
-
+        add_concept(g, self)
         return g
 
     def to_excel(self, wb: Workbook, row_no_features: int, row_no_concepts: int):
@@ -309,22 +261,7 @@ class Collection(BaseModel):
 
     def to_graph(self):
         g = Graph()
-        c = URIRef(self.uri)
-        g.add((c, RDF.type, SKOS.Collection))
-        # for dcterms:identifier
-        if "#" in c:
-            identifier = c.split("#")[-1]
-        else:
-            identifier = c.split("/")[-1]
-        g.add((c, DCTERMS.identifier, Literal(identifier, datatype=XSD.token)))
-
-        g.add((c, SKOS.prefLabel, Literal(self.pref_label, lang="en")))
-        g.add((c, SKOS.definition, Literal(self.definition, lang="en")))
-        for member in self.members:
-            g.add((c, SKOS.member, URIRef(member)))
-        if self.provenance is not None:
-            g.add((c, DCTERMS.provenance, Literal(self.provenance, lang="en")))
-
+        add_collection(g, self)
         return g
 
     def to_excel(self, wb: Workbook, row_no: int):
@@ -342,23 +279,200 @@ class Vocabulary(BaseModel):
     collections: List[Collection]
 
     def to_graph(self):
-        g = self.concept_scheme.to_graph()
-        cs = URIRef(self.concept_scheme.uri)
-        for concept in self.concepts:
-            g += concept.to_graph()
-            g.add((URIRef(concept.uri), SKOS.inScheme, cs))
-        for collection in self.collections:
-            g += collection.to_graph()
-            g.add((URIRef(collection.uri), DCTERMS.isPartOf, cs))
-            g.add((cs, DCTERMS.hasPart, URIRef(collection.uri)))
-
-        # create as Top Concepts those Concepts that have no skos:narrower properties with them as objects
-        for s in g.subjects(SKOS.inScheme, cs):
-            is_tc = True
-            for _ in g.objects(s, SKOS.broader):
-                is_tc = False
-            if is_tc:
-                g.add((cs, SKOS.hasTopConcept, s))
-                g.add((s, SKOS.topConceptOf, cs))
+        return vocabulary_to_graph(self.concept_scheme, self.concepts, self.collections)
 
-        return g
+
+class ConceptFields(NamedTuple):
+    """The fields of a Concept as read from a row of a workbook, before any validation
+
+    Made into Concept models, these are validated row by row. fields_are_valid() validates many at once instead, for
+    vocabulary_to_graph() to add them to a graph without making models of them."""
+
+    row: int
+    uri: str
+    pref_label: Union[str, List[str]]
+    definition: Union[str, List[str]]
+    alt_labels: List[str] = []
+    pl_language_code: List[str] = []
+    def_language_code: List[str] = []
+    children: List[str] = []
+    other_ids: List[str] = []
+    home_vocab_uri: str | None = None
+    provenance: str | None = None
+    related_match: List[str] = []
+    close_match: List[str] = []
+    exact_match: List[str] = []
+    narrow_match: List[str] = []
+    broad_match: List[str] = []
+
+
+class CollectionFields(NamedTuple):
+    """The fields of a Collection as read from a row of a workbook, before any validation"""
+
+    row: int
+    uri: str
+    pref_label: str
+    definition: str
+    members: List[str]
+    provenance: str | None = None
+
+
+def fields_are_valid(
+    concepts: List[ConceptFields], collections: List[CollectionFields]
+) -> bool:
+    """Returns whether the fields would all make valid Concept and Collection models
+
+    The fields are checked a column at a time, rather than a model at a time, and at least as strictly as the models
+    validate them, so fields that pass can be added to a graph as they are. Fields that fail may still make valid
+    models, and are best made into models to find out which row is invalid and why."""
+
+    def text(column, optional=False) -> bool:
+        return all(isinstance(v, str) or (optional and v is None) for v in column)
+
+    def iris(column) -> bool:
+        return all(
+            isinstance(iri, str) and iri.startswith("http")
+            for values in column
+            for iri in values
+        )
+
+    if concepts:
+        c = ConceptFields(*zip(*concepts))
+        if not (
+            text(c.uri)
+            and text(c.pref_label)
+            and text(c.definition)
+            and text(c.home_vocab_uri, optional=True)
+            and text(c.provenance, optional=True)
+            and all(
+                text(values)
+                for column in (
+                    c.alt_labels,
+                    c.pl_language_code,
+                    c.def_language_code,
+                    c.other_ids,
+                )
+                for values in column
+            )
+            and all(
+                iris(column)
+                for column in (
+                    c.children,
+                    c.related_match,
+                    c.close_match,
+                    c.exact_match,
+                    c.narrow_match,
+                    c.broad_match,
+                )
+            )
+        ):
+            return False
+
+    if collections:
+        c = CollectionFields(*zip(*collections))
+        if not (
+            text(c.uri)
+            and text(c.pref_label)
+            and text(c.definition)
+            and text(c.provenance, optional=True)
+            and iris(c.members)
+        ):
+            return False
+
+    return True
+
+
+def add_concept(g: Graph, concept: Concept | ConceptFields):
+    """Adds the triples of a Concept, or of the ConceptFields of one, to g"""
+    c = URIRef(concept.uri)
+
+    g.add((c, RDF.type, SKOS.Concept))
+    # For dcterms:identifier
+    if "#" in c:
+        identifier = c.split("#")[-1]
+    else:
+        identifier = c.split("/")[-1]
+    g.add((c, DCTERMS.identifier, Literal(identifier, datatype=XSD.token)))
+
+    if not concept.pl_language_code:
+        g.add((c, SKOS.prefLabel, Literal(concept.pref_label, lang="en")))
+    else:
+        for lang_code in concept.pl_language_code:
+            g.add((c, SKOS.prefLabel, Literal(concept.pref_label, lang=lang_code)))
+    if concept.alt_labels is not None:
+        for alt_label in concept.alt_labels:
+            g.add((c, SKOS.altLabel, Literal(alt_label, lang="en")))
+    if not concept.def_language_code:
+        g.add((c, SKOS.definition, Literal(concept.definition, lang="en")))
+    else:
+        for lang_code in concept.def_language_code:
+            g.add((c, SKOS.definition, Literal(concept.definition, lang=lang_code)))
+    for child in concept.children:
+        g.add((c, SKOS.narrower, URIRef(child)))
+        g.add((URIRef(child), SKOS.broader, c))
+    if concept.other_ids is not None:
+        for other_id in concept.other_ids:
+            g.add((c, SKOS.notation, Literal(other_id)))
+    if concept.home_vocab_uri is not None:
+        g.add((c, RDFS.isDefinedBy, URIRef(concept.home_vocab_uri)))
+    if concept.provenance is not None:
+        g.add((c, DCTERMS.provenance, Literal(concept.provenance, lang="en")))
+    if concept.related_match is not None:
+        for related_match in concept.related_match:
+            g.add((c, SKOS.relatedMatch, URIRef(related_match)))
+    if concept.close_match:
+        for close_match in concept.close_match:
+            g.add((c, SKOS.closeMatch, URIRef(close_match)))
+    if concept.exact_match is not None:
+        for exact_match in concept.exact_match:
+            g.add((c, SKOS.exactMatch, URIRef(exact_match)))
+    if concept.narrow_match is not None:
+        for narrow_match in concept.narrow_match:
+            g.add((c, SKOS.narrowMatch, URIRef(narrow_match)))
+    if concept.broad_match is not None:
+        for broad_match in concept.broad_match:
+            g.add((c, SKOS.broadMatch, URIRef(broad_match)))
+
+
+def add_collection(g: Graph, collection: Collection | CollectionFields):
+    """Adds the triples of a Collection, or of the CollectionFields of one, to g"""
+    c = URIRef(collection.uri)
+    g.add((c, RDF.type, SKOS.Collection))
+    # for dcterms:identifier
+    if "#" in c:
+        identifier = c.split("#")[-1]
+    else:
+        identifier = c.split("/")[-1]
+    g.add((c, DCTERMS.identifier, Literal(identifier, datatype=XSD.token)))
+
+    g.add((c, SKOS.prefLabel, Literal(collection.pref_label, lang="en")))
+    g.add((c, SKOS.definition, Literal(collection.definition, lang="en")))
+    for member in collection.members:
+        g.add((c, SKOS.member, URIRef(member)))
+    if collection.provenance is not None:
+        g.add((c, DCTERMS.provenance, Literal(collection.provenance, lang="en")))
+
+
+def vocabulary_to_graph(
+    concept_scheme: ConceptScheme,
+    concepts: Iterable[Concept | ConceptFields],
+    collections: Iterable[Collection | CollectionFields],
+) -> Graph:
+    """Returns the graph of a vocabulary, with the triples of its Concepts and Collections added straight to it"""
+    g = concept_scheme.to_graph()
+    cs = URIRef(concept_scheme.uri)
+    for concept in concepts:
+        add_concept(g, concept)
+        g.add((URIRef(concept.uri), SKOS.inScheme, cs))
+    for collection in collections:
+        add_collection(g, collection)
+        g.add((URIRef(collection.uri), DCTERMS.isPartOf, cs))
+        g.add((cs, DCTERMS.hasPart, URIRef(collection.uri)))
+
+    # create as Top Concepts those Concepts that have no skos:narrower properties with them as objects
+    has_broader = set(g.subjects(SKOS.broader, None))
+    for s in set(g.subjects(SKOS.inScheme, cs)) - has_broader:
+        g.add((cs, SKOS.hasTopConcept, s))
+        g.add((s, SKOS.topConceptOf, cs))
+
+    return g
@@ -0,0 +1,151 @@
+"""Timing and memory use of the phases of conversions
+
+A Profile records each phase of the conversions run while it is active: its wall time, how much it raised the peak
+resident set size (RSS) of the process and how many workbook rows and graph triples it handled. The converters mark
+their phases with phase(), which does nothing when no Profile is active, so conversions that aren't profiled pay
+nothing for it:
+
+    with Profile() as profile:
+        excel_to_rdf(Path("vocab.xlsx"))
+    print(profile.report())
+
+excel_to_rdf() and rdf_to_excel() also take a profile argument that does the same."""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+_active_profile = ContextVar("active_profile", default=None)
+
+
+class Phase(NamedTuple):
+    """A finished phase of a conversion
+
+    peak_rss_delta is how many bytes the phase raised the process's peak RSS by, so is 0 for phases that use no more
+    memory than an earlier one did, and None where the peak RSS can't be read. rows is the number of workbook rows read
+    or written and triples the number of triples in the graph at the end of the phase, or None if the phase has none."""
+
+    name: str
+    seconds: float
+    peak_rss_delta: Optional[int]
+    rows: Optional[int] = None
+    triples: Optional[int] = None
+
+
+def peak_rss() -> Optional[int]:
+    """Returns the peak RSS of this process so far, in bytes, or None if it can't be read"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux gives kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class Profile:
+    """The phases of the conversions run while this is active, in the order they finished
+
+    If given, callback is called as callback(name, None) when a phase starts and as callback(name, phase), with the
+    finished Phase, when it stops."""
+
+    def __init__(
+        self, callback: Optional[Callable[[str, Optional[Phase]], None]] = None
+    ):
+        self.phases: list[Phase] = []
+        self.callback = callback
+        self.rows = 0
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_active_profile.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_profile.reset(self._tokens.pop())
+
+    @contextmanager
+    def phase(self, name: str, graph=None):
+        if self.callback is not None:
+            self.callback(name, None)
+        rows = self.rows
+        rss = peak_rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            phase = Phase(
+                name,
+                seconds,
+                peak_rss() - rss if rss is not None else None,
+                self.rows - rows or None,
+                len(graph) if graph is not None else None,
+            )
+            self.phases.append(phase)
+            if self.callback is not None:
+                self.callback(name, phase)
+
+    @property
+    def seconds(self) -> float:
+        return sum(p.seconds for p in self.phases)
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": [p._asdict() for p in self.phases],
+            "seconds": self.seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Profile":
+        profile = cls()
+        profile.phases = [Phase(**p) for p in d["phases"]]
+        return profile
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def report(self) -> str:
+        """Returns a table of the phases, their share of the total time and their memory, row and triple counts"""
+
+        def count(n: Optional[int]) -> str:
+            return "" if n is None else f"{n:,}"
+
+        total = self.seconds or 1.0
+        lines = [
+            f"{'phase':<40}{'seconds':>10}{'%':>6}{'peak RSS +MB':>14}{'rows':>10}{'triples':>12}"
+        ]
+        for p in self.phases:
+            rss = "" if p.peak_rss_delta is None else f"{p.peak_rss_delta / 2**20:.1f}"
+            lines.append(
+                f"{p.name:<40}{p.seconds:>10.3f}{100 * p.seconds / total:>6.1f}{rss:>14}"
+                f"{count(p.rows):>10}{count(p.triples):>12}"
+            )
+        lines.append(f"{'total':<40}{self.seconds:>10.3f}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def phase(name: str, graph=None):
+    """Records the enclosed code as a phase of the active Profile, if there is one
+
+    If given, the number of triples in graph at the end of the phase is recorded too."""
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+    else:
+        with profile.phase(name, graph):
+            yield
+
+
+def count_rows(n: int):
+    """Adds n workbook rows read or written to the active Profile's current phase, if there is one"""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.rows += n
@@ -0,0 +1,272 @@
+"""Generates synthetic vocabularies, as filled-in 1.0.0 or 1.0.0.GA template workbooks and the RDF they convert to
+
+These are for benchmarking and load testing with vocabularies far bigger than the examples in tests/data. Workbooks
+are copies of the templates in vocexcel/templates with their Concept Scheme, Concepts and Collections sheets filled
+in. The vocabulary is generated from a seed, so the same seed and options always give the same cell values.
+
+Run with:
+
+    python -m vocexcel.synthetic OUTPUT_FILE.xlsx [--concepts N] [--depth D] [--fanout F] [--seed S] [--rdf OUTPUT_FILE.ttl] ...
+
+See python -m vocexcel.synthetic -h for all the options."""
+
+import argparse
+import datetime
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from vocexcel.utils import (
+    CellStyles,
+    XlCell,
+    get_lookup,
+    load_workbook,
+    save_with_streamed_rows,
+)
+
+TEMPLATES_DIR_PATH = Path(__file__).parent / "templates"
+# the languages other than English that Concepts' preferred labels may be in
+LANGUAGES = ["de", "es", "fr", "it", "ja", "pl"]
+SYLLABLES = "ba ce di fo gu ka le mi no pu ra si to vu ze".split()
+CREATED = datetime.datetime(2024, 1, 1)
+
+
+class SyntheticConcept(NamedTuple):
+    iri: str
+    pref_label: str
+    definition: str
+    alt_labels: list[str]
+    broader: Optional[str]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def make_concepts(
+    cs_iri: str,
+    n: int,
+    depth: int = 4,
+    fanout: int = 10,
+    alt_labels: float = 1.0,
+    multilingual: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> list[SyntheticConcept]:
+    """Makes n Concepts in a hierarchy at most depth Concepts deep, in which each Concept has fanout narrower Concepts
+    until there are n
+
+    Concepts are numbered breadth first, so the first level has as few top Concepts as will fit n Concepts in depth
+    levels. Each Concept has alt_labels alternative labels on average and a multilingual fraction of them have their
+    preferred label in a language other than English."""
+    rng = rng if rng is not None else random.Random(0)
+
+    # the number of Concepts one top Concept's hierarchy holds
+    per_top_concept, level = 0, 1
+    for _ in range(max(depth, 1)):
+        per_top_concept += level
+        level *= fanout
+        if per_top_concept >= n:
+            break
+    top_concepts = max(1, -(-n // per_top_concept))
+
+    iris = set()
+    while len(iris) < n:
+        iris.add(f"{cs_iri}/{rng.getrandbits(64):016x}")
+    iris = sorted(iris)
+    rng.shuffle(iris)
+
+    concepts = []
+    for i, iri in enumerate(iris):
+        label = f"{_word(rng).title()} {_word(rng)} {i}"
+        if rng.random() < multilingual:
+            label = f"{label}@{rng.choice(LANGUAGES)}"
+        n_alt_labels = int(alt_labels) + (rng.random() < alt_labels % 1)
+        concepts.append(
+            SyntheticConcept(
+                iri,
+                label,
+                f"The definition of {label.split('@')[0]}, a {_word(rng)} of {_word(rng)}",
+                [f"{_word(rng)} {i}-{j}" for j in range(n_alt_labels)],
+                iris[(i - top_concepts) // fanout] if i >= top_concepts else None,
+            )
+        )
+    return concepts
+
+
+def _concept_rows(concepts: list[SyntheticConcept]) -> Iterator[Dict[str, XlCell]]:
+    for c in concepts:
+        row = {"A": XlCell(c.iri), "B": XlCell(c.pref_label), "C": XlCell(c.definition)}
+        if c.alt_labels:
+            row["D"] = XlCell(",\n".join(c.alt_labels))
+        if c.broader is not None:
+            row["E"] = XlCell(c.broader)
+        yield row
+
+
+def make_workbook(
+    output_file: Path,
+    concepts: int = 1000,
+    depth: int = 4,
+    fanout: int = 10,
+    alt_labels: float = 1.0,
+    multilingual: float = 0.0,
+    collections: int = 0,
+    collection_size: int = 10,
+    ga: bool = False,
+    seed: int = 0,
+) -> Path:
+    """Writes a synthetic vocabulary to a copy of the 1.0.0 template, or the 1.0.0.GA template if ga is set
+
+    Parameters:
+        output_file: Required. The Excel file to write
+        concepts: Optional, default 1000. The number of Concepts
+        depth: Optional, default 4. The greatest depth of the Concept hierarchy. 1 makes all Concepts top Concepts
+        fanout: Optional, default 10. The number of narrower Concepts each Concept has, until all are placed
+        alt_labels: Optional, default 1.0. The average number of alternative labels per Concept
+        multilingual: Optional, default 0.0. The fraction of Concepts with a preferred label not in English
+        collections: Optional, default 0. The number of Collections
+        collection_size: Optional, default 10. The number of Concepts in each Collection, picked at random
+        ga: Optional, default False. Use the 1.0.0.GA template
+        seed: Optional, default 0. The seed for the random choices made generating the vocabulary
+
+    Returns:
+        output_file"""
+    rng = random.Random(seed)
+    template = "VocExcel-template-100-GA.xlsx" if ga else "VocExcel-template-100.xlsx"
+    wb = load_workbook(TEMPLATES_DIR_PATH / template)
+
+    cs = wb["Concept Scheme"]
+    if ga:
+        cs_iri = f"https://pid.geoscience.gov.au/def/voc/ga/synthetic-{seed}"
+        # the GA template gives the creator and publisher, and keywords must be Data Themes
+        keyword = rng.choice(get_lookup(wb["Lookups"], "C", 3))
+        cs["B18"] = (
+            f"https://pid.geoscience.gov.au/dataset/ga/{rng.randrange(10**5, 10**6)}"
+        )
+    else:
+        cs_iri = f"https://example.com/def/synthetic-{seed}"
+        cs["B8"] = "https://example.com/org/synthetic"
+        cs["B9"] = "https://example.com/org/synthetic"
+        keyword = "synthetic"
+    cs["B3"] = cs_iri
+    cs["B4"] = f"Synthetic Vocabulary {seed}"
+    cs["B5"] = (
+        f"A synthetic vocabulary of {concepts} Concepts, generated from seed {seed}"
+    )
+    cs["B6"] = CREATED
+    cs["B7"] = CREATED
+    cs["B11"] = "1.0"
+    cs["B12"] = "Generated by vocexcel.synthetic"
+    cs["B16"] = keyword
+
+    vocab = make_concepts(
+        cs_iri, concepts, depth, fanout, alt_labels, multilingual, rng
+    )
+    iris = [c.iri for c in vocab]
+    collection_rows = []
+    for i in range(collections):
+        members = rng.sample(iris, min(collection_size, len(iris)))
+        collection_rows.append(
+            {
+                "A": XlCell(f"{cs_iri}/collection-{i}"),
+                "B": XlCell(f"Collection {i}"),
+                "C": XlCell(f"{len(members)} randomly chosen Concepts"),
+                "D": XlCell(",\n".join(members)),
+            }
+        )
+
+    save_with_streamed_rows(
+        wb,
+        output_file,
+        {"Concepts": _concept_rows(vocab), "Collections": collection_rows},
+        CellStyles(),
+    )
+    return output_file
+
+
+def make_rdf(excel_file: Path, output_file: Path) -> Path:
+    """Writes the RDF of a synthetic vocabulary workbook, converting and validating it as excel_to_rdf does"""
+    from vocexcel.convert import excel_to_rdf
+
+    excel_to_rdf(excel_file, output_file=output_file)
+    return output_file
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="vocexcel.synthetic",
+        description="Generates a synthetic vocabulary in a 1.0.0 template workbook.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("output_file", type=Path, help="The Excel file to write.")
+    parser.add_argument(
+        "--concepts", type=int, default=1000, help="The number of Concepts."
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=4,
+        help="The greatest depth of the Concept hierarchy.",
+    )
+    parser.add_argument(
+        "--fanout",
+        type=int,
+        default=10,
+        help="The number of narrower Concepts per Concept.",
+    )
+    parser.add_argument(
+        "--alt-labels",
+        type=float,
+        default=1.0,
+        help="The average number of alternative labels per Concept.",
+    )
+    parser.add_argument(
+        "--multilingual",
+        type=float,
+        default=0.0,
+        help="The fraction of Concepts with a preferred label not in English.",
+    )
+    parser.add_argument(
+        "--collections", type=int, default=0, help="The number of Collections."
+    )
+    parser.add_argument(
+        "--collection-size",
+        type=int,
+        default=10,
+        help="The number of Concepts in each Collection.",
+    )
+    parser.add_argument("--ga", action="store_true", help="Use the 1.0.0.GA template.")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="The seed for the random choices made generating the vocabulary.",
+    )
+    parser.add_argument(
+        "--rdf",
+        type=Path,
+        help="Also convert the workbook to RDF, writing it to this file.",
+    )
+    args = parser.parse_args(args)
+
+    make_workbook(
+        args.output_file,
+        concepts=args.concepts,
+        depth=args.depth,
+        fanout=args.fanout,
+        alt_labels=args.alt_labels,
+        multilingual=args.multilingual,
+        collections=args.collections,
+        collection_size=args.collection_size,
+        ga=args.ga,
+        seed=args.seed,
+    )
+    print(f"Wrote {args.output_file}")
+    if args.rdf is not None:
+        make_rdf(args.output_file, args.rdf)
+        print(f"Wrote {args.rdf}")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,22 +1,47 @@
+import datetime
 import json
 import logging
 import re
+import threading
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
 from tempfile import SpooledTemporaryFile
-from typing import Dict, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from typing import Literal as TypeLiteral
+from xml.etree import ElementTree
+from zipfile import ZIP_DEFLATED, ZipFile
 
-import pyshacl
 from colorama import Fore, Style
 from openpyxl import load_workbook as _load_workbook
-from openpyxl.styles import Font
+from openpyxl.cell.cell import Cell
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import column_index_from_string, coordinate_to_tuple
 from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet._writer import WorksheetWriter
 from openpyxl.worksheet.worksheet import Worksheet
-from pyshacl.pytypes import GraphLike
+from openpyxl.writer.excel import ExcelWriter
 from rdflib import BNode, Graph, Literal, Namespace, Node, URIRef
 from rdflib.namespace import DCTERMS, PROV, RDF, SDO, SH, SKOS, XSD
 
 from vocexcel import profiles
+from vocexcel.profiling import count_rows
+
+# pyshacl is slow to import, so is only imported once validation is needed
+if TYPE_CHECKING:
+    from pyshacl.pytypes import GraphLike
+    from pyshacl.shapes_graph import ShapesGraph
 
 EXCEL_FILE_ENDINGS = ["xlsx"]
 RDF_FILE_ENDINGS = {
@@ -29,6 +54,8 @@ RDF_FILE_ENDINGS = {
     ".n3": "n3",
 }
 KNOWN_FILE_ENDINGS = [str(x) for x in RDF_FILE_ENDINGS.keys()] + EXCEL_FILE_ENDINGS
+# how many of a workbook's IRIs Prefixes.make_iri() keeps the results for
+MAKE_IRI_CACHE_SIZE = 8192
 KNOWN_TEMPLATE_VERSIONS = [
     "0.2.1",
     "0.3.0",
@@ -80,6 +107,9 @@ VOCDERMODS = {
 }
 
 
+Row = TypeVar("Row", bound=NamedTuple)
+
+
 class ConversionError(Exception):
     pass
 
@@ -93,7 +123,12 @@ class ShaclValidationError(ConversionError):
 def load_workbook(
     file_path: Path | Workbook,
     error_format: TypeLiteral["python", "cmd", "json"] = "python",
+    read_only: bool = False,
 ) -> Workbook | str | None:
+    """Loads an Excel workbook with cell values, not formulae
+
+    If read_only is set, the workbook's worksheets are streamed from the file as they are iterated over, rather than
+    built in memory up front. The workbook then holds the file open until closed with Workbook.close()"""
     if isinstance(file_path, Workbook):
         return file_path
 
@@ -104,7 +139,7 @@ def load_workbook(
             "Files for conversion to RDF must be Excel files ending .xlsx"
         )
         return return_error(error, error_format)
-    return _load_workbook(filename=file_path, data_only=True)
+    return _load_workbook(filename=file_path, data_only=True, read_only=read_only)
 
 
 def get_template_version(
@@ -128,7 +163,12 @@ def get_template_version(
         except Exception:
             return None
 
-    version = find_version(wb)
+    return _check_template_version(find_version(wb), error_format)
+
+
+def _check_template_version(
+    version, error_format: TypeLiteral["python", "cmd", "json"]
+) -> str:
     if version in KNOWN_TEMPLATE_VERSIONS:
         return version
     elif version is not None:
@@ -143,18 +183,260 @@ def get_template_version(
     return return_error(error, error_format)
 
 
-def split_and_tidy_to_strings(s: str):
-    s = str(s) if s is not None and not isinstance(s, str) else s
-    # TODO: this may not work in list of things that contain commas. Need to consider revising
-    # to allow comma-seperated values where it'll split in commas but not in things enclosed in quotes.
-    if s == "" or s is None:
-        return []
-    else:
-        return [x.strip() for x in re.split(r"[,\n]\s?", s.strip()) if x != ""]
+# the cells holding the template version, per sheet, in the order get_template_version checks them
+TEMPLATE_VERSION_CELLS = {"Introduction": ("E4", "J11"), "program info": ("B2",)}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _sheet_paths(z: ZipFile) -> Dict[str, str]:
+    """Returns the paths within an xlsx zip of its worksheets' XML, by sheet name"""
+    targets = {}
+    for rel in ElementTree.fromstring(z.read("xl/_rels/workbook.xml.rels")):
+        target = rel.get("Target").lstrip("/")
+        targets[rel.get("Id")] = target if target.startswith("xl/") else "xl/" + target
+    paths = {}
+    for el in ElementTree.fromstring(z.read("xl/workbook.xml")).iter():
+        if _local_name(el.tag) == "sheet":
+            rid = next(v for k, v in el.attrib.items() if _local_name(k) == "id")
+            paths[el.get("name")] = targets[rid]
+    return paths
+
+
+def _shared_string(z: ZipFile, index: int) -> str | None:
+    """Returns the index-th shared string, parsing the shared strings table only as far as it"""
+    if "xl/sharedStrings.xml" not in z.namelist():
+        return None
+    i = 0
+    with z.open("xl/sharedStrings.xml") as f:
+        for _, el in ElementTree.iterparse(f):
+            if _local_name(el.tag) != "si":
+                continue
+            if i == index:
+                # rich text strings are split into runs (r), phonetic hints (rPh) are not part of the value
+                runs = [x for x in el if _local_name(x.tag) in ("t", "r")]
+                return "".join(
+                    t.text or ""
+                    for run in runs
+                    for t in run.iter()
+                    if _local_name(t.tag) == "t"
+                )
+            el.clear()
+            i += 1
+    return None
 
 
-def split_and_tidy_to_iris(s: str, prefixes, cs_iri=None):
-    return [make_iri(ss, prefixes, cs_iri) for ss in split_and_tidy_to_strings(s)]
+def _read_cells(z: ZipFile, sheet_path: str, cells: Tuple[str, ...]) -> Dict[str, str]:
+    """Returns the values of the given cells of a worksheet, parsing the sheet's XML only as far as the last of them"""
+    last_row = max(int(re.sub(r"[A-Z]+", "", c)) for c in cells)
+    raw = {}
+    with z.open(sheet_path) as f:
+        for _, el in ElementTree.iterparse(f):
+            tag = _local_name(el.tag)
+            if tag == "c" and el.get("r") in cells:
+                v = next((x for x in el if _local_name(x.tag) in ("v", "is")), None)
+                if v is not None:
+                    if _local_name(v.tag) == "is":
+                        raw[el.get("r")] = "".join(
+                            t.text or "" for t in v.iter() if _local_name(t.tag) == "t"
+                        )
+                    else:
+                        raw[el.get("r")] = (el.get("t"), v.text)
+            elif tag == "row":
+                if int(el.get("r", 0)) >= last_row:
+                    break
+                el.clear()
+
+    values = {}
+    for cell, value in raw.items():
+        if isinstance(value, tuple):
+            cell_type, text = value
+            value = _shared_string(z, int(text)) if cell_type == "s" else text
+        if value:
+            values[cell] = value
+    return values
+
+
+def sniff_template_version(
+    excel_file: Path | BinaryIO,
+    error_format: TypeLiteral["python", "cmd", "json"] = "python",
+) -> str:
+    """Returns the template version of an Excel workbook file without loading the workbook
+
+    Only the cells get_template_version reads are parsed, from the file's zipped XML: the workbook's sheet list, the
+    start of the sheet holding the version and, for a text version, the shared strings table up to it. This takes
+    milliseconds however large the workbook is, so unsupported templates can be rejected before a full parse. File
+    objects are read from their current position and left there."""
+    version = None
+    try:
+        position = excel_file.tell() if hasattr(excel_file, "tell") else None
+        try:
+            with ZipFile(excel_file) as z:
+                sheet_paths = _sheet_paths(z)
+                for sheet, cells in TEMPLATE_VERSION_CELLS.items():
+                    if sheet in sheet_paths:
+                        values = _read_cells(z, sheet_paths[sheet], cells)
+                        version = next((values[c] for c in cells if c in values), None)
+                        if version is not None:
+                            break
+        finally:
+            if position is not None:
+                excel_file.seek(position)
+    except Exception:
+        version = None
+
+    return _check_template_version(version, error_format)
+
+
+def read_rows(
+    sheet: Worksheet, row_type: type[Row], min_row: int = 4, key: str | None = None
+) -> Iterator[tuple[int, Row]]:
+    """Yields (row number, row) pairs for a sheet's rows from min_row until the first row with no value for the key
+    field, by default the row_type's first field. Each row is a row_type tuple with one field per column, from A.
+
+    Sheets are read in bulk with iter_rows(values_only=True), which works the same on full and read-only worksheets,
+    rather than with one coordinate lookup per cell."""
+    k = row_type._fields.index(key) if key is not None else 0
+    make_row = row_type._make
+    n = 0
+    try:
+        for i, values in enumerate(
+            sheet.iter_rows(
+                min_row=min_row, max_col=len(row_type._fields), values_only=True
+            ),
+            start=min_row,
+        ):
+            if values[k] is None:
+                return
+            n += 1
+            yield i, make_row(values)
+    finally:
+        count_rows(n)
+
+
+class ValueCell(NamedTuple):
+    value: object
+
+
+class ValuesWorksheet:
+    """A worksheet-like view of a sheet's rows of values, e.g. a Google Sheets API value range, that read_rows() and
+    the converters' other readers of worksheets read as they do workbook worksheets
+
+    rows are lists of the sheet's values from cell A1, which may leave out empty trailing rows and cells, as the Sheets
+    API does. Empty strings are read as None, as empty cells of workbooks are. Only values can be read, not cells with
+    styles, so iter_rows() must be called with values_only=True."""
+
+    def __init__(self, title: str, rows: list[list]):
+        self.title = title
+        self.rows = [[None if v == "" else v for v in row] for row in rows]
+
+    @property
+    def max_row(self) -> int:
+        return len(self.rows)
+
+    @property
+    def max_column(self) -> int:
+        return max((len(row) for row in self.rows), default=0)
+
+    def __getitem__(self, coordinate: str) -> ValueCell:
+        row, column = coordinate_to_tuple(coordinate)
+        if row > len(self.rows) or column > len(self.rows[row - 1]):
+            return ValueCell(None)
+        return ValueCell(self.rows[row - 1][column - 1])
+
+    def __setitem__(self, coordinate: str, value):
+        row, column = coordinate_to_tuple(coordinate)
+        while len(self.rows) < row:
+            self.rows.append([])
+        values = self.rows[row - 1]
+        values.extend([None] * (column - len(values)))
+        values[column - 1] = value
+
+    def iter_rows(
+        self,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        min_col: int | None = None,
+        max_col: int | None = None,
+        values_only: bool = False,
+    ) -> Iterator[tuple]:
+        if not values_only:
+            raise NotImplementedError("ValuesWorksheet only has values, not cells")
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        width = max_col - min_col + 1
+        for values in self.rows[min_row - 1 : max_row]:
+            values = values[min_col - 1 : max_col]
+            yield tuple(values) + (None,) * (width - len(values))
+        for _ in range(max(min_row, self.max_row + 1), max_row + 1):
+            yield (None,) * width
+
+
+class ValuesWorkbook:
+    """A workbook-like collection of ValuesWorksheets, for the converters that read workbooks to read other sources of
+    values, e.g. Google Sheets spreadsheets"""
+
+    def __init__(self, worksheets: Iterable[ValuesWorksheet]):
+        self.worksheets = list(worksheets)
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [ws.title for ws in self.worksheets]
+
+    def __contains__(self, title: str) -> bool:
+        return title in self.sheetnames
+
+    def __getitem__(self, title: str) -> ValuesWorksheet:
+        for ws in self.worksheets:
+            if ws.title == title:
+                return ws
+        raise KeyError(f"Worksheet {title} does not exist.")
+
+
+# an item of a list of values separated by commas or new lines: either a value in double quotes, which may contain
+# commas and new lines, or the text up to the next comma or new line
+LIST_ITEM = re.compile(r'\s*(?:"([^"]*)"\s*(?=[,\n]|\Z)|([^,\n]*))[,\n]?')
+
+
+def iter_split_and_tidy_to_strings(s: str) -> Iterator[str]:
+    """Yields the values of a cell holding a list of values separated by commas or new lines, e.g. alt labels
+
+    Values are stripped of surrounding whitespace and empty values are skipped. A value in double quotes, e.g.
+    "Smith, J", is yielded without its quotes and may contain commas and new lines."""
+    if s is None or s == "":
+        return
+    if not isinstance(s, str):
+        s = str(s)
+    if '"' not in s:
+        # most cells have no quoted values, so are split without the LIST_ITEM regex
+        values = s.split(",") if "\n" not in s else s.replace("\n", ",").split(",")
+        for value in values:
+            value = value.strip()
+            if value:
+                yield value
+        return
+    for m in LIST_ITEM.finditer(s):
+        quoted, value = m.groups()
+        value = quoted if quoted is not None else value.strip()
+        if value:
+            yield value
+
+
+def split_and_tidy_to_strings(s: str) -> list[str]:
+    return list(iter_split_and_tidy_to_strings(s))
+
+
+def iter_split_and_tidy_to_iris(s: str, prefixes, cs_iri=None) -> Iterator[URIRef]:
+    for ss in iter_split_and_tidy_to_strings(s):
+        yield make_iri(ss, prefixes, cs_iri)
+
+
+def split_and_tidy_to_iris(s: str, prefixes, cs_iri=None) -> list[URIRef]:
+    return list(iter_split_and_tidy_to_iris(s, prefixes, cs_iri))
 
 
 def string_is_http_iri(s: str) -> Tuple[bool, str]:
@@ -191,10 +473,90 @@ def all_strings_in_list_are_iris(l_: []) -> Tuple[bool, str]:
         return True, ""
 
 
+class Prefixes(dict):
+    """A workbook's prefixes, e.g. {"ex:": "http://example.com/"}, indexed for expanding the workbook's IRIs
+
+    For plain dicts of prefixes, expand_namespaces() checks whether an IRI starts with each prefix in turn and
+    make_iri() cleans, expands and checks every IRI it is given. If all the prefixes end in their only colon, as the
+    Prefixes sheets of templates 0.6.0 and later make them, an IRI can only start with the prefix that is its text up
+    to its first colon, so Prefixes looks that up instead. The results of make_iri() are also kept, for the
+    MAKE_IRI_CACHE_SIZE most recently used IRIs, so repeated references to the same IRI, such as a broader Concept or
+    a Collection member, cost a dictionary lookup. Both are reset when the prefixes change."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._changed()
+
+    def _changed(self):
+        self._indexed = None
+        self._iris = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def prefix_of(self, s: str) -> str | None:
+        """Returns the first prefix s starts with, or None"""
+        if self._indexed is None:
+            self._indexed = all(
+                isinstance(p, str) and p.endswith(":") and p.count(":") == 1
+                for p in self
+            )
+        if not self._indexed:
+            return next((p for p in self if s.startswith(p)), None)
+        pre = s[: s.find(":") + 1]
+        return pre if pre and pre in self else None
+
+    def make_iri(self, s: str, namespace=None):
+        if self._iris is None:
+
+            def make(s, namespace):
+                return _make_iri(s, self, namespace)
+
+            self._iris = lru_cache(maxsize=MAKE_IRI_CACHE_SIZE)(make)
+        return self._iris(s, namespace)
+
+
 def expand_namespaces(s: str, prefixes: dict[str, Namespace]) -> Union[URIRef, str]:
-    for pre in prefixes.keys():
-        if s.startswith(pre):
+    if isinstance(prefixes, Prefixes):
+        pre = prefixes.prefix_of(s)
+        if pre is not None:
             return URIRef(s.replace(pre, prefixes[pre]))
+    else:
+        for pre in prefixes.keys():
+            if s.startswith(pre):
+                return URIRef(s.replace(pre, prefixes[pre]))
     if s.startswith("http"):
         return URIRef(s)
     else:
@@ -256,6 +618,12 @@ def make_agent(agent_value, agent_role, prefixes, iri_of_subject) -> Graph:
 
 
 def make_iri(s: str, prefixes: dict[str, Namespace], namespace=None):
+    if isinstance(prefixes, Prefixes):
+        return prefixes.make_iri(s, namespace)
+    return _make_iri(s, prefixes, namespace)
+
+
+def _make_iri(s: str, prefixes: dict[str, Namespace], namespace=None):
     iri = make_clean_str(s)
     iri = expand_namespaces(iri, prefixes)
     iri = (
@@ -275,16 +643,125 @@ def add_top_concepts(g: Graph) -> Graph:
     if cs is None:
         raise ValueError("The input graph declares no SKOS ConceptScheme")
 
-    for c in g.subjects(RDF.type, SKOS.Concept):
-        if not g.value(None, SKOS.narrower, c):
-            g.add((c, SKOS.topConceptOf, cs))
-            g.add((cs, SKOS.hasTopConcept, c))
+    # one pass over the narrower links, rather than a wildcard-subject lookup per Concept
+    narrower = set(g.objects(None, SKOS.narrower))
+    for c in set(g.subjects(RDF.type, SKOS.Concept)) - narrower:
+        g.add((c, SKOS.topConceptOf, cs))
+        g.add((cs, SKOS.hasTopConcept, c))
 
     return g
 
 
+class SubjectIndex(dict):
+    """An index of a graph, built once: each subject maps to a dict of its predicates, each listing its objects
+
+    value(), objects() and predicate_objects() answer like the Graph methods of the same names, for a given subject
+    and in the same order, but without probing the graph's store each time."""
+
+    def __init__(self, g: Graph):
+        super().__init__()
+        for s in set(g.subjects()):
+            predicates = self[s] = {}
+            for p, o in g.predicate_objects(s):
+                predicates.setdefault(p, []).append(o)
+
+    def value(self, subject: Node, predicate: Node) -> Node | None:
+        objects = self.get(subject, {}).get(predicate)
+        return objects[0] if objects else None
+
+    def objects(self, subject: Node, predicate: Node) -> list[Node]:
+        return self.get(subject, {}).get(predicate, [])
+
+    def predicate_objects(self, subject: Node) -> Iterator[tuple[Node, Node]]:
+        for p, objects in self.get(subject, {}).items():
+            for o in objects:
+                yield p, o
+
+
+def hierarchy_index(g: Graph) -> Tuple[Dict[Node, list], Dict[Node, list]]:
+    """Returns two dicts mapping each Concept to its broader and to its narrower Concepts
+
+    Both are built in one pass over the hierarchy statements, with each skos:broader or skos:narrower statement also
+    counted as its inverse, so a hierarchy need only be given in one direction. Stated links are listed first, in the
+    order Graph.objects() gives them."""
+    broaders: Dict[Node, dict] = {}
+    narrowers: Dict[Node, dict] = {}
+    for index, predicate in ((broaders, SKOS.broader), (narrowers, SKOS.narrower)):
+        for s in set(g.subjects(predicate)):
+            index[s] = dict.fromkeys(g.objects(s, predicate))
+    for s, o in g.subject_objects(SKOS.broader):
+        narrowers.setdefault(o, {})[s] = None
+    for s, o in g.subject_objects(SKOS.narrower):
+        broaders.setdefault(o, {})[s] = None
+
+    return (
+        {k: list(v) for k, v in broaders.items()},
+        {k: list(v) for k, v in narrowers.items()},
+    )
+
+
+_SHAPES_GRAPHS: Dict[str, Tuple[int, "ShapesGraph"]] = {}
+_SHAPES_GRAPHS_LOCK = threading.Lock()
+
+
+def get_shapes_graph(profile: str = "vocpub-5.1") -> "ShapesGraph":
+    """Returns the SHACL shapes for a profile, read from vocexcel/{profile}.ttl
+
+    The shapes file is parsed and its shapes harvested once per process, then reused until the file's modification
+    time changes. The cache is shared between threads."""
+    from pyshacl.shapes_graph import ShapesGraph
+
+    shapes_file = Path(__file__).parent / f"{profile}.ttl"
+    mtime = shapes_file.stat().st_mtime_ns
+    with _SHAPES_GRAPHS_LOCK:
+        cached = _SHAPES_GRAPHS.get(profile)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        sg = ShapesGraph(Graph().parse(shapes_file))
+        sg.shapes  # harvest the shapes now, not on first validation
+        _SHAPES_GRAPHS[profile] = (mtime, sg)
+        return sg
+
+
+class VocpubValidator:
+    """Validates data graphs against a profile's SHACL shapes, by default VocPub 5.1
+
+    The shapes are compiled once per process by get_shapes_graph() and shared by all VocpubValidator objects, so each
+    validation only pays for the data graph. Results are pyshacl's (conforms, results graph, results text) triple."""
+
+    def __init__(self, profile: str = "vocpub-5.1"):
+        self.profile = profile
+        get_shapes_graph(profile)
+
+    def validate(
+        self,
+        data_graph: Union["GraphLike", str, bytes],
+        allow_warnings: bool = True,
+    ) -> Tuple[bool, Graph, str]:
+        from pyshacl.errors import ValidationFailure
+        from pyshacl.graph_abstraction import DataGraph
+        from pyshacl.rdfutil import load_from_source
+        from pyshacl.validator import Validator
+
+        if not isinstance(data_graph, Graph):
+            data_graph = load_from_source(data_graph, multigraph=True)
+        shapes = get_shapes_graph(self.profile)
+        validator = Validator(
+            DataGraph.from_rdflib(data_graph),
+            shacl_graph=shapes.graph,
+            options={"allow_warnings": allow_warnings},
+        )
+        # use the already compiled shapes rather than compiling them again
+        validator.shacl_graph = shapes
+        try:
+            return validator.run()
+        except ValidationFailure as e:
+            return False, e, f"Validation Failure - {e.message}"
+
+
 def validate_with_profile(
-    data_graph: Union[GraphLike, str, bytes],
+    data_graph: Union["GraphLike", str, bytes],
     profile="vocpub-46",
     error_level=1,
     message_level=1,
@@ -298,10 +775,8 @@ def validate_with_profile(
     allow_warnings = True if error_level > 1 else False
 
     # validate the RDF file
-    conforms, results_graph, results_text = pyshacl.validate(
-        data_graph,
-        shacl_graph=str(Path(__file__).parent / f"{profile}.ttl"),
-        allow_warnings=allow_warnings,
+    conforms, results_graph, results_text = VocpubValidator(profile).validate(
+        data_graph, allow_warnings=allow_warnings
     )
 
     logging_level = logging.INFO
@@ -397,28 +872,201 @@ def log_msg(result: Dict, log_file: str) -> str:
     return formatted_msg
 
 
+# the characters make_clean_str removes
+CLEAN_STR_TABLE = str.maketrans("", "", "*{}[]()>+!$ %&")
+
+
 def make_clean_str(s: str):
-    chars = "*{}[]()>+!$ %&"
-    for c in chars:
-        s = s.replace(c, "")
+    return s.translate(CLEAN_STR_TABLE)
 
-    return s
 
+EXPORT_STYLES = {
+    "text": {"font": Font(size=14)},
+    "wrapped": {"alignment": Alignment(wrap_text=True)},
+    "wrapped text": {"font": Font(size=14), "alignment": Alignment(wrap_text=True)},
+    "hyperlink": {"style": "Hyperlink"},
+    "hyperlink text": {"style": "Hyperlink", "font": Font(size=14)},
+}
+
+
+class CellStyles:
+    """Applies the EXPORT_STYLES to the cells of one workbook, creating each resulting cell style only once
+
+    Assigning a font, alignment or named style to a cell makes openpyxl look it up in the workbook's style tables. This
+    is done for the first cell given each style from each starting (template) style, and later cells have the result
+    copied onto them, keeping any template borders and fills."""
+
+    def __init__(self):
+        self._styles: Dict[Tuple[str, tuple], object] = {}
+
+    def apply(self, cell: Cell, name: str):
+        key = name, tuple(cell._style or ())
+        style = self._styles.get(key)
+        if style is None:
+            for attribute, value in EXPORT_STYLES[name].items():
+                setattr(cell, attribute, value)
+            self._styles[key] = copy(cell._style)
+        else:
+            cell._style = copy(style)
 
-def xl_hyperlink(cell, s: str | Node):
+
+def apply_style(cell: Cell, name: str, styles: CellStyles | None = None):
+    if styles is not None:
+        styles.apply(cell, name)
+    else:
+        for attribute, value in EXPORT_STYLES[name].items():
+            setattr(cell, attribute, value)
+
+
+def xl_hyperlink(cell, s: str | Node, styles: CellStyles | None = None):
     cell.value = str(s)
     cell.hyperlink = str(s)
-    cell.style = "Hyperlink"
+    apply_style(cell, "hyperlink", styles)
 
 
 def fill_cell_with_list_of_curies(
-    cell_id: str, ws: Worksheet, g: Graph, subj: URIRef, pred: URIRef
+    cell_id: str,
+    ws: Worksheet,
+    g: Graph,
+    subj: URIRef,
+    pred: URIRef,
+    index: SubjectIndex | None = None,
+    styles: CellStyles | None = None,
 ):
-    xs = []
-    for x in g.objects(subject=subj, predicate=pred):
-        xs.append(x)
+    if index is not None:
+        xs = index.objects(subj, pred)
+    else:
+        xs = list(g.objects(subject=subj, predicate=pred))
     ws[cell_id] = ",\n".join([g.namespace_manager.curie(z) for z in xs])
-    ws[cell_id].font = Font(size=14)
+    apply_style(ws[cell_id], "text", styles)
+
+
+class XlCell(NamedTuple):
+    """A value to be written to a cell of an exported workbook, with the name of its EXPORT_STYLES style, if any, and
+    whether it is to be hyperlinked to itself"""
+
+    value: object
+    style: str | None = None
+    hyperlink: bool = False
+
+
+def xl_hyperlink_cell(s: str | Node, style: str = "hyperlink") -> XlCell:
+    return XlCell(str(s), style, True)
+
+
+def write_xl_cell(cell: Cell, x: XlCell, styles: CellStyles):
+    cell.value = x.value
+    if x.hyperlink:
+        cell.hyperlink = x.value
+    if x.style is not None:
+        styles.apply(cell, x.style)
+
+
+def write_xl_rows(
+    ws: Worksheet,
+    rows: Iterable[Dict[str, XlCell]],
+    styles: CellStyles,
+    min_row: int = 4,
+):
+    """Writes rows, each a dict of column letter to XlCell, into a worksheet from min_row on"""
+    r = min_row - 1
+    for r, row in enumerate(rows, start=min_row):
+        for column, x in row.items():
+            write_xl_cell(ws[f"{column}{r}"], x, styles)
+    count_rows(r - min_row + 1)
+
+
+class _StreamedRowsWriter(WorksheetWriter):
+    """Writes a worksheet's own rows above min_row, then the streamed rows over the rest of its (template) rows"""
+
+    def __init__(
+        self,
+        ws: Worksheet,
+        rows: Iterable[Dict[str, XlCell]],
+        styles: CellStyles,
+        min_row: int,
+    ):
+        self.streamed_rows = rows
+        self.styles = styles
+        self.min_row = min_row
+        super().__init__(ws)
+
+    def write_dimensions(self):
+        # the extent of the sheet isn't known until its rows are written, and the dimension element is optional
+        pass
+
+    def rows(self):
+        template_rows = dict(super().rows())
+        r = self.min_row
+        for r in sorted(template_rows):
+            if r >= self.min_row:
+                break
+            yield r, template_rows.pop(r)
+
+        streamed = 0
+        for r, row in enumerate(self.streamed_rows, start=self.min_row):
+            streamed += 1
+            cells = {cell.column: cell for cell in template_rows.pop(r, [])}
+            for column, x in row.items():
+                column = column_index_from_string(column)
+                cell = cells.get(column)
+                if cell is None:
+                    cell = cells[column] = Cell(self.ws, row=r, column=column)
+                write_xl_cell(cell, x, self.styles)
+            yield r, [cells[column] for column in sorted(cells)]
+        count_rows(streamed)
+
+        yield from sorted(template_rows.items())
+
+
+class _StreamedRowsExcelWriter(ExcelWriter):
+    def __init__(
+        self,
+        wb: Workbook,
+        archive: ZipFile,
+        rows: Dict[str, Iterable[Dict[str, XlCell]]],
+        styles: CellStyles,
+        min_row: int,
+    ):
+        super().__init__(wb, archive)
+        self.streamed_rows = rows
+        self.styles = styles
+        self.min_row = min_row
+
+    def write_worksheet(self, ws: Worksheet):
+        if ws.title not in self.streamed_rows:
+            return super().write_worksheet(ws)
+
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        writer = _StreamedRowsWriter(
+            ws, self.streamed_rows[ws.title], self.styles, self.min_row
+        )
+        writer.write()
+        ws._rels = writer._rels
+        self._archive.write(writer.out, ws.path[1:])
+        self.manifest.append(ws)
+        writer.cleanup()
+
+
+def save_with_streamed_rows(
+    wb: Workbook,
+    filename: Path | str,
+    rows: Dict[str, Iterable[Dict[str, XlCell]]],
+    styles: CellStyles,
+    min_row: int = 4,
+):
+    """Saves a workbook, writing the rows given for some of its worksheets, by title, as the file is written
+
+    The rows, each a dict of column letter to XlCell, are written from min_row on as they are generated, over any rows
+    the worksheet already has, so they are never all held in memory. This is like openpyxl's write-only mode, but the
+    worksheets keep their existing (template) cells, styles and settings."""
+    archive = ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True)
+    wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+        tzinfo=None
+    )
+    _StreamedRowsExcelWriter(wb, archive, rows, styles, min_row).save()
 
 
 def return_error(
@@ -474,10 +1122,11 @@ def format_shacl_error(
 
 def get_lookup(sheet: Worksheet, column_letter, starting_row):
     lookup = []
-    i = starting_row
-    while True:
-        v = sheet[f"{column_letter}{i}"].value
+    col = column_index_from_string(column_letter)
+    for (v,) in sheet.iter_rows(
+        min_row=starting_row, min_col=col, max_col=col, values_only=True
+    ):
         if v is None:
-            return lookup
+            break
         lookup.append(v)
-        i += 1
+    return lookup
@@ -0,0 +1,300 @@
+"""An HTTP API for converting Excel workbooks to RDF and RDF files to Excel workbooks
+
+Run it with uvicorn, installing the web dependency group first:
+
+    uvicorn vocexcel.web.app:create_app --factory --host 0.0.0.0 --port 8000
+
+Conversions are CPU-bound, so they run in a pool of worker processes rather than on the event loop, and each worker
+compiles the SHACL shapes and imports the converters when the app starts, not on its first request. Requests beyond
+what the pool can work through are refused with 503 Service Unavailable rather than queued without limit, and requests
+that take too long get 504 Gateway Timeout.
+
+The app is configured by create_app()'s arguments or, when they aren't given, these environment variables:
+
+    VOCEXCEL_WEB_WORKERS: the number of worker processes, default the number of CPUs
+    VOCEXCEL_WEB_MAX_PENDING: the most conversions running or waiting for a worker, default 2 per worker
+    VOCEXCEL_WEB_TIMEOUT: the seconds a request waits for its conversion, default 60
+    VOCEXCEL_WEB_MAX_UPLOAD_BYTES: the largest file accepted, default 50 MB
+    VOCEXCEL_WEB_STATIC_DIR: a directory of static files, e.g. a web UI, to serve at /"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from pathlib import Path
+from tempfile import SpooledTemporaryFile, TemporaryDirectory
+from typing import Optional
+
+from fastapi import FastAPI, Form, UploadFile
+from fastapi.responses import JSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+
+from vocexcel import convert
+from vocexcel.settings import get_version
+from vocexcel.utils import RDF_FILE_ENDINGS, ShaclValidationError, return_error
+
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+# uploads up to this size are held in memory by the workers, larger ones are spooled to disk
+SPOOL_MAX_SIZE = 10 * 1024 * 1024
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _warm_up_worker():
+    convert._warm_up_worker()
+    # import the converters of the current templates before the first request needs them
+    from vocexcel import convert_0812, convert_085, convert_100  # noqa: F401
+
+
+def _error(status_code: int, error: Exception) -> tuple[int, str]:
+    return status_code, return_error(error, "json")
+
+
+def _excel_to_rdf(data: bytes) -> tuple[int, str]:
+    """Converts an Excel workbook's bytes to RDF, in a worker process, returning the status code and response body"""
+    try:
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as f:
+            f.write(data)
+            f.seek(0)
+            return 200, convert.excel_to_rdf(f, read_only=True)
+    # errors are returned rather than raised, as not all of them can be pickled
+    except ShaclValidationError as e:
+        return _error(422, e)
+    except Exception as e:
+        return _error(400, e)
+
+
+def _rdf_to_excel(
+    data: bytes, suffix: str, template_version: str
+) -> tuple[int, bytes | str]:
+    """Converts an RDF file's bytes to an Excel workbook, in a worker process, returning the status code and response
+    body"""
+    try:
+        with TemporaryDirectory() as d:
+            # rdf_to_excel() reads the RDF format from the file ending
+            rdf_file = Path(d) / f"vocab{suffix}"
+            rdf_file.write_bytes(data)
+            excel_file = Path(d) / "vocab.xlsx"
+            convert.rdf_to_excel(
+                rdf_file, excel_file, template_version, write_only=True
+            )
+            return 200, excel_file.read_bytes()
+    except ShaclValidationError as e:
+        return _error(422, e)
+    except Exception as e:
+        return _error(400, e)
+
+
+class ConversionPool:
+    """A pool of worker processes that refuses conversions once max_pending are running or waiting
+
+    A conversion holds its place until its worker finishes it, even if the request for it has timed out, as workers
+    can't be interrupted. So requests are refused, rather than queued behind conversions no one is waiting for."""
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.executor = None
+        self.loop = None
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up_worker,
+        )
+
+    async def warm_up(self):
+        # workers are started as tasks are submitted, so submit one per worker
+        await asyncio.gather(
+            *[
+                asyncio.wrap_future(self.executor.submit(int))
+                for _ in range(self.workers)
+            ]
+        )
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, fn, *args) -> Optional[Future]:
+        """Returns the Future of fn(*args) run by a worker, or None if the pool is full"""
+        if self.pending >= self.max_pending:
+            return None
+        try:
+            future = self.executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # a worker died, e.g. killed for running out of memory, so start a new pool
+            self.shutdown()
+            self.start()
+            future = self.executor.submit(fn, *args)
+        self.pending += 1
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future):
+        # futures are done in the executor's management thread, but pending is only changed on the event loop
+        self.loop.call_soon_threadsafe(self._release)
+
+    def _release(self):
+        self.pending -= 1
+
+
+def _env(name: str, default, cast):
+    value = os.environ.get(name)
+    return cast(value) if value else default
+
+
+def create_app(
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_upload_bytes: Optional[int] = None,
+    static_dir: Optional[Path] = None,
+) -> FastAPI:
+    """Creates the app, starting its pool of worker processes when it starts up
+
+    Parameters:
+        workers: Optional, default VOCEXCEL_WEB_WORKERS or the number of CPUs. The number of worker processes
+        max_pending: Optional, default VOCEXCEL_WEB_MAX_PENDING or twice workers. The most conversions running or
+            waiting for a worker. Requests for more get 503 Service Unavailable
+        timeout: Optional, default VOCEXCEL_WEB_TIMEOUT or 60. The seconds a request waits for its conversion before
+            getting 504 Gateway Timeout
+        max_upload_bytes: Optional, default VOCEXCEL_WEB_MAX_UPLOAD_BYTES or 50 MB. Larger files get 413 Content Too
+            Large
+        static_dir: Optional, default VOCEXCEL_WEB_STATIC_DIR. A directory of static files to serve at /
+
+    Returns:
+        The FastAPI app"""
+    workers = workers or _env("VOCEXCEL_WEB_WORKERS", os.cpu_count() or 1, int)
+    max_pending = max_pending or _env("VOCEXCEL_WEB_MAX_PENDING", 2 * workers, int)
+    timeout = timeout or _env("VOCEXCEL_WEB_TIMEOUT", DEFAULT_TIMEOUT, float)
+    max_upload_bytes = max_upload_bytes or _env(
+        "VOCEXCEL_WEB_MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES, int
+    )
+    static_dir = static_dir or _env("VOCEXCEL_WEB_STATIC_DIR", None, Path)
+
+    pool = ConversionPool(workers, max_pending)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        pool.start()
+        await pool.warm_up()
+        yield
+        pool.shutdown()
+
+    app = FastAPI(title="VocExcel", version=get_version(), lifespan=lifespan)
+    app.state.pool = pool
+
+    async def read_upload(file: UploadFile) -> Optional[bytes]:
+        # Starlette spools the upload to a temporary file, which is read in chunks to stop at max_upload_bytes
+        chunks = []
+        size = 0
+        while chunk := await file.read(1 << 20):
+            size += len(chunk)
+            if size > max_upload_bytes:
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def run(fn, *args) -> tuple[int, bytes | str] | JSONResponse:
+        future = pool.submit(fn, *args)
+        if future is None:
+            return JSONResponse(
+                {
+                    "error": "ServiceUnavailable",
+                    "message": "Too many conversions are running, try again later",
+                },
+                status_code=503,
+                headers={"Retry-After": str(int(timeout))},
+            )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            return JSONResponse(
+                {
+                    "error": "Timeout",
+                    "message": f"The conversion took longer than {timeout} seconds",
+                },
+                status_code=504,
+            )
+        except BrokenProcessPool:
+            return JSONResponse(
+                {
+                    "error": "ServiceUnavailable",
+                    "message": "The conversion's worker process stopped, try again",
+                },
+                status_code=503,
+            )
+
+    def too_large() -> JSONResponse:
+        return JSONResponse(
+            {
+                "error": "ContentTooLarge",
+                "message": f"Files must be at most {max_upload_bytes} bytes",
+            },
+            status_code=413,
+        )
+
+    @app.get("/api/v1/health")
+    async def health():
+        return {
+            "version": get_version(),
+            "workers": pool.workers,
+            "pending": pool.pending,
+            "max_pending": pool.max_pending,
+        }
+
+    @app.post("/api/v1/excel-to-rdf")
+    async def excel_to_rdf(file: UploadFile):
+        """Converts an Excel workbook to RDF, returned in the turtle format"""
+        data = await read_upload(file)
+        if data is None:
+            return too_large()
+
+        result = await run(_excel_to_rdf, data)
+        if isinstance(result, Response):
+            return result
+        status_code, body = result
+        if status_code != 200:
+            return JSONResponse(json.loads(body), status_code=status_code)
+        return Response(body, media_type="text/turtle")
+
+    @app.post("/api/v1/rdf-to-excel")
+    async def rdf_to_excel(file: UploadFile, template_version: str = Form("1.0.0")):
+        """Converts an RDF file, in a format given by its file ending, to an Excel workbook"""
+        suffix = Path(file.filename or "").suffix
+        if suffix not in RDF_FILE_ENDINGS:
+            error = ValueError(
+                f"Files for conversion to Excel must end with one of {', '.join(RDF_FILE_ENDINGS)}"
+            )
+            return JSONResponse(
+                json.loads(return_error(error, "json")), status_code=400
+            )
+
+        data = await read_upload(file)
+        if data is None:
+            return too_large()
+
+        result = await run(_rdf_to_excel, data, suffix, template_version)
+        if isinstance(result, Response):
+            return result
+        status_code, body = result
+        if status_code != 200:
+            return JSONResponse(json.loads(body), status_code=status_code)
+        return Response(
+            body,
+            media_type=XLSX_MEDIA_TYPE,
+            headers={
+                "Content-Disposition": f'attachment; filename="{Path(file.filename).stem}.xlsx"'
+            },
+        )
+
+    if static_dir is not None and static_dir.is_dir():
+        app.mount("/", StaticFiles(directory=static_dir, html=True), name="static")
+
+    return app